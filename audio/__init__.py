@@ -3,6 +3,8 @@ Audio processing layer for Blooper5.
 
 Modules:
 - engine: Main audio engine (multiprocess)
+- note_renderer: Background pre-rendering of Piano Roll notes
+- voice_pool: Structure-of-arrays pool of Piano Roll playback voices
 - mixer: Real-time mixing and routing
 - dsp: DSP utilities (filters, effects, etc.)
 """
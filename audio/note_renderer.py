@@ -0,0 +1,182 @@
+"""
+Background rendering of Piano Roll note audio.
+
+Rendering a note through its synth can take longer than one audio block,
+so notes are rendered here on a worker thread, ahead of the playhead. The
+audio callback only looks up finished buffers and mixes them; on a cache
+miss (e.g. right after a jump) it requests a late render and picks the
+result up on a later block.
+"""
+from collections import deque
+from typing import Callable, Dict, Iterable, Optional, Tuple
+import queue
+import threading
+
+import numpy as np
+
+from core.models import Note
+from plugins.base import ProcessContext
+
+
+# (track_idx, note, source_type, source_params)
+RenderJob = Tuple[int, Note, str, dict]
+
+
+class NoteRenderer:
+    """
+    Renders note audio on a worker thread, ahead of playback.
+
+    The worker owns its own synth instances: synths keep internal state and
+    must not be shared with the audio thread (which still renders live MIDI
+    voices through DAWView's synths).
+
+    Attributes:
+        rendered: (track_idx, note) -> (source_type, source_params, audio).
+            Replaced wholesale by the worker, read by the audio thread.
+        late: Finished late renders as (track_idx, note, audio), consumed by
+            the audio thread with popleft()
+    """
+
+    def __init__(self, plugin_registry, context: ProcessContext,
+                 lookahead: Callable[[], Iterable[RenderJob]],
+                 poll_interval: float = 0.01):
+        """
+        Args:
+            plugin_registry: PluginRegistry used to create the worker's synths
+            context: Process context passed to every synth.process() call
+            lookahead: Returns the jobs for notes about to trigger (called on the worker)
+            poll_interval: Seconds between lookahead passes
+        """
+        self.plugin_registry = plugin_registry
+        self.context = context
+        self.lookahead = lookahead
+        self.poll_interval = poll_interval
+
+        self.rendered: Dict[Tuple[int, Note], Tuple[str, dict, np.ndarray]] = {}
+        self.late: deque = deque()
+
+        # Audio thread -> worker: late render requests (put never blocks)
+        self._inbox: queue.SimpleQueue = queue.SimpleQueue()
+
+        # track_idx -> (source_type, synth instance)
+        self._synths: Dict[int, Tuple[str, object]] = {}
+
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+    def start(self):
+        """Start the worker thread (no-op if already running)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the worker thread and drop all rendered audio."""
+        if self._thread is None:
+            return
+
+        self._running = False
+        self._inbox.put(None)  # Wake the thread
+        self._thread.join(timeout=1.0)
+        self._thread = None
+        self.rendered = {}
+        self.late.clear()
+
+    def get(self, track_idx: int, note: Note, source_type: str,
+            source_params: dict) -> Optional[np.ndarray]:
+        """
+        Get pre-rendered audio for a note (called by the audio thread).
+
+        Returns:
+            Audio buffer, or None if not rendered yet or rendered with other settings
+        """
+        entry = self.rendered.get((track_idx, note))
+        if entry is not None and entry[0] == source_type and entry[1] is source_params:
+            return entry[2]
+        return None
+
+    def request_late(self, track_idx: int, note: Note, source_type: str, source_params: dict):
+        """Ask the worker to render a missed note as soon as possible."""
+        self._inbox.put((track_idx, note, source_type, source_params))
+
+    def _run(self):
+        """Worker: serve late requests first, then render ahead of the playhead."""
+        inbox_get = self._inbox.get
+
+        while self._running:
+            try:
+                job = inbox_get(timeout=self.poll_interval)
+            except queue.Empty:
+                job = None
+
+            if job is not None:
+                audio = self._render(job)
+                if audio is not None:
+                    self.late.append((job[0], job[1], audio))
+                continue  # Drain late requests before lookahead work
+
+            try:
+                self.prefetch()
+            except Exception as e:
+                print(f"[NOTE RENDER] Lookahead failed: {e}")
+
+    def prefetch(self):
+        """
+        Render upcoming notes and drop buffers that fell out of the window.
+
+        Runs on the worker; call it once before start() to have the first
+        notes ready before the audio stream opens.
+        """
+        rendered = self.rendered
+        upcoming = {}
+
+        for job in self.lookahead():
+            if self._thread is not None and (not self._running or not self._inbox.empty()):
+                return  # Stopping, or a late request is waiting
+
+            track_idx, note, source_type, source_params = job
+            key = (track_idx, note)
+            entry = rendered.get(key)
+            if entry is None or entry[0] != source_type or entry[1] is not source_params:
+                audio = self._render(job)
+                if audio is None:
+                    continue
+                entry = (source_type, source_params, audio)
+                rendered[key] = entry
+            upcoming[key] = entry
+
+        # Publish only the current window (single attribute swap)
+        if len(upcoming) != len(rendered):
+            self.rendered = upcoming
+
+    def _render(self, job: RenderJob) -> Optional[np.ndarray]:
+        """Render one note with the worker's synth for its track."""
+        track_idx, note, source_type, source_params = job
+        synth = self._get_synth(track_idx, source_type)
+        if synth is None:
+            return None
+        try:
+            audio = synth.process(None, source_params, note, self.context)
+            # Voice pool buffers are contiguous float32 (one JIT specialization)
+            return np.ascontiguousarray(audio, dtype=np.float32)
+        except Exception as e:
+            print(f"[NOTE RENDER] Failed to render note {note.note} on track {track_idx}: {e}")
+            return None
+
+    def _get_synth(self, track_idx: int, source_type: str):
+        """Get or create the worker's synth instance for a track."""
+        cached = self._synths.get(track_idx)
+        if cached is not None and cached[0] == source_type:
+            return cached[1]
+
+        try:
+            synth = self.plugin_registry.create_instance(source_type)
+        except Exception as e:
+            print(f"[SYNTH ERROR] Failed to create {source_type}: {e}")
+            # Fallback to DUAL_OSC
+            synth = self.plugin_registry.create_instance("DUAL_OSC")
+        self._synths[track_idx] = (source_type, synth)
+        return synth
@@ -0,0 +1,157 @@
+"""
+Structure-of-arrays pool for Piano Roll playback voices.
+
+Voices live in fixed slots of parallel NumPy arrays (position, length,
+track) plus a typed list of audio buffers, instead of one dict per voice.
+Starting a voice takes a free slot; ending one just returns the slot. The
+per-sample mix runs in a JIT-compiled kernel.
+"""
+import numpy as np
+from numba import jit
+from numba.typed import List as TypedList
+
+
+# Placeholder buffer for free slots (typed lists can't hold None)
+_NO_AUDIO = np.zeros(0, dtype=np.float32)
+
+
+@jit(nopython=True, nogil=True, cache=True, fastmath=True)
+def _mix_voices(audio, slots, positions, lengths, tracks,
+                left_gains, right_gains, out_left, out_right, frames):
+    """
+    Mix the next block of each voice into out_left/out_right (JIT-compiled).
+
+    Args:
+        audio: Typed list of float32 voice buffers, indexed by slot
+        slots: Slots to mix
+        positions: Per-slot playback position (advanced by frames)
+        lengths: Per-slot buffer length
+        tracks: Per-slot track index
+        left_gains: Per-track left gain
+        right_gains: Per-track right gain
+        out_left: Left output block (added into)
+        out_right: Right output block (added into)
+        frames: Block length
+    """
+    for slot in slots:
+        buffer = audio[slot]
+        position = positions[slot]
+        count = min(lengths[slot] - position, frames)
+        left_gain = left_gains[tracks[slot]]
+        right_gain = right_gains[tracks[slot]]
+        for i in range(count):
+            sample = buffer[position + i]
+            out_left[i] += sample * left_gain
+            out_right[i] += sample * right_gain
+        positions[slot] = position + frames
+
+
+class VoicePool:
+    """
+    Pool of pre-rendered note voices mixed by the audio callback.
+
+    Attributes:
+        positions: Next sample to play, per slot
+        lengths: Audio buffer length, per slot
+        tracks: Track index, per slot
+        active: Slot in use
+        audio: Typed list of float32 audio buffers, per slot
+    """
+
+    def __init__(self, capacity: int = 64, num_tracks: int = 16):
+        """
+        Args:
+            capacity: Initial number of slots (doubles when exhausted)
+            num_tracks: Number of tracks (length of the gain arrays passed to mix())
+        """
+        self.positions = np.zeros(capacity, dtype=np.int64)
+        self.lengths = np.zeros(capacity, dtype=np.int64)
+        self.tracks = np.zeros(capacity, dtype=np.int64)
+        self.active = np.zeros(capacity, dtype=bool)
+        self.audio = TypedList([_NO_AUDIO] * capacity)
+
+        # Free slots (stack; lowest index popped first)
+        self._free = list(range(capacity - 1, -1, -1))
+
+        # Compile (or load the cached kernel) now rather than in the first audio callback
+        gains = np.zeros(num_tracks, dtype=np.float32)
+        block = np.zeros(1, dtype=np.float32)
+        _mix_voices(self.audio, np.zeros(0, dtype=np.int64), self.positions, self.lengths,
+                    self.tracks, gains, gains, block, block, 1)
+
+    def __len__(self) -> int:
+        """Number of active voices."""
+        return len(self.audio) - len(self._free)
+
+    def add(self, audio: np.ndarray, track_idx: int):
+        """
+        Start a voice.
+
+        Args:
+            audio: Pre-rendered mono float32 note audio
+            track_idx: Track the note belongs to (selects mixer gains)
+        """
+        if not self._free:
+            self._grow()
+
+        slot = self._free.pop()
+        self.positions[slot] = 0
+        self.lengths[slot] = len(audio)
+        self.tracks[slot] = track_idx
+        self.active[slot] = True
+        self.audio[slot] = audio
+
+    def clear(self):
+        """Stop all voices."""
+        self._release(np.flatnonzero(self.active))
+
+    def mix(self, out_stereo: np.ndarray, left_gains: np.ndarray,
+            right_gains: np.ndarray, silenced: np.ndarray):
+        """
+        Mix the next block of every voice into out_stereo and advance them.
+
+        Voices that have finished, or whose track is silenced (muted or not
+        soloed), are released instead of mixed.
+
+        Args:
+            out_stereo: (2, frames) float32 buffer to add into (row 0 = left)
+            left_gains: Per-track float32 left gain (volume * pan law)
+            right_gains: Per-track float32 right gain
+            silenced: Per-track bool, True to drop that track's voices
+        """
+        if len(self._free) == len(self.audio):
+            return
+
+        slots = np.flatnonzero(self.active)
+        keep = (self.positions[slots] < self.lengths[slots]) & ~silenced[self.tracks[slots]]
+        if not keep.all():
+            self._release(slots[~keep])
+            slots = slots[keep]
+
+        if len(slots):
+            _mix_voices(self.audio, slots, self.positions, self.lengths, self.tracks,
+                        left_gains, right_gains, out_stereo[0], out_stereo[1],
+                        out_stereo.shape[1])
+
+    def _release(self, slots: np.ndarray):
+        """Return slots to the free list in one pass (no per-voice list shifting)."""
+        self.active[slots] = False
+        released = slots.tolist()
+        audio = self.audio
+        for slot in released:
+            audio[slot] = _NO_AUDIO
+        self._free.extend(released)
+
+    def _grow(self):
+        """Double the slot capacity."""
+        old = len(self.audio)
+        new = old * 2
+        for name in ('positions', 'lengths', 'tracks', 'active'):
+            array = getattr(self, name)
+            grown = np.zeros(new, dtype=array.dtype)
+            grown[:old] = array
+            setattr(self, name, grown)
+        audio = self.audio
+        for _ in range(new - old):
+            audio.append(_NO_AUDIO)
+        self._free.extend(range(new - 1, old - 1, -1))
@@ -358,6 +358,15 @@ class Note:
         )
 
 
+# Message type -> (parsed-message field, mapping field) holding the matched number
+_MAPPING_NUMBER_FIELDS = {
+    'cc': ('controller', 'cc_number'),
+    'note': ('note', 'note_number'),
+    'mmc': ('mmc_command', 'mmc_command'),
+    'program_change': ('program', 'program_number'),
+}
+
+
 @dataclass(frozen=True)
 class MIDIControlMapping:
     """
@@ -413,6 +422,39 @@ class MIDIControlMapping:
 
         return False
 
+    def dispatch_key(self) -> Tuple:
+        """
+        Hashable key for O(1) mapping lookup.
+
+        Returns:
+            (message_type, channel, number) - channel is None for omni mappings
+        """
+        fields = _MAPPING_NUMBER_FIELDS.get(self.message_type)
+        number = getattr(self, fields[1]) if fields else None
+        return (self.message_type, self.channel, number)
+
+    @staticmethod
+    def message_dispatch_keys(parsed_message: dict) -> Tuple[Tuple, ...]:
+        """
+        Keys under which mappings matching a parsed MIDI message are indexed.
+
+        Equivalent to matches_message() against every mapping: the
+        channel-specific key plus the omni (channel None) key.
+
+        Args:
+            parsed_message: Parsed MIDI event dictionary
+
+        Returns:
+            Tuple of dispatch keys to look up
+        """
+        message_type = parsed_message.get('type')
+        fields = _MAPPING_NUMBER_FIELDS.get(message_type)
+        number = parsed_message.get(fields[0]) if fields else None
+        channel = parsed_message.get('channel')
+        if channel is None:
+            return ((message_type, None, number),)
+        return ((message_type, channel, number), (message_type, None, number))
+
     def to_dict(self) -> Dict[str, Any]:
         """Serialize to dictionary."""
         return {
@@ -0,0 +1,141 @@
+"""
+Deadline-based scheduling for outgoing MIDI sync messages.
+
+Outgoing Start/Stop/SPP messages are queued with an absolute
+time.perf_counter() deadline and sent by a dedicated thread, so they
+leave the MIDI port when the matching audio reaches the DAC instead of
+whenever the producing thread happened to run.
+"""
+from typing import Callable, List, Optional, Tuple
+import heapq
+import itertools
+import queue
+import threading
+import time
+
+
+class MIDIClock:
+    """
+    Sends MIDI output messages at scheduled wall-clock deadlines.
+
+    Producers (GUI thread, audio callback) only push onto a lock-free
+    SimpleQueue; the clock thread owns the deadline heap and is the only
+    thread that calls into the MIDI output port.
+
+    Attributes:
+        midi_handler: MIDIHandler whose output port receives the messages
+    """
+
+    def __init__(self, midi_handler):
+        """
+        Args:
+            midi_handler: MIDIHandler with an opened output port
+        """
+        self.midi_handler = midi_handler
+
+        # Producer -> clock thread inbox (never blocks the producer)
+        self._inbox: queue.SimpleQueue = queue.SimpleQueue()
+
+        # Tie-breaker so events with equal deadlines keep submission order
+        self._seq = itertools.count()
+
+        # Latest deadline ever scheduled (see schedule_after_pending)
+        self._latest_deadline = 0.0
+
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+    def start(self):
+        """Start the clock thread (no-op if already running)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the clock thread, sending any still-pending messages immediately."""
+        if self._thread is None:
+            return
+
+        self._running = False
+        self._inbox.put(None)  # Wake the thread
+        self._thread.join(timeout=1.0)
+        self._thread = None
+
+    def schedule(self, deadline: float, send: Callable, *args):
+        """
+        Schedule a send at an absolute deadline.
+
+        Args:
+            deadline: time.perf_counter() timestamp at which to send
+            send: Callable performing the send (e.g. midi_handler.send_spp)
+            *args: Arguments passed to send
+        """
+        if deadline > self._latest_deadline:
+            self._latest_deadline = deadline
+        self._inbox.put((deadline, next(self._seq), send, args))
+
+    def schedule_in(self, delay: float, send: Callable, *args):
+        """
+        Schedule a send relative to now.
+
+        Args:
+            delay: Seconds from now (values <= 0 send as soon as possible)
+            send: Callable performing the send
+            *args: Arguments passed to send
+        """
+        self.schedule(time.perf_counter() + max(0.0, delay), send, *args)
+
+    def schedule_after_pending(self, send: Callable, *args):
+        """
+        Schedule a send as soon as possible, but not before anything already queued.
+
+        Used for Stop: a Start or SPP scheduled at a future DAC time must not
+        arrive after it (equal deadlines keep submission order).
+
+        Args:
+            send: Callable performing the send
+            *args: Arguments passed to send
+        """
+        self.schedule(max(time.perf_counter(), self._latest_deadline), send, *args)
+
+    def _run(self):
+        """Clock thread: wait for the earliest deadline, then send everything due."""
+        pending: List[Tuple] = []
+        inbox_get = self._inbox.get
+        perf_counter = time.perf_counter
+
+        while self._running:
+            # Sleep until the next deadline or until a new event arrives
+            timeout = max(0.0, pending[0][0] - perf_counter()) if pending else None
+            try:
+                item = inbox_get(timeout=timeout)
+                if item is not None:
+                    heapq.heappush(pending, item)
+            except queue.Empty:
+                pass
+
+            now = perf_counter()
+            while pending and pending[0][0] <= now:
+                self._send(heapq.heappop(pending))
+
+        # Flush: drain the inbox and send remaining events in deadline order
+        while True:
+            try:
+                item = self._inbox.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                heapq.heappush(pending, item)
+        while pending:
+            self._send(heapq.heappop(pending))
+
+    def _send(self, item: Tuple):
+        """Send a single scheduled event."""
+        _, _, send, args = item
+        try:
+            send(*args)
+        except Exception as e:
+            print(f"[MIDI CLOCK] Error sending scheduled message: {e}")
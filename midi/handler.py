@@ -4,6 +4,7 @@ MIDI input/output handling for bidirectional SPP sync.
 Uses python-rtmidi for cross-platform MIDI support.
 """
 from typing import List, Optional
+from collections import deque
 import queue
 import rtmidi
 
@@ -25,13 +26,16 @@ class MIDIHandler:
         self.midi_in: Optional[rtmidi.MidiIn] = None
         self.midi_out: Optional[rtmidi.MidiOut] = None
 
-        # Thread-safe queue for SPP messages (MIDI thread -> audio thread)
-        # Limit size to 10 to prevent memory buildup
-        self.spp_queue: queue.Queue = queue.Queue(maxsize=10)
+        # Single-slot mailbox for SPP positions (MIDI thread -> audio thread).
+        # deque append/pop are atomic under the GIL; maxlen=1 keeps only the latest
+        # position, so the audio thread never takes a lock or handles queue.Empty
+        self.spp_slot: deque = deque(maxlen=1)
 
-        # Thread-safe queue for incoming MIDI note events (MIDI thread -> audio thread)
-        # Larger size for high-throughput note input
-        self.note_event_queue: queue.Queue = queue.Queue(maxsize=1000)
+        # Single-producer/single-consumer ring of incoming MIDI note events
+        # (MIDI thread appends, audio thread pops). deque append/popleft are atomic
+        # under the GIL, so neither side takes a lock. Bounded for high-throughput input;
+        # the producer drops new events when full instead of letting maxlen evict.
+        self.note_events: deque = deque(maxlen=1000)
 
         # Thread-safe queue for transport control events (MIDI thread -> audio thread)
         # For MIDI learn and transport control mapping
@@ -261,11 +265,8 @@ class MIDIHandler:
 
                 print(f"[MIDI IN] SPP: spp={spp_value}, tick={tick_position}")
 
-                # Put in queue for audio thread (non-blocking)
-                try:
-                    self.spp_queue.put_nowait(tick_position)
-                except queue.Full:
-                    print("[MIDI] Warning: SPP queue full, dropping message")
+                # Publish for audio thread (replaces any position not yet consumed)
+                self.spp_slot.append(tick_position)
 
         # Handle channel voice messages (0x80-0xEF)
         elif status >= 0x80 and status <= 0xEF:
@@ -301,11 +302,13 @@ class MIDIHandler:
                     except queue.Full:
                         print("[MIDI] Warning: Control event queue full, dropping message")
 
-                # All note events go to note queue for recording
-                try:
-                    self.note_event_queue.put_nowait(event)
-                except queue.Full:
-                    print("[MIDI] Warning: Note event queue full, dropping message")
+                # All note events go to note ring for recording. When full, drop the
+                # new message: evicting the oldest could lose a pending note_off
+                note_events = self.note_events
+                if len(note_events) == note_events.maxlen:
+                    print("[MIDI] Warning: Note event ring full, dropping message")
+                else:
+                    note_events.append(event)
 
         # Handle MMC messages (SysEx)
         elif status == 0xF0:
@@ -325,23 +328,24 @@ class MIDIHandler:
 
     def get_spp_from_queue(self) -> Optional[int]:
         """
-        Get pending SPP tick position from queue (non-blocking).
+        Get pending SPP tick position (non-blocking, lock-free).
 
-        Called by audio thread to check for incoming SPP messages.
+        Called by audio thread (the only consumer) to check for incoming SPP messages.
 
         Returns:
-            Tick position if SPP message available, None otherwise
+            Latest tick position if SPP message available, None otherwise
         """
-        try:
-            return self.spp_queue.get_nowait()
-        except queue.Empty:
-            return None
+        spp_slot = self.spp_slot
+        if spp_slot:
+            return spp_slot.pop()
+        return None
 
     def get_note_events(self) -> List[dict]:
         """
-        Get all pending note events from queue (non-blocking).
+        Get all pending note events (non-blocking).
 
-        Called by audio thread to process incoming MIDI notes.
+        The audio thread pops note_events directly instead, to avoid
+        building a list every callback.
 
         Returns:
             List of event dictionaries with keys:
@@ -354,12 +358,10 @@ class MIDIHandler:
             - value: CC value (for cc events)
             - timestamp: Delta time in seconds
         """
+        note_events = self.note_events
         events = []
-        while not self.note_event_queue.empty():
-            try:
-                events.append(self.note_event_queue.get_nowait())
-            except queue.Empty:
-                break
+        while note_events:
+            events.append(note_events.popleft())
         return events
 
     def get_control_events(self) -> List[dict]:
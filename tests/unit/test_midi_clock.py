@@ -0,0 +1,78 @@
+"""
+Unit tests for MIDIClock deadline ordering.
+"""
+import time
+
+from midi.clock import MIDIClock
+
+
+def _run(clock: MIDIClock, wait: float = 0.2):
+    """Run the clock thread long enough for everything scheduled to be due."""
+    clock.start()
+    time.sleep(wait)
+    clock.stop()
+
+
+def test_sends_in_deadline_order():
+    """Earlier deadlines go first, even when scheduled later."""
+    sent = []
+    clock = MIDIClock(midi_handler=None)
+    now = time.perf_counter()
+
+    clock.schedule(now + 0.06, sent.append, "late")
+    clock.schedule(now + 0.02, sent.append, "early")
+    clock.schedule(now + 0.04, sent.append, "middle")
+    _run(clock)
+
+    assert sent == ["early", "middle", "late"]
+
+
+def test_equal_deadlines_keep_submission_order():
+    """Events with the same deadline are sent in the order they were scheduled."""
+    sent = []
+    clock = MIDIClock(midi_handler=None)
+    deadline = time.perf_counter() + 0.02
+
+    for name in ("a", "b", "c", "d"):
+        clock.schedule(deadline, sent.append, name)
+    _run(clock)
+
+    assert sent == ["a", "b", "c", "d"]
+
+
+def test_schedule_in_past_sends_immediately():
+    """A non-positive delay is sent on the next pass, before future events."""
+    sent = []
+    clock = MIDIClock(midi_handler=None)
+
+    clock.schedule_in(0.05, sent.append, "later")
+    clock.schedule_in(-1.0, sent.append, "now")
+    _run(clock)
+
+    assert sent == ["now", "later"]
+
+
+def test_schedule_after_pending_follows_queued_events():
+    """A Stop queued with schedule_after_pending never overtakes a pending Start."""
+    sent = []
+    clock = MIDIClock(midi_handler=None)
+
+    clock.schedule_in(0.05, sent.append, "start")
+    clock.schedule_after_pending(sent.append, "stop")
+    _run(clock)
+
+    assert sent == ["start", "stop"]
+
+
+def test_stop_flushes_pending_events():
+    """stop() sends still-pending events right away, in deadline order."""
+    sent = []
+    clock = MIDIClock(midi_handler=None)
+    now = time.perf_counter()
+    clock.start()
+
+    clock.schedule(now + 20.0, sent.append, "second")
+    clock.schedule(now + 10.0, sent.append, "first")
+    clock.stop()
+
+    assert sent == ["first", "second"]
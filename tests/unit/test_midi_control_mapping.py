@@ -0,0 +1,71 @@
+"""
+Unit tests for MIDIControlMapping dispatch keys.
+
+The dispatch index must find exactly the mappings matches_message() accepts.
+"""
+import itertools
+
+from core.models import MIDIControlMapping
+
+
+def _mappings():
+    """Mappings of every type, channel-specific and omni."""
+    mappings = []
+    for channel in (None, 0, 3):
+        for number in (1, 2):
+            mappings.append(MIDIControlMapping("play", "cc", channel=channel, cc_number=number))
+            mappings.append(MIDIControlMapping("stop", "note", channel=channel, note_number=number))
+            mappings.append(MIDIControlMapping("record", "mmc", channel=channel, mmc_command=number))
+            mappings.append(MIDIControlMapping("forward", "program_change", channel=channel,
+                                               program_number=number))
+    return mappings
+
+
+def _messages():
+    """Parsed messages of every type, with and without a channel."""
+    messages = []
+    for channel, number in itertools.product((None, 0, 3, 5), (1, 2, 9)):
+        for message in ({'type': 'cc', 'controller': number, 'value': 127},
+                        {'type': 'note', 'note': number, 'velocity': 100},
+                        {'type': 'mmc', 'mmc_command': number},
+                        {'type': 'program_change', 'program': number},
+                        {'type': 'pitchwheel', 'pitch': number}):
+            if channel is not None:
+                message['channel'] = channel
+            messages.append(message)
+    return messages
+
+
+def test_dispatch_keys_match_matches_message():
+    """Index lookup finds exactly the mappings matches_message() accepts."""
+    mappings = _mappings()
+    index = {}
+    for mapping in mappings:
+        index.setdefault(mapping.dispatch_key(), []).append(mapping)
+
+    for message in _messages():
+        looked_up = [m for key in MIDIControlMapping.message_dispatch_keys(message)
+                     for m in index.get(key, ())]
+        expected = [m for m in mappings if m.matches_message(message)]
+        assert sorted(looked_up, key=mappings.index) == expected, message
+
+
+def test_channel_specific_mapping_ignores_other_channels():
+    """A channel-specific mapping is only reachable from its own channel."""
+    mapping = MIDIControlMapping("play", "cc", channel=3, cc_number=20)
+    key = mapping.dispatch_key()
+
+    assert key in MIDIControlMapping.message_dispatch_keys({'type': 'cc', 'channel': 3, 'controller': 20})
+    assert key not in MIDIControlMapping.message_dispatch_keys({'type': 'cc', 'channel': 4, 'controller': 20})
+    assert key not in MIDIControlMapping.message_dispatch_keys({'type': 'cc', 'controller': 20})
+
+
+def test_omni_mapping_matches_every_channel():
+    """An omni mapping is reachable from any channel, and from channel-less messages."""
+    mapping = MIDIControlMapping("play", "note", note_number=60)
+    key = mapping.dispatch_key()
+
+    for channel in range(16):
+        assert key in MIDIControlMapping.message_dispatch_keys(
+            {'type': 'note', 'channel': channel, 'note': 60})
+    assert key in MIDIControlMapping.message_dispatch_keys({'type': 'note', 'note': 60})
@@ -0,0 +1,95 @@
+"""
+Unit tests for NoteRenderer lookahead publishing and eviction.
+
+prefetch() is driven directly (no worker thread) with a fake plugin registry.
+"""
+import numpy as np
+
+from audio.note_renderer import NoteRenderer
+from core.models import Note
+from plugins.base import ProcessContext
+
+
+class _FakeSynth:
+    """Synth that renders a note as a short constant buffer and counts renders."""
+
+    def __init__(self):
+        self.renders = 0
+
+    def process(self, audio_in, params, note, context):
+        """Render one note."""
+        self.renders += 1
+        return np.full(4, note.note, dtype=np.float64)
+
+
+class _FakeRegistry:
+    """Plugin registry returning one shared fake synth."""
+
+    def __init__(self):
+        self.synth = _FakeSynth()
+
+    def create_instance(self, source_type):
+        """Create (return) the synth."""
+        return self.synth
+
+
+def _renderer(jobs):
+    """NoteRenderer whose lookahead returns the current contents of jobs."""
+    registry = _FakeRegistry()
+    renderer = NoteRenderer(registry, ProcessContext(sample_rate=44100, bpm=120.0, tpqn=480),
+                            lookahead=lambda: list(jobs))
+    return renderer, registry.synth
+
+
+def test_prefetch_publishes_rendered_notes():
+    """Upcoming notes are rendered once and served by get() as float32."""
+    params = {}
+    note = Note(note=60, start=0.0, duration=1.0)
+    renderer, synth = _renderer([(0, note, "DUAL_OSC", params)])
+
+    renderer.prefetch()
+    audio = renderer.get(0, note, "DUAL_OSC", params)
+    assert audio is not None
+    assert audio.dtype == np.float32
+    assert audio.flags['C_CONTIGUOUS']
+    np.testing.assert_array_equal(audio, np.full(4, 60, dtype=np.float32))
+
+    # Still in the window: reused, not rendered again
+    renderer.prefetch()
+    assert synth.renders == 1
+
+
+def test_prefetch_evicts_notes_outside_window():
+    """Notes that leave the lookahead window are dropped on the next pass."""
+    params = {}
+    first = Note(note=60, start=0.0, duration=1.0)
+    second = Note(note=62, start=1.0, duration=1.0)
+    jobs = [(0, first, "DUAL_OSC", params), (0, second, "DUAL_OSC", params)]
+    renderer, synth = _renderer(jobs)
+
+    renderer.prefetch()
+    assert len(renderer.rendered) == 2
+
+    del jobs[0]
+    renderer.prefetch()
+    assert renderer.get(0, first, "DUAL_OSC", params) is None
+    assert renderer.get(0, second, "DUAL_OSC", params) is not None
+    assert synth.renders == 2
+
+
+def test_changed_settings_rerender():
+    """A note rendered with other source settings is not served and is re-rendered."""
+    old_params = {}
+    new_params = {}
+    note = Note(note=60, start=0.0, duration=1.0)
+    jobs = [(0, note, "DUAL_OSC", old_params)]
+    renderer, synth = _renderer(jobs)
+
+    renderer.prefetch()
+    assert renderer.get(0, note, "DUAL_OSC", new_params) is None
+    assert renderer.get(0, note, "SAMPLER", old_params) is None
+
+    jobs[0] = (0, note, "DUAL_OSC", new_params)
+    renderer.prefetch()
+    assert renderer.get(0, note, "DUAL_OSC", new_params) is not None
+    assert synth.renders == 2
@@ -0,0 +1,107 @@
+"""
+Unit tests for Piano Roll edits going through DAWView undo snapshots.
+
+DAWView is built without its UI; only the state the note save/undo path uses is set up.
+"""
+import pytest
+
+import ui.widgets.PianoRoll as piano_roll_module
+from core.models import AppState, Note, Song, Track
+from ui.views.DAWView import DAWView
+from ui.widgets.PianoRoll import GRID_HEIGHT, PianoRoll
+
+
+NOTE = Note(note=60, start=0.0, duration=1.0)
+
+
+def _pos(roll, pitch, tick):
+    """Canvas (x, y) at the middle of a pitch row for a tick."""
+    x = (tick - roll.scroll_x) * roll.zoom_x
+    y = (127 - pitch + 0.5) * GRID_HEIGHT * roll.zoom_y - roll.scroll_y
+    return x, y
+
+
+@pytest.fixture
+def daw(monkeypatch):
+    """Headless DAWView with one track holding NOTE, loaded into a Piano Roll."""
+    app_state = AppState()
+    song = Song(name="test", bpm=120.0, time_signature=(4, 4), tpqn=480,
+                tracks=(Track(name="Track 1", notes=(NOTE,)),))
+    app_state.set_current_song(song)
+
+    view = DAWView.__new__(DAWView)
+    view.app_state = app_state
+    view.undo_stack = []
+    view.redo_stack = []
+    view.max_undo_history = 50
+    view.current_track = 0
+    view.current_song_id = None
+    view._last_saved_epoch = -1
+
+    roll = PianoRoll(on_notes_changed=view._on_piano_roll_notes_changed)
+    roll.draw = lambda: None
+    view.piano_roll = roll
+
+    def reload_track(track_index):
+        song = view.app_state.get_current_song()
+        roll.load_track_notes(track_index=track_index, notes=list(song.tracks[track_index].notes))
+        view._last_saved_epoch = roll._edit_epoch
+        view.current_song_id = id(song)
+
+    view._on_track_selected = reload_track
+    reload_track(0)
+
+    # Mouse position is read from DearPyGui; feed it from the test instead
+    mouse = [(0.0, 0.0)]
+    monkeypatch.setattr(piano_roll_module.dpg, "get_mouse_pos", lambda local=False: mouse[0])
+    monkeypatch.setattr(piano_roll_module.dpg, "get_item_rect_min", lambda item: (0.0, 0.0))
+    view.mouse = mouse
+    return view
+
+
+def _track_notes(view):
+    return view.app_state.get_current_song().tracks[0].notes
+
+
+def test_erase_then_undo_restores_note(daw):
+    """An erase after an earlier save is undone in one step."""
+    roll = daw.piano_roll
+    daw._save_current_track_notes()
+
+    daw.mouse[0] = _pos(roll, 60, 240)
+    roll._handle_erase_click(None, None)
+    roll._finish_erasing_drag()
+    assert _track_notes(daw) == ()
+
+    daw.undo()
+    assert _track_notes(daw) == (NOTE,)
+    assert roll.notes == [NOTE]
+
+
+def test_drag_move_then_undo_restores_position(daw):
+    """A drag-move is saved on release and undone in one step."""
+    roll = daw.piano_roll
+    daw._save_current_track_notes()
+
+    daw.mouse[0] = _pos(roll, 60, 240)
+    roll._handle_drag_start(None, None)
+    daw.mouse[0] = _pos(roll, 62, 960)
+    roll._handle_drag(None, None)
+    roll._handle_drag_end(None, None)
+
+    moved = _track_notes(daw)[0]
+    assert (moved.note, moved.start) == (62, 2.0)
+
+    daw.undo()
+    assert [(n.note, n.start) for n in _track_notes(daw)] == [(60, 0.0)]
+
+
+def test_drag_released_in_place_takes_no_snapshot(daw):
+    """A drag that ends where it started records no undo step."""
+    roll = daw.piano_roll
+
+    daw.mouse[0] = _pos(roll, 60, 240)
+    roll._handle_drag_start(None, None)
+    roll._handle_drag_end(None, None)
+
+    assert daw.undo_stack == []
@@ -0,0 +1,94 @@
+"""
+Unit tests for the VoicePool structure-of-arrays voice mixer.
+"""
+import numpy as np
+
+from audio.voice_pool import VoicePool
+
+
+def _gains(left, right):
+    """Per-track float32 gain arrays."""
+    return np.array(left, dtype=np.float32), np.array(right, dtype=np.float32)
+
+
+def test_add_and_mix_advances_voice():
+    """A voice is mixed with its track gains and continues on the next block."""
+    pool = VoicePool(capacity=2, num_tracks=2)
+    pool.add(np.arange(1, 6, dtype=np.float32), track_idx=1)
+    left, right = _gains([0.0, 0.5], [0.0, 2.0])
+    silenced = np.zeros(2, dtype=bool)
+
+    out = np.zeros((2, 3), dtype=np.float32)
+    pool.mix(out, left, right, silenced)
+    np.testing.assert_allclose(out[0], [0.5, 1.0, 1.5])
+    np.testing.assert_allclose(out[1], [2.0, 4.0, 6.0])
+
+    # Remaining two samples, then silence for the rest of the block
+    out = np.zeros((2, 3), dtype=np.float32)
+    pool.mix(out, left, right, silenced)
+    np.testing.assert_allclose(out[0], [2.0, 2.5, 0.0])
+    assert len(pool) == 1
+
+
+def test_finished_voice_is_released():
+    """A voice past its end is released on the next mix and its slot reused."""
+    pool = VoicePool(capacity=1, num_tracks=1)
+    pool.add(np.ones(2, dtype=np.float32), track_idx=0)
+    left, right = _gains([1.0], [1.0])
+    silenced = np.zeros(1, dtype=bool)
+
+    pool.mix(np.zeros((2, 4), dtype=np.float32), left, right, silenced)
+    pool.mix(np.zeros((2, 4), dtype=np.float32), left, right, silenced)
+    assert len(pool) == 0
+    assert not pool.active.any()
+
+    pool.add(np.ones(2, dtype=np.float32), track_idx=0)
+    assert len(pool) == 1
+    assert len(pool.audio) == 1  # Slot reused, no growth
+
+
+def test_grow_keeps_existing_voices():
+    """Adding past capacity doubles the pool without disturbing active voices."""
+    pool = VoicePool(capacity=2, num_tracks=1)
+    for value in (1.0, 2.0, 3.0):
+        pool.add(np.full(4, value, dtype=np.float32), track_idx=0)
+
+    assert len(pool.audio) == 4
+    assert len(pool) == 3
+
+    left, right = _gains([1.0], [1.0])
+    out = np.zeros((2, 2), dtype=np.float32)
+    pool.mix(out, left, right, np.zeros(1, dtype=bool))
+    np.testing.assert_allclose(out[0], [6.0, 6.0])
+
+
+def test_silenced_track_voices_are_dropped():
+    """Voices on a silenced track are released instead of mixed."""
+    pool = VoicePool(capacity=4, num_tracks=2)
+    pool.add(np.ones(8, dtype=np.float32), track_idx=0)
+    pool.add(np.full(8, 10.0, dtype=np.float32), track_idx=1)
+    left, right = _gains([1.0, 1.0], [1.0, 1.0])
+
+    out = np.zeros((2, 2), dtype=np.float32)
+    pool.mix(out, left, right, np.array([False, True]))
+    np.testing.assert_allclose(out[0], [1.0, 1.0])
+    assert len(pool) == 1
+
+    # Unsilencing later does not bring the dropped voice back
+    out = np.zeros((2, 2), dtype=np.float32)
+    pool.mix(out, left, right, np.zeros(2, dtype=bool))
+    np.testing.assert_allclose(out[0], [1.0, 1.0])
+
+
+def test_clear_releases_everything():
+    """clear() stops all voices."""
+    pool = VoicePool(capacity=2, num_tracks=1)
+    pool.add(np.ones(4, dtype=np.float32), track_idx=0)
+    pool.add(np.ones(4, dtype=np.float32), track_idx=0)
+    pool.clear()
+
+    assert len(pool) == 0
+    out = np.zeros((2, 2), dtype=np.float32)
+    left, right = _gains([1.0], [1.0])
+    pool.mix(out, left, right, np.zeros(1, dtype=bool))
+    assert not out.any()
@@ -14,21 +14,64 @@ import sounddevice as sd
 import numpy as np
 import threading
 import time
+import traceback
 import dataclasses
 import math
-import queue
+import heapq
+import itertools
+from collections import deque
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
 from ui.widgets.MixerStrip import MixerStrip
 from ui.widgets.PianoRoll import PianoRoll
 from ui.widgets.NoteDrawToolbar import NoteDrawToolbar
 from plugins.sources.dual_osc import DualOscillator
 from plugins.base import ProcessContext, ParameterType
 from plugins.registry import get_global_registry
-from core.models import Note, AppState
+from core.models import Note, AppState, MIDIControlMapping
+from audio.note_renderer import NoteRenderer
 from audio.scheduler import NoteScheduler
+from audio.voice_pool import VoicePool
 from audio.voice_manager import VoiceManager
+from midi.clock import MIDIClock
 from midi.handler import MIDIHandler
 
 
+@lru_cache(maxsize=8)
+def _ticks_per_measure(tpqn: int, numerator: int, denominator: int) -> float:
+    """Ticks per measure for a global time signature (fallback when no measure_metadata)."""
+    return tpqn * numerator * (4 / denominator)
+
+# Held transport button timing (seconds)
+HELD_BUTTON_TIMEOUT = 0.2  # No messages for this long = button released (controllers without release)
+HELD_BUTTON_HOLD_THRESHOLD = 0.25  # Held this long before continuous actions start
+HELD_BUTTON_REPEAT_INTERVAL = 0.05  # Between jumps once continuous mode starts
+
+# How far ahead of the playhead Piano Roll notes are pre-rendered (seconds)
+NOTE_LOOKAHEAD_SECONDS = 0.5
+
+# Upper bound for the block-to-DAC delay used to schedule outgoing MIDI (seconds),
+# until the open stream reports its own latency
+MAX_DAC_DELAY = 0.1
+
+# Constant-power pan law lookup (pan 0.0 = left .. 1.0 = right), indexed by
+# int(pan * (PAN_LUT_SIZE - 1) + 0.5); plain floats so lookups stay scalar
+PAN_LUT_SIZE = 1024
+_PAN_LUT_LEFT = tuple(math.cos(i / (PAN_LUT_SIZE - 1) * (math.pi / 2)) for i in range(PAN_LUT_SIZE))
+_PAN_LUT_RIGHT = tuple(math.sin(i / (PAN_LUT_SIZE - 1) * (math.pi / 2)) for i in range(PAN_LUT_SIZE))
+
+
+class _HeldButton:
+    """Hold state for a MIDI-mapped transport button (slotted: updated on every CC message)."""
+
+    __slots__ = ('pressed_time', 'last_action_time', 'last_message_time')
+
+    def __init__(self, pressed_time: float):
+        self.pressed_time = pressed_time
+        self.last_action_time = pressed_time
+        self.last_message_time = pressed_time
+
+
 class DAWView:
     """
     Main DAW interface with dockable panels and mixer.
@@ -78,6 +121,10 @@ class DAWView:
         self.audio_stream = None
         self.sample_rate = 44100
 
+        # Process context shared by live MIDI voices; bpm/current_tick are updated in
+        # place on each note-on instead of allocating a new context on the audio thread
+        self._live_context = ProcessContext(sample_rate=self.sample_rate, bpm=120.0, tpqn=480)
+
         # Per-track synth instances (no longer using single global dual_osc)
         self.plugin_registry = get_global_registry()
         self.track_synths = {}  # Cache: track_idx -> {'source_type': str, 'instance': AudioProcessor}
@@ -87,12 +134,24 @@ class DAWView:
 
         # MIDI sync
         self.midi_handler = None  # Initialized when playback starts
+        self.midi_clock = None  # Deadline-scheduled MIDI output (created with the output port)
+
+        # Single-slot mailbox for playhead jumps during playback (GUI -> audio thread).
+        # deque append/pop are atomic under the GIL and maxlen=1 keeps only the latest jump.
+        self._pending_jump = deque(maxlen=1)
+
+        # Signalled by _stop_playback so the playback worker wakes immediately
+        self._playback_stop_event = threading.Event()
 
-        # Thread-safe queue for playhead position jumps during playback
-        self.playhead_jump_queue = queue.Queue(maxsize=10)
+        # Live voice clear requested by Stop; the audio thread owns voice_manager and
+        # performs the clear before it renders again (same atomic-slot pattern as jumps)
+        self._pending_voice_clear = deque(maxlen=1)
+
+        # Set by Stop so update() refreshes the time display on the next frame
+        self._time_display_dirty = False
 
         # Live MIDI input state
-        # Key: (track_idx, note_number), Value: {'velocity': int, 'start_tick': int}
+        # Key: (track_idx << 8) | note_number, Value: {'velocity': int, 'start_tick': int}
         self.active_live_notes = {}
 
         # Voice manager for live MIDI rendering (prevents retriggering)
@@ -103,9 +162,20 @@ class DAWView:
         self.midi_learn_function = None  # Which function we're learning
         self.last_midi_message = None  # For learn mode feedback
 
+        # Mapping dispatch index: dispatch key -> mappings (keyed by mappings tuple identity)
+        self._mapping_index_source = None
+        self._mapping_index = {}
+
         # CC button hold state tracking for continuous actions
-        # Key: (function_name, cc_number), Value: {'pressed_time': float, 'last_action_time': float}
+        # Key: (function_name, cc_number), Value: _HeldButton
         self.held_transport_buttons = {}
+        # Min-heap of (next_deadline, seq, key, state); entries whose state is no longer
+        # the live one in held_transport_buttons are stale and dropped lazily
+        self._held_heap = []
+        self._held_seq = itertools.count()
+
+        # Debug ring buffer for hot transport/MIDI paths (printed in batches from update())
+        self._debug_log = deque(maxlen=1024)
 
         # Mixer state
         self.mixer_visible = True
@@ -117,6 +187,22 @@ class DAWView:
 
         # Project state tracking (prevent cross-project note pollution)
         self.current_song_id = None  # ID of song that Piano Roll notes belong to
+        self._last_saved_epoch = -1  # Piano Roll edit epoch last written back to the song
+
+        # Cached measure start ticks for bisect lookups (keyed by measure_metadata identity)
+        self._measure_starts_source = None
+        self._measure_starts = ()
+
+        # Note trigger index for playback: (song.tracks, tpqn, note start ticks sorted
+        # ascending, matching (note, track_idx) entries). Rebuilt when song.tracks changes
+        # identity; published as one tuple because the audio and render threads share it
+        self._trigger_index = (None, 0, [], [])
+        # Per-track sorted (tick, track_idx, note) lists, keyed by track.notes identity and
+        # tpqn, so an edit to one track only recomputes that track's note ticks
+        self._track_triggers = {}
+
+        # Piano Roll note pre-rendering (worker thread, created per playback session)
+        self.note_renderer = None
 
         # Rainbow colors for 16 tracks + white for master
         self.track_colors = self._generate_rainbow_colors()
@@ -124,6 +210,7 @@ class DAWView:
         # Panel sizes (resizable via draggable splitters)
         self.left_panel_width = 900  # Left panel (Note Controls + Piano Roll)
         self.note_controls_height = 70  # Note Controls toolbar height (compact)
+        self._bar_selection_mode_visible = False  # Last bar toolbar visibility applied to DPG
         self.mixer_height = 360  # Mixer strip height (increased to show all controls including FX buttons)
 
         # Splitter dragging state
@@ -139,6 +226,37 @@ class DAWView:
         self.sound_designer = None
         self.mixer_strips = []  # 17 MixerStrip instances
 
+        # Mute/solo mirrors of the 16 track strips, written only by mixer callbacks.
+        # The audio thread reads _any_solo and _track_silenced (mute, or not soloed
+        # while any solo is active) as whole-object swaps instead of polling strips.
+        self._mute_mask = np.zeros(16, dtype=np.uint8)
+        self._solo_mask = np.zeros(16, dtype=np.uint8)
+        self._any_solo = False
+        self._track_silenced = (False,) * 16
+        self._track_silenced_mask = np.zeros(16, dtype=bool)
+
+        # Tags of static widgets built in create() and never deleted until destroy();
+        # membership here replaces per-callback dpg.does_item_exist() C-API probes
+        self._widget_tags = frozenset()
+
+        # Bar edit action dispatch tables (action string -> handler)
+        self._piano_roll_action_dispatch = {
+            'clear_bar': self._execute_clear_bar_from_piano_roll,
+            'remove_bar': self._execute_remove_bar_from_piano_roll,
+            'copy_bar': self._execute_copy_bar_from_piano_roll,
+            'paste_bar': self._execute_paste_bar_from_piano_roll,
+            'add_bar_before': self._execute_add_bar_before_from_piano_roll,
+            'add_bar_after': self._execute_add_bar_after_from_piano_roll,
+        }
+        self._toolbar_action_dispatch = {
+            'clear_bar': self._execute_clear_bar,
+            'remove_bar': self._execute_remove_bar,
+            'copy_bar': self._execute_copy_bar,
+            'paste_bar': self._execute_paste_bar,
+            'add_bar_before': self._execute_add_bar_before,
+            'add_bar_after': self._execute_add_bar_after,
+        }
+
     def _generate_rainbow_colors(self) -> list:
         """
         Generate 16 rainbow colors + white for master channel.
@@ -256,6 +374,19 @@ class DAWView:
         # Setup keyboard handlers
         self._setup_keyboard_handlers()
 
+        self._widget_tags = frozenset({
+            "daw_bpm_input",
+            "daw_play_button",
+            "daw_loop_toggle",
+            "daw_time_position_display",
+            "daw_mixer_strips_group",
+            "daw_mixer_toggle_button",
+            "synth_type_selector",
+            "synth_params_container",
+            "bar_edit_toolbar_container",
+            *[f"learn_{f}_button" for f in ('play', 'stop', 'record', 'forward', 'backward')],
+        })
+
         return self._window_tag
 
     def _setup_splitter_handlers(self):
@@ -528,7 +659,10 @@ class DAWView:
         """
         # Save current piano roll notes to song first
         self._save_current_track_notes()
+        self._push_undo_snapshot()
 
+    def _push_undo_snapshot(self):
+        """Push the current song onto the undo stack as-is (without saving Piano Roll notes)."""
         song = self.app_state.get_current_song()
         if song is None:
             return
@@ -728,7 +862,6 @@ class DAWView:
 
         except Exception as e:
             print(f"[TEST AUDIO ERROR] {e}")
-            import traceback
             traceback.print_exc()
 
     def _generate_synth_param_ui(self, track_idx: int):
@@ -747,77 +880,94 @@ class DAWView:
             return
 
         # Clear existing params
-        if dpg.does_item_exist("synth_params_container"):
+        if "synth_params_container" in self._widget_tags:
             dpg.delete_item("synth_params_container", children_only=True)
 
+        # Hoist attribute lookups out of the per-parameter loop
+        src_params_get = track.source_params.get
+        does_exist = dpg.does_item_exist
+        del_item = dpg.delete_item
+        add_group = dpg.add_group
+        add_spacer = dpg.add_spacer
+        add_text = dpg.add_text
+        add_slider_f = dpg.add_slider_float
+        add_slider_i = dpg.add_slider_int
+        add_checkbox = dpg.add_checkbox
+        add_combo = dpg.add_combo
+        set_alias = dpg.set_item_alias
+        make_cb = self._create_param_callback
+        PT = ParameterType
+
         # Generate widgets from metadata
         for param in metadata.parameters:
-            tag = f"synth_param_{param.name}"
+            name = param.name
+            tag = f"synth_param_{name}"
 
             # Delete old tag if it exists
-            if dpg.does_item_exist(tag):
-                dpg.delete_item(tag)
+            if does_exist(tag):
+                del_item(tag)
 
             # Create horizontal group for label
-            label_group = dpg.add_group(horizontal=True, parent="synth_params_container")
-            dpg.add_spacer(width=20, parent=label_group)
-            dpg.add_text(f"{param.display_name}:", color=(200, 200, 200, 255), parent=label_group)
+            label_group = add_group(horizontal=True, parent="synth_params_container")
+            add_spacer(width=20, parent=label_group)
+            add_text(f"{param.display_name}:", color=(200, 200, 200, 255), parent=label_group)
 
             # Create horizontal group for widget
-            widget_group = dpg.add_group(horizontal=True, parent="synth_params_container")
-            dpg.add_spacer(width=20, parent=widget_group)
+            widget_group = add_group(horizontal=True, parent="synth_params_container")
+            add_spacer(width=20, parent=widget_group)
 
-            if param.type == ParameterType.FLOAT:
-                default_val = track.source_params.get(param.name, param.default)
-                widget_id = dpg.add_slider_float(
+            param_type = param.type
+            if param_type == PT.FLOAT:
+                default_val = src_params_get(name, param.default)
+                widget_id = add_slider_f(
                     min_value=param.min_val,
                     max_value=param.max_val,
                     default_value=default_val,
-                    callback=self._create_param_callback(track_idx, param.name),
+                    callback=make_cb(track_idx, name),
                     width=200,
                     format="%.3f",
                     parent=widget_group
                 )
-                dpg.set_item_alias(widget_id, tag)
+                set_alias(widget_id, tag)
                 # Add unit if available
                 if hasattr(param, 'unit') and param.unit:
-                    dpg.add_text(param.unit, color=(150, 150, 150, 255), parent=widget_group)
+                    add_text(param.unit, color=(150, 150, 150, 255), parent=widget_group)
 
-            elif param.type == ParameterType.INT:
-                widget_id = dpg.add_slider_int(
+            elif param_type == PT.INT:
+                widget_id = add_slider_i(
                     min_value=int(param.min_val),
                     max_value=int(param.max_val),
-                    default_value=int(track.source_params.get(param.name, param.default)),
-                    callback=self._create_param_callback(track_idx, param.name),
+                    default_value=int(src_params_get(name, param.default)),
+                    callback=make_cb(track_idx, name),
                     width=200,
                     parent=widget_group
                 )
-                dpg.set_item_alias(widget_id, tag)
+                set_alias(widget_id, tag)
                 # Add unit if available
                 if hasattr(param, 'unit') and param.unit:
-                    dpg.add_text(param.unit, color=(150, 150, 150, 255), parent=widget_group)
+                    add_text(param.unit, color=(150, 150, 150, 255), parent=widget_group)
 
-            elif param.type == ParameterType.BOOL:
-                widget_id = dpg.add_checkbox(
-                    default_value=track.source_params.get(param.name, param.default),
-                    callback=self._create_param_callback(track_idx, param.name),
+            elif param_type == PT.BOOL:
+                widget_id = add_checkbox(
+                    default_value=src_params_get(name, param.default),
+                    callback=make_cb(track_idx, name),
                     parent=widget_group
                 )
-                dpg.set_item_alias(widget_id, tag)
+                set_alias(widget_id, tag)
 
-            elif param.type == ParameterType.ENUM:
-                default_val = track.source_params.get(param.name, param.default)
-                widget_id = dpg.add_combo(
+            elif param_type == PT.ENUM:
+                default_val = src_params_get(name, param.default)
+                widget_id = add_combo(
                     items=param.enum_values,
                     default_value=default_val,
-                    callback=self._create_param_callback(track_idx, param.name),
+                    callback=make_cb(track_idx, name),
                     width=200,
                     parent=widget_group
                 )
-                dpg.set_item_alias(widget_id, tag)
+                set_alias(widget_id, tag)
 
             # Add spacing between parameters
-            dpg.add_spacer(height=10, parent="synth_params_container")
+            add_spacer(height=10, parent="synth_params_container")
 
         print(f"[SYNTH UI] Generated {len(metadata.parameters)} parameters for {track.source_type}")
 
@@ -859,7 +1009,7 @@ class DAWView:
     def _refresh_sound_designer_ui(self, track_idx: int, track):
         """Refresh Sound Designer UI for selected track."""
         # Update synth type selector
-        if dpg.does_item_exist("synth_type_selector"):
+        if "synth_type_selector" in self._widget_tags:
             source_ids = list(self.plugin_registry.SOURCE_PLUGINS.keys())
             dpg.configure_item("synth_type_selector", items=source_ids)
             dpg.set_value("synth_type_selector", track.source_type)
@@ -892,13 +1042,9 @@ class DAWView:
             return
 
         # Migrate parameters (preserve common ones)
-        new_params = {}
-        for param_spec in new_metadata.parameters:
-            # Use old value if param name exists, else default
-            new_params[param_spec.name] = track.source_params.get(
-                param_spec.name,
-                param_spec.default
-            )
+        # Use old value if param name exists, else default
+        old_params_get = track.source_params.get
+        new_params = {p.name: old_params_get(p.name, p.default) for p in new_metadata.parameters}
 
         # Update track
         new_track = dataclasses.replace(
@@ -951,36 +1097,29 @@ class DAWView:
 
         # Handle bar selection mode toggle - show/hide bar toolbar and expand panel
         bar_selection_mode = toolbar_state.get('bar_selection_mode', False)
-        if dpg.does_item_exist("bar_edit_toolbar_container"):
+        if "bar_edit_toolbar_container" in self._widget_tags:
             # Update bar toolbar's internal state
             if self.bar_edit_toolbar:
                 self.bar_edit_toolbar.enable_selection_mode(bar_selection_mode)
 
-            if bar_selection_mode:
-                dpg.show_item("bar_edit_toolbar_container")
-                # Expand note_controls_panel to fit both toolbars
-                self.note_controls_height = 110  # 70 (note toolbar) + 40 (bar toolbar)
-                dpg.configure_item("note_controls_panel", height=self.note_controls_height)
-            else:
-                dpg.hide_item("bar_edit_toolbar_container")
-                # Shrink back to just note toolbar
-                self.note_controls_height = 70  # Just note toolbar (tighter now)
-                dpg.configure_item("note_controls_panel", height=self.note_controls_height)
+            # Skip show/hide/resize when visibility hasn't actually changed
+            if bar_selection_mode != self._bar_selection_mode_visible:
+                self._bar_selection_mode_visible = bar_selection_mode
+                if bar_selection_mode:
+                    dpg.show_item("bar_edit_toolbar_container")
+                    # Expand note_controls_panel to fit both toolbars
+                    self.note_controls_height = 110  # 70 (note toolbar) + 40 (bar toolbar)
+                    dpg.configure_item("note_controls_panel", height=self.note_controls_height)
+                else:
+                    dpg.hide_item("bar_edit_toolbar_container")
+                    # Shrink back to just note toolbar
+                    self.note_controls_height = 70  # Just note toolbar (tighter now)
+                    dpg.configure_item("note_controls_panel", height=self.note_controls_height)
 
         # Handle bar editing actions
-        action = toolbar_state.get('action')
-        if action == 'clear_bar':
-            self._execute_clear_bar_from_piano_roll()
-        elif action == 'remove_bar':
-            self._execute_remove_bar_from_piano_roll()
-        elif action == 'copy_bar':
-            self._execute_copy_bar_from_piano_roll()
-        elif action == 'paste_bar':
-            self._execute_paste_bar_from_piano_roll()
-        elif action == 'add_bar_before':
-            self._execute_add_bar_before_from_piano_roll()
-        elif action == 'add_bar_after':
-            self._execute_add_bar_after_from_piano_roll()
+        handler = self._piano_roll_action_dispatch.get(toolbar_state.get('action'))
+        if handler:
+            handler()
 
     def _on_bar_selection_changed(self, bar_start: int, bar_end: int):
         """Handle bar selection changes from Piano Roll - update BarEditToolbar."""
@@ -994,19 +1133,9 @@ class DAWView:
             self.piano_roll.update_bar_edit_state(toolbar_state)
 
         # Handle button actions
-        action = toolbar_state.get('action')
-        if action == 'clear_bar':
-            self._execute_clear_bar(toolbar_state)
-        elif action == 'remove_bar':
-            self._execute_remove_bar(toolbar_state)
-        elif action == 'copy_bar':
-            self._execute_copy_bar(toolbar_state)
-        elif action == 'paste_bar':
-            self._execute_paste_bar(toolbar_state)
-        elif action == 'add_bar_before':
-            self._execute_add_bar_before(toolbar_state)
-        elif action == 'add_bar_after':
-            self._execute_add_bar_after(toolbar_state)
+        handler = self._toolbar_action_dispatch.get(toolbar_state.get('action'))
+        if handler:
+            handler(toolbar_state)
 
     # New methods that get bar selection from PianoRoll (for integrated toolbar)
     def _execute_clear_bar_from_piano_roll(self):
@@ -1361,6 +1490,8 @@ class DAWView:
                 track_color=track_color,
                 song=song
             )
+            # Freshly loaded notes match the song: nothing unsaved
+            self._last_saved_epoch = self.piano_roll._edit_epoch
 
     def _create_transport_controls(self):
         """Create play, stop, record, BPM, time position controls."""
@@ -1374,7 +1505,8 @@ class DAWView:
             )
             dpg.add_button(
                 label="Learn",
-                callback=lambda: self._start_midi_learn('play'),
+                callback=self._on_learn_clicked,
+                user_data='play',
                 tag="learn_play_button",
                 width=50, height=20
             )
@@ -1389,7 +1521,8 @@ class DAWView:
             )
             dpg.add_button(
                 label="Learn",
-                callback=lambda: self._start_midi_learn('stop'),
+                callback=self._on_learn_clicked,
+                user_data='stop',
                 tag="learn_stop_button",
                 width=50, height=20
             )
@@ -1405,7 +1538,8 @@ class DAWView:
             )
             dpg.add_button(
                 label="Learn",
-                callback=lambda: self._start_midi_learn('record'),
+                callback=self._on_learn_clicked,
+                user_data='record',
                 tag="learn_record_button",
                 width=50, height=20
             )
@@ -1420,7 +1554,8 @@ class DAWView:
             )
             dpg.add_button(
                 label="Learn",
-                callback=lambda: self._start_midi_learn('forward'),
+                callback=self._on_learn_clicked,
+                user_data='forward',
                 tag="learn_forward_button",
                 width=40, height=20
             )
@@ -1435,7 +1570,8 @@ class DAWView:
             )
             dpg.add_button(
                 label="Learn",
-                callback=lambda: self._start_midi_learn('backward'),
+                callback=self._on_learn_clicked,
+                user_data='backward',
                 tag="learn_backward_button",
                 width=40, height=20
             )
@@ -1527,16 +1663,23 @@ class DAWView:
     # Transport Control Callbacks
 
     def _on_piano_roll_notes_changed(self):
-        """Called when notes are modified in Piano Roll - save to app_state and take snapshot."""
-        # Take snapshot for undo/redo
-        self.take_snapshot()
+        """Called when notes are modified in Piano Roll - take snapshot and save to app_state."""
+        # Nothing edited since the last save (pre-edit notification, or a drag
+        # released where it started): the song already matches the Piano Roll
+        if self.piano_roll and self.piano_roll._edit_epoch == self._last_saved_epoch:
+            return
+
+        # The song still holds the notes as of the last save, i.e. the state before
+        # these edits: push it for undo/redo before writing the edits back
+        self._push_undo_snapshot()
 
         # Save notes to app_state so playback can see the changes
         self._save_current_track_notes()
 
     def _save_current_track_notes(self):
         """Save current piano roll notes back to the song."""
-        song = self.app_state.get_current_song()
+        # Direct attribute read: runs on every edit, play and track switch
+        song = self.app_state._current_song
         if not song or not self.piano_roll:
             return
 
@@ -1550,22 +1693,30 @@ class DAWView:
             print(f"[DEBUG] Skipping save: Piano Roll notes belong to different project")
             return
 
-        # Get current notes from piano roll
-        current_notes = tuple(self.piano_roll.notes)
+        # Cheap identity check first: Piano Roll usually holds the very same (frozen)
+        # Note objects that were loaded from the track, so skip the tuple copy
+        old_track = song.tracks[self.current_track]
+        old_notes = old_track.notes
+        pr_notes = self.piano_roll.notes
+        self._last_saved_epoch = self.piano_roll._edit_epoch
+        if len(pr_notes) == len(old_notes) and all(a is b for a, b in zip(pr_notes, old_notes)):
+            return
+
+        # Get current notes from piano roll (only copy if it isn't already a tuple)
+        current_notes = pr_notes if isinstance(pr_notes, tuple) else tuple(pr_notes)
 
         # Check if notes have changed
-        old_track = song.tracks[self.current_track]
-        if current_notes != old_track.notes:
+        if current_notes != old_notes:
             # Mark as dirty if notes changed
             self.app_state._is_dirty = True
 
             # Update the track with new notes
             updated_track = dataclasses.replace(old_track, notes=current_notes)
 
-            # Replace track in song
-            new_tracks = list(song.tracks)
-            new_tracks[self.current_track] = updated_track
-            updated_song = dataclasses.replace(song, tracks=tuple(new_tracks))
+            # Replace track in song (single tuple concatenation, no list round-trip)
+            i = self.current_track
+            new_tracks = song.tracks[:i] + (updated_track,) + song.tracks[i + 1:]
+            updated_song = dataclasses.replace(song, tracks=new_tracks)
 
             # Update app state
             self.app_state.set_current_song(updated_song)
@@ -1596,7 +1747,7 @@ class DAWView:
 
         # Sync the is_looping flag and checkbox with the song state
         self.is_looping = loop_enabled
-        if dpg.does_item_exist("daw_loop_toggle"):
+        if "daw_loop_toggle" in self._widget_tags:
             dpg.set_value("daw_loop_toggle", loop_enabled)
 
     def _on_play(self):
@@ -1610,21 +1761,17 @@ class DAWView:
             # Initialize current_bpm (will be updated by scheduler during playback)
             self.current_bpm = self.bpm
 
-            print(f"[PLAY] Playback started at {self.bpm} BPM")
+            self._dbg(f"[PLAY] Playback started at {self.bpm} BPM")
             dpg.set_item_label("daw_play_button", "Pause")
+            # MIDI Start is scheduled by the audio callback at the first block's DAC time
             self._start_playback()
-
-            # Send MIDI Start message
-            song = self.app_state.get_current_song()
-            if song and song.send_midi_clock and self.midi_handler and self.midi_handler.midi_out:
-                self.midi_handler.send_start()
         else:
-            print("[PAUSE] Playback paused")
+            self._dbg("[PAUSE] Playback paused")
             dpg.set_item_label("daw_play_button", "Play")
 
-            # Send MIDI Stop message
-            if self.midi_handler and self.midi_handler.midi_out:
-                self.midi_handler.send_stop()
+            # Send MIDI Stop message (from the MIDI clock thread, not the GUI thread)
+            if self.midi_clock:
+                self.midi_clock.schedule_after_pending(self.midi_handler.send_stop)
 
             self._stop_playback()
 
@@ -1635,23 +1782,24 @@ class DAWView:
         self.current_time = 0.0
         self.current_tick = 0.0
         self.current_bpm = self.bpm  # Reset to global BPM
-        print("[STOP] Playback stopped")
+        self._dbg("[STOP] Playback stopped")
 
         # Reset BPM display
-        if dpg.does_item_exist("daw_bpm_input"):
+        if "daw_bpm_input" in self._widget_tags:
             dpg.set_value("daw_bpm_input", int(self.bpm))
         dpg.set_item_label("daw_play_button", "Play")
         if was_playing:
-            # Send MIDI Stop message
-            if self.midi_handler and self.midi_handler.midi_out:
-                self.midi_handler.send_stop()
+            # Send MIDI Stop message (from the MIDI clock thread, not the GUI thread)
+            if self.midi_clock:
+                self.midi_clock.schedule_after_pending(self.midi_handler.send_stop)
 
             self._stop_playback()
 
-        # Clear all live MIDI voices
-        self.voice_manager.clear_all()
+        # Clear all live MIDI voices on the audio thread (before it next renders)
+        self._pending_voice_clear.append(True)
 
-        self._update_time_display()
+        # Time display is refreshed by update() on the next frame
+        self._time_display_dirty = True
 
         # Reset playhead to start
         if self.piano_roll:
@@ -1662,33 +1810,38 @@ class DAWView:
         self.is_recording = not self.is_recording
         print(f"[REC] Recording: {'ON' if self.is_recording else 'OFF'}")
 
+    def _get_measure_starts(self, song) -> tuple:
+        """Get start ticks of all measures, cached per measure_metadata tuple."""
+        measure_metadata = song.measure_metadata
+        if measure_metadata is not self._measure_starts_source:
+            # measure_metadata is an immutable tuple, so identity changes on every edit
+            self._measure_starts = tuple(m.start_tick for m in measure_metadata)
+            self._measure_starts_source = measure_metadata
+        return self._measure_starts
+
     def _find_measure_at_tick(self, tick: float, song) -> int:
         """Find which measure index contains the given tick."""
         if not song or not song.measure_metadata:
             # Fallback: use global time signature
-            ticks_per_measure = song.tpqn * song.time_signature[0] * (4 / song.time_signature[1])
+            ticks_per_measure = _ticks_per_measure(song.tpqn, *song.time_signature)
             return int(tick / ticks_per_measure)
 
-        # Use measure_metadata for accurate boundaries
-        for i, measure in enumerate(song.measure_metadata):
-            if measure.start_tick <= tick < measure.start_tick + measure.length_ticks:
-                return i
-
-        # If beyond last measure, return last measure index
-        if song.measure_metadata:
-            return len(song.measure_metadata) - 1
-        return 0
+        # Binary search measure boundaries (beyond last measure clamps to last index)
+        starts = self._get_measure_starts(song)
+        idx = bisect_right(starts, tick) - 1
+        return max(0, min(idx, len(starts) - 1))
 
     def _get_measure_start_tick(self, measure_index: int, song) -> int:
         """Get the start tick of a measure."""
         if not song or not song.measure_metadata:
             # Fallback: use global time signature
-            ticks_per_measure = song.tpqn * song.time_signature[0] * (4 / song.time_signature[1])
+            ticks_per_measure = _ticks_per_measure(song.tpqn, *song.time_signature)
             return measure_index * ticks_per_measure
 
-        # Use measure_metadata
-        if 0 <= measure_index < len(song.measure_metadata):
-            return song.measure_metadata[measure_index].start_tick
+        # Use cached measure start ticks
+        starts = self._get_measure_starts(song)
+        if 0 <= measure_index < len(starts):
+            return starts[measure_index]
 
         return 0
 
@@ -1741,16 +1894,32 @@ class DAWView:
 
         # If playing, also jump the scheduler position
         if self.is_playing:
-            try:
-                self.playhead_jump_queue.put_nowait(new_tick)
-            except queue.Full:
-                print("[TRANSPORT] Warning: Jump queue full, ignoring request")
-
-        print(f"[TRANSPORT] Backward to tick {int(new_tick)}")
+            self._pending_jump.append(new_tick)
+
+        self._dbg(f"[TRANSPORT] Backward to tick {int(new_tick)}")
+
+    def _get_next_measure_tick(self, measure_index: int, song) -> int:
+        """Get the start tick of the measure after measure_index (song end if none)."""
+        length_ticks = song.length_ticks
+        if not song.measure_metadata:
+            # Fallback: calculate using global time signature
+            ticks_per_measure = _ticks_per_measure(song.tpqn, *song.time_signature)
+            total_measures = int((length_ticks + ticks_per_measure - 1) / ticks_per_measure)
+            if measure_index + 1 < total_measures:
+                return (measure_index + 1) * ticks_per_measure
+            return length_ticks  # At end
+
+        # Use cached measure start ticks
+        starts = self._get_measure_starts(song)
+        if measure_index + 1 < len(starts):
+            return starts[measure_index + 1]
+        return length_ticks  # At end
 
     def _on_backward(self, first_press=False):
         """Skip forward to next measure (MPK25 FF/CC116 mapped here).
 
+        Both playing and stopped (tap or hold) advance to the next measure.
+
         Args:
             first_press: True on initial button press, False for continuous hold actions
         """
@@ -1758,47 +1927,14 @@ class DAWView:
         if not song:
             return
 
-        # Find current measure
-        current_measure_index = self._find_measure_at_tick(self.current_tick, song)
-        current_measure_start = self._get_measure_start_tick(current_measure_index, song)
+        length_ticks = song.length_ticks
 
-        if self.is_playing:
-            # During playback: always go to next measure (both tap and hold)
-            if not song.measure_metadata:
-                # Fallback: calculate using global time signature
-                ticks_per_measure = song.tpqn * song.time_signature[0] * (4 / song.time_signature[1])
-                total_measures = int((song.length_ticks + ticks_per_measure - 1) / ticks_per_measure)
-
-                if current_measure_index + 1 < total_measures:
-                    new_tick = self._get_measure_start_tick(current_measure_index + 1, song)
-                else:
-                    new_tick = song.length_ticks  # At end
-            else:
-                # Use measure_metadata
-                if current_measure_index + 1 < len(song.measure_metadata):
-                    new_tick = song.measure_metadata[current_measure_index + 1].start_tick
-                else:
-                    new_tick = song.length_ticks  # At end
-        else:
-            # When stopped: always go to next measure (existing behavior)
-            if not song.measure_metadata:
-                # Fallback: calculate using global time signature
-                ticks_per_measure = song.tpqn * song.time_signature[0] * (4 / song.time_signature[1])
-                total_measures = int((song.length_ticks + ticks_per_measure - 1) / ticks_per_measure)
-
-                if current_measure_index + 1 < total_measures:
-                    new_tick = self._get_measure_start_tick(current_measure_index + 1, song)
-                else:
-                    new_tick = song.length_ticks  # At end
-            else:
-                # Use measure_metadata
-                if current_measure_index + 1 < len(song.measure_metadata):
-                    new_tick = song.measure_metadata[current_measure_index + 1].start_tick
-                else:
-                    new_tick = song.length_ticks  # At end
+        # Find current measure and advance to the next one
+        current_measure_index = self._find_measure_at_tick(self.current_tick, song)
+        new_tick = self._get_next_measure_tick(current_measure_index, song)
 
         # Clamp to valid range
-        new_tick = min(new_tick, song.length_ticks)
+        new_tick = min(new_tick, length_ticks)
         self.current_tick = new_tick
 
         # Update piano roll playhead
@@ -1807,12 +1943,9 @@ class DAWView:
 
         # If playing, also jump the scheduler position
         if self.is_playing:
-            try:
-                self.playhead_jump_queue.put_nowait(new_tick)
-            except queue.Full:
-                print("[TRANSPORT] Warning: Jump queue full, ignoring request")
+            self._pending_jump.append(new_tick)
 
-        print(f"[TRANSPORT] Forward to tick {int(new_tick)}")
+        self._dbg(f"[TRANSPORT] Forward to tick {int(new_tick)}")
 
     def _process_control_event(self, event: dict):
         """
@@ -1822,7 +1955,8 @@ class DAWView:
         1. Learn Mode: Capture event and create mapping
         2. Normal Mode: Check mappings and trigger functions
         """
-        song = self.app_state.get_current_song()
+        # Direct attribute read: runs for every incoming control message
+        song = self.app_state._current_song
         if not song:
             return
 
@@ -1832,46 +1966,82 @@ class DAWView:
             return
 
         # Normal Mode: Check mappings
-        from core.models import MIDIControlMapping
-        import time
-
-        for mapping in song.midi_control_mappings:
-            if mapping.matches_message(event):
-                value = self._get_event_value(event)
-
-                # For transport controls (forward/backward), track hold state
-                if mapping.function in ['forward', 'backward']:
-                    cc_num = event.get('controller', -1)
-                    key = (mapping.function, cc_num)
-
-                    if value >= mapping.trigger_threshold:
-                        current_time = time.time()
-                        # Button pressed or still held (repeated messages)
-                        if key not in self.held_transport_buttons:
-                            # First press - record timestamp and trigger immediate action
-                            self.held_transport_buttons[key] = {
-                                'pressed_time': current_time,
-                                'last_action_time': current_time,
-                                'last_message_time': current_time
-                            }
-                            # Trigger immediate first action
-                            self._trigger_transport_function(mapping.function, first_press=True)
-                            print(f"[MIDI CTRL] {mapping.function.upper()} pressed (ch {event.get('channel', 'omni')})")
-                        else:
-                            # Button still held - update last message time
-                            self.held_transport_buttons[key]['last_message_time'] = current_time
+
+        mapping_index = self._get_mapping_index(song)
+        matched = []
+        for dispatch_key in MIDIControlMapping.message_dispatch_keys(event):
+            matched.extend(mapping_index.get(dispatch_key, ()))
+
+        for mapping in matched:
+            value = self._get_event_value(event)
+
+            # For transport controls (forward/backward), track hold state
+            if mapping.function in ['forward', 'backward']:
+                cc_num = event.get('controller', -1)
+                key = (mapping.function, cc_num)
+
+                if value >= mapping.trigger_threshold:
+                    current_time = time.monotonic()
+                    # Button pressed or still held (repeated messages)
+                    if key not in self.held_transport_buttons:
+                        # First press - record timestamp and trigger immediate action
+                        state = _HeldButton(current_time)
+                        self.held_transport_buttons[key] = state
+                        self._schedule_held_button(key, state)
+                        # Trigger immediate first action
+                        self._trigger_transport_function(mapping.function, first_press=True)
+                        self._dbg(f"[MIDI CTRL] {mapping.function.upper()} pressed (ch {event.get('channel', 'omni')})")
                     else:
-                        # Button released - clear hold state
-                        if key in self.held_transport_buttons:
-                            del self.held_transport_buttons[key]
-                            print(f"[MIDI CTRL] {mapping.function.upper()} released")
+                        # Button still held - update last message time
+                        self.held_transport_buttons[key].last_message_time = current_time
                 else:
-                    # Non-transport controls: immediate trigger as before
-                    if value >= mapping.trigger_threshold:
-                        self._trigger_function(mapping.function)
-                        print(f"[MIDI CTRL] {mapping.function.upper()} triggered by {event['type']} "
+                    # Button released - clear hold state
+                    if key in self.held_transport_buttons:
+                        del self.held_transport_buttons[key]
+                        self._dbg(f"[MIDI CTRL] {mapping.function.upper()} released")
+            else:
+                # Non-transport controls: immediate trigger as before
+                if value >= mapping.trigger_threshold:
+                    self._trigger_function(mapping.function)
+                    self._dbg(f"[MIDI CTRL] {mapping.function.upper()} triggered by {event['type']} "
                               f"(ch {event.get('channel', 'omni')})")
 
+    def _get_trigger_index(self, song, tpqn: int) -> tuple:
+        """Get (sorted note ticks, (note, track_idx) entries) for all tracks, rebuilt on edit."""
+        index = self._trigger_index
+        if index[0] is not song.tracks or index[1] != tpqn:
+            # Track tuples are immutable, so a new song.tracks identity means notes changed
+            track_triggers = self._track_triggers
+            per_track = []
+            for track_idx, track in enumerate(song.tracks):
+                cached = track_triggers.get(track_idx)
+                if cached is None or cached[0] is not track.notes or cached[1] != tpqn:
+                    cached = (track.notes, tpqn, sorted(
+                        ((note.start * tpqn, track_idx, note) for note in track.notes),
+                        key=lambda trigger: trigger[0]
+                    ))
+                    track_triggers[track_idx] = cached
+                per_track.append(cached[2])
+
+            # k-way merge of the already-sorted per-track lists
+            triggers = list(heapq.merge(*per_track, key=lambda trigger: trigger[0]))
+            index = (song.tracks, tpqn,
+                     [tick for tick, _, _ in triggers],
+                     [(note, track_idx) for _, track_idx, note in triggers])
+            self._trigger_index = index
+        return index[2], index[3]
+
+    def _get_mapping_index(self, song) -> dict:
+        """Get dispatch index of song's MIDI control mappings, rebuilt when they change."""
+        mappings = song.midi_control_mappings
+        if mappings is not self._mapping_index_source:
+            index = {}
+            for mapping in mappings:
+                index.setdefault(mapping.dispatch_key(), []).append(mapping)
+            self._mapping_index = index
+            self._mapping_index_source = mappings
+        return self._mapping_index
+
     def _get_event_value(self, event: dict) -> int:
         """Extract value from event (for threshold check)."""
         if event['type'] == 'cc':
@@ -1897,7 +2067,7 @@ class DAWView:
         elif function == 'backward':
             self._on_backward()
         else:
-            print(f"[MIDI CTRL] Unknown function: {function}")
+            self._dbg(f"[MIDI CTRL] Unknown function: {function}")
 
     def _trigger_transport_function(self, function: str, first_press: bool = False):
         """Trigger a transport function with first_press awareness.
@@ -1913,8 +2083,6 @@ class DAWView:
 
     def _capture_midi_learn(self, event: dict):
         """Capture MIDI event in learn mode and create mapping."""
-        import dataclasses
-        from core.models import MIDIControlMapping
 
         self.last_midi_message = event
 
@@ -1947,7 +2115,6 @@ class DAWView:
 
     def _create_mapping_from_event(self, function: str, event: dict):
         """Create a MIDIControlMapping from a captured event."""
-        from core.models import MIDIControlMapping
 
         mapping_args = {
             'function': function,
@@ -1967,9 +2134,12 @@ class DAWView:
 
         return MIDIControlMapping(**mapping_args)
 
+    def _on_learn_clicked(self, sender, app_data, user_data):
+        """Handle Learn button click (function name is passed as user_data)."""
+        self._start_midi_learn(user_data)
+
     def _start_midi_learn(self, function: str):
         """Start MIDI learn mode for a function, or clear existing mapping."""
-        import dataclasses
 
         song = self.app_state.get_current_song()
         if not song:
@@ -2003,7 +2173,7 @@ class DAWView:
             print(f"[MIDI LEARN] Press a button/knob on your MIDI controller to map to {function.upper()}")
 
             # Visual feedback - highlight the learn button
-            if dpg.does_item_exist(f"learn_{function}_button"):
+            if f"learn_{function}_button" in self._widget_tags:
                 dpg.configure_item(f"learn_{function}_button", label="Listening...")
 
     def _update_midi_learn_ui(self):
@@ -2012,25 +2182,31 @@ class DAWView:
         if not song:
             return
 
+        # Index mappings by function in one pass (reversed so the first mapping wins)
+        by_function = {m.function: m for m in reversed(song.midi_control_mappings)}
+
+        # Local bindings for the loop below
+        widget_tags = self._widget_tags
+        configure = dpg.configure_item
+        get_label = self._get_mapping_label
+
         # For each transport function, show what's mapped
         for function in ['play', 'stop', 'record', 'forward', 'backward']:
             # Find mapping for this function
-            mapping = next(
-                (m for m in song.midi_control_mappings if m.function == function),
-                None
-            )
+            mapping = by_function.get(function)
 
             # Update learn button label
             button_tag = f"learn_{function}_button"
-            if dpg.does_item_exist(button_tag):
+            if button_tag in widget_tags:
                 if mapping:
-                    label = self._get_mapping_label(mapping)
-                    dpg.configure_item(button_tag, label=label)
+                    configure(button_tag, label=get_label(mapping))
                 else:
-                    dpg.configure_item(button_tag, label="Learn")
+                    configure(button_tag, label="Learn")
 
-    def _get_mapping_label(self, mapping) -> str:
-        """Get short label describing a mapping."""
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _get_mapping_label(mapping: MIDIControlMapping) -> str:
+        """Get short label describing a mapping (memoized; mappings are frozen and hashable)."""
         if mapping.message_type == 'cc':
             return f"CC{mapping.cc_number}"
         elif mapping.message_type == 'note':
@@ -2046,7 +2222,7 @@ class DAWView:
         self.bpm = max(30, min(300, bpm))  # Clamp to range
 
         # Update UI to show clamped value
-        if dpg.does_item_exist("daw_bpm_input"):
+        if "daw_bpm_input" in self._widget_tags:
             dpg.set_value("daw_bpm_input", self.bpm)
 
         print(f"BPM changed to {self.bpm}")
@@ -2079,7 +2255,7 @@ class DAWView:
         millis = int((self.current_time % 1) * 1000)
         time_str = f"{minutes:02d}:{seconds:02d}:{millis:03d}"
 
-        if dpg.does_item_exist("daw_time_position_display"):
+        if "daw_time_position_display" in self._widget_tags:
             dpg.set_value("daw_time_position_display", time_str)
 
     # Mixer Callbacks
@@ -2088,7 +2264,7 @@ class DAWView:
         """Show/hide mixer strips to save screen space."""
         self.mixer_visible = not self.mixer_visible
 
-        if dpg.does_item_exist("daw_mixer_strips_group"):
+        if "daw_mixer_strips_group" in self._widget_tags:
             if self.mixer_visible:
                 dpg.show_item("daw_mixer_strips_group")
                 dpg.set_item_label("daw_mixer_toggle_button", "Hide Mixer ▼")
@@ -2137,13 +2313,13 @@ class DAWView:
             return
 
         if track_index == 16:
-            # Master channel: Arrangement View (all tracks)
-            all_tracks_data = []
-            for i, track in enumerate(song.tracks):
-                all_tracks_data.append({
-                    'notes': list(track.notes),
-                    'color': self.track_colors[i]
-                })
+            # Master channel: Arrangement View (all tracks). The view is read-only, so
+            # share each track's immutable notes tuple instead of copying it
+            track_colors = self.track_colors
+            all_tracks_data = [
+                {'notes': track.notes, 'color': track_colors[i]}
+                for i, track in enumerate(song.tracks)
+            ]
             self.piano_roll.load_track_notes(
                 track_index=16,
                 all_tracks_data=all_tracks_data,
@@ -2158,6 +2334,8 @@ class DAWView:
                 track_color=self.track_colors[track_index],
                 song=song
             )
+            # Freshly loaded notes match the song: nothing unsaved
+            self._last_saved_epoch = self.piano_roll._edit_epoch
 
             # Load synth UI for selected track
             self._refresh_sound_designer_ui(track_index, track)
@@ -2175,7 +2353,7 @@ class DAWView:
 
             # Update loop toggle and sync is_looping state
             self.is_looping = song.loop_enabled
-            if dpg.does_item_exist("daw_loop_toggle"):
+            if "daw_loop_toggle" in self._widget_tags:
                 dpg.set_value("daw_loop_toggle", song.loop_enabled)
 
         # Update MIDI learn UI to show current mappings
@@ -2199,8 +2377,24 @@ class DAWView:
         channel_name = "Master" if channel_index == 16 else f"Track {channel_index + 1}"
         print(f"{channel_name} {param_name} changed to {value}")
 
+        if channel_index < 16 and param_name in ("mute", "solo"):
+            mask = self._mute_mask if param_name == "mute" else self._solo_mask
+            mask[channel_index] = value
+            self._update_track_silenced()
+
         # TODO: Apply changes to audio engine in future phase
 
+    def _update_track_silenced(self):
+        """Recompute the per-track silenced flags read by the audio callback."""
+        any_solo = bool(self._solo_mask.any())
+        silenced = self._mute_mask.astype(bool)
+        if any_solo:
+            silenced |= self._solo_mask == 0
+        # Publish solo flag first; the tuple swap is a single atomic attribute write
+        self._any_solo = any_solo
+        self._track_silenced = tuple(silenced.tolist())
+        self._track_silenced_mask = silenced
+
     # Audio Playback Engine
 
     def _ensure_midi_handler_initialized(self):
@@ -2237,9 +2431,14 @@ class DAWView:
                     self.midi_handler.open_output()
                     if self.midi_handler.output_opened:
                         print("[MIDI OUTPUT] Opened for clock sync")
+                        self.midi_clock = MIDIClock(self.midi_handler)
+                        self.midi_clock.start()
 
             except Exception as e:
                 print(f"[MIDI] Failed to initialize: {e}")
+                if self.midi_clock:
+                    self.midi_clock.stop()
+                    self.midi_clock = None
                 self.midi_handler = None
 
     def _start_playback(self):
@@ -2248,12 +2447,14 @@ class DAWView:
         self._ensure_midi_handler_initialized()
 
         if self.playback_thread is None or not self.playback_thread.is_alive():
+            self._playback_stop_event.clear()
             self.playback_thread = threading.Thread(target=self._playback_worker, daemon=True)
             self.playback_thread.start()
 
     def _stop_playback(self):
         """Stop audio playback thread."""
-        # Thread will exit when it sees is_playing is False
+        # Wake the worker; it exits once it sees is_playing is False
+        self._playback_stop_event.set()
         if self.playback_thread and self.playback_thread.is_alive():
             self.playback_thread.join(timeout=1.0)
 
@@ -2265,7 +2466,7 @@ class DAWView:
         Route MIDI events to appropriate tracks based on channel and note range.
 
         Args:
-            event: MIDI event dictionary from note_event_queue
+            event: MIDI event dictionary from MIDIHandler.note_events
             current_tick: Current playback tick position
             song: Current song object
         """
@@ -2291,23 +2492,19 @@ class DAWView:
                 velocity = event['velocity']
                 if velocity > 0:
                     # Note On - add to active live notes
-                    key = (track_idx, note)
+                    key = (track_idx << 8) | note
                     self.active_live_notes[key] = {
                         'velocity': velocity,
                         'start_tick': current_tick
                     }
-                    print(f"[MIDI IN] Ch {channel+1} | Note ON  {note} | Vel {velocity:3d} -> Track {track_idx}")
+                    self._dbg(f"[MIDI IN] Ch {channel+1} | Note ON  {note} | Vel {velocity:3d} -> Track {track_idx}")
 
                     # Create voice in voice manager
                     track_synth = self._get_or_create_track_synth(track_idx)
                     if track_synth:
-                        from plugins.base import ProcessContext
-                        context = ProcessContext(
-                            sample_rate=self.sample_rate,
-                            bpm=self.current_bpm,
-                            tpqn=480,
-                            current_tick=int(current_tick)
-                        )
+                        context = self._live_context
+                        context.bpm = self.current_bpm
+                        context.current_tick = int(current_tick)
                         self.voice_manager.note_on(
                             track_idx=track_idx,
                             note_num=note,
@@ -2318,39 +2515,35 @@ class DAWView:
                         )
                 else:
                     # Note Off (velocity 0)
-                    key = (track_idx, note)
-                    if key in self.active_live_notes:
-                        del self.active_live_notes[key]
-                        print(f"[MIDI IN] Ch {channel+1} | Note OFF {note} -> Track {track_idx}")
+                    if self.active_live_notes.pop((track_idx << 8) | note, None) is not None:
+                        self._dbg(f"[MIDI IN] Ch {channel+1} | Note OFF {note} -> Track {track_idx}")
                         # Trigger note_off in voice manager
                         self.voice_manager.note_off(track_idx, note)
 
             elif event_type == 'note_off':
                 note = event['note']
-                key = (track_idx, note)
-                if key in self.active_live_notes:
-                    del self.active_live_notes[key]
-                    print(f"[MIDI IN] Ch {channel+1} | Note OFF {note} -> Track {track_idx}")
+                if self.active_live_notes.pop((track_idx << 8) | note, None) is not None:
+                    self._dbg(f"[MIDI IN] Ch {channel+1} | Note OFF {note} -> Track {track_idx}")
                     # Trigger note_off in voice manager
                     self.voice_manager.note_off(track_idx, note)
 
             elif event_type == 'channel_aftertouch':
                 # Channel aftertouch - could modulate synth parameters
                 pressure = event['pressure']
-                print(f"[MIDI IN] Ch {channel+1} | Aftertouch {pressure:3d}")
+                self._dbg(f"[MIDI IN] Ch {channel+1} | Aftertouch {pressure:3d}")
                 # TODO: Apply to all active notes on this track
 
             elif event_type == 'poly_aftertouch':
                 # Polyphonic aftertouch - per-note pressure
                 note = event['note']
                 pressure = event['pressure']
-                print(f"[MIDI IN] Ch {channel+1} | Poly AT Note {note} | Pressure {pressure:3d}")
+                self._dbg(f"[MIDI IN] Ch {channel+1} | Poly AT Note {note} | Pressure {pressure:3d}")
                 # TODO: Apply to specific note
 
             elif event_type == 'cc':
                 cc_num = event['controller']
                 cc_value = event['value']
-                print(f"[MIDI IN] Ch {channel+1} | CC {cc_num:3d} = {cc_value:3d}")
+                self._dbg(f"[MIDI IN] Ch {channel+1} | CC {cc_num:3d} = {cc_value:3d}")
                 # TODO: Map to synth parameters
 
     def _playback_worker(self):
@@ -2369,249 +2562,271 @@ class DAWView:
                 initial_tick=self.current_tick  # Start from UI playhead position
             )
             scheduler.bpm = self.bpm  # Fallback BPM if no measure_metadata
+
+            # Build the note trigger index up front instead of in the first callback
+            if song:
+                self._get_trigger_index(song, scheduler.tpqn)
+
+            def upcoming_notes():
+                """Render jobs for notes about to trigger (runs on the render worker)."""
+                song = self.app_state._current_song
+                if not song:
+                    return ()
+
+                tpqn = scheduler.tpqn
+                ticks, entries = self._get_trigger_index(song, tpqn)
+
+                # Window from just behind the playhead to NOTE_LOOKAHEAD_SECONDS ahead
+                span = NOTE_LOOKAHEAD_SECONDS * self.current_bpm / 60.0 * tpqn
+                start = self.current_tick - span * 0.1
+                end = start + span
+                lo = bisect_left(ticks, start)
+                window = entries[lo:bisect_left(ticks, end, lo)]
+
+                # When looping, the window continues from the loop start
+                loop_end_tick = song.loop_end_tick if song.loop_end_tick is not None else song.length_ticks
+                if self.is_looping and song.loop_enabled and loop_end_tick and end > loop_end_tick:
+                    wrap_lo = bisect_left(ticks, song.loop_start_tick)
+                    wrap_end = song.loop_start_tick + (end - loop_end_tick)
+                    window = window + entries[wrap_lo:bisect_left(ticks, wrap_end, wrap_lo)]
+
+                # Don't spend render time on muted / non-soloed tracks (notes unmuted
+                # mid-window fall back to a late render)
+                tracks = song.tracks
+                track_silenced = self._track_silenced
+                return [(track_idx, note, tracks[track_idx].source_type, tracks[track_idx].source_params)
+                        for note, track_idx in window if not track_silenced[track_idx]]
+
+            # Synth rendering for triggered notes happens ahead of time on this worker
+            self.note_renderer = NoteRenderer(
+                self.plugin_registry,
+                ProcessContext(sample_rate=self.sample_rate, bpm=self.bpm, tpqn=scheduler.tpqn),
+                lookahead=upcoming_notes
+            )
+            self.note_renderer.prefetch()  # First notes ready before the stream opens
+            self.note_renderer.start()
+            note_renderer = self.note_renderer
+
             print(f"[PLAYBACK] Starting from tick {int(self.current_tick)}")
 
-            # Active voices (currently playing notes)
-            active_voices = []
+            # Active voices (currently playing notes), as parallel arrays
+            voice_pool = VoicePool()
+
+            # MIDI Start goes out with the first rendered block
+            midi_start_pending = True
+
+            # Bound for dac_delay (replaced by the stream's latency once it is open)
+            max_dac_delay = MAX_DAC_DELAY
+
+            # Mix buffers reused by every callback (no allocation on the audio thread;
+            # only regrown if the device ever asks for more than one blocksize)
+            # (row 0 = left, row 1 = right, so peak/gain work on both channels at once)
+            mix_stereo = np.zeros((2, 512), dtype=np.float32)
+
+            # Per-track left/right gains (volume * pan law), refreshed each callback
+            track_left_gains = np.zeros(16, dtype=np.float32)
+            track_right_gains = np.zeros(16, dtype=np.float32)
+
+            # Per-song transport settings read every callback:
+            # (song, loop_start_tick, effective loop_end_tick, loop_enabled,
+            #  send_midi_clock, receive_midi_clock). Song is immutable, so the snapshot
+            # is only rebuilt when app_state hands us a different Song object.
+            song_snapshot = (None, 0, 0, False, False, False)
+
+            def get_song_snapshot(song):
+                nonlocal song_snapshot
+                if song_snapshot[0] is not song:
+                    loop_end_tick = song.loop_end_tick if song.loop_end_tick is not None else song.length_ticks
+                    song_snapshot = (song, song.loop_start_tick, loop_end_tick, song.loop_enabled,
+                                     song.send_midi_clock, song.receive_midi_clock)
+                return song_snapshot
 
             def audio_callback(outdata, frames, time_info, status):
                 """Called by sounddevice for each audio chunk (512 samples)."""
-                nonlocal active_voices
+                nonlocal midi_start_pending, mix_stereo
+
+                # Apply a pending Stop voice clear (queued by the GUI thread)
+                if self._pending_voice_clear:
+                    self._pending_voice_clear.pop()
+                    self.voice_manager.clear_all()
 
                 if not self.is_playing:
                     outdata[:] = 0
                     return
 
-                # Check for incoming SPP messages
+                # Seconds until this block reaches the DAC; outgoing MIDI is scheduled
+                # against it so external gear hears sync in step with our audio.
+                # Some host APIs report currentTime == 0, which would make this the
+                # absolute stream time: fall back to (and never exceed) the stream latency
+                if time_info.currentTime > 0.0:
+                    dac_delay = min(max(0.0, time_info.outputBufferDacTime - time_info.currentTime),
+                                    max_dac_delay)
+                else:
+                    dac_delay = max_dac_delay
+
+                # Fetch the song once per callback (immutable; edits made during playback
+                # are picked up on the next callback)
                 song = self.app_state.get_current_song()
-                if song and song.receive_midi_clock and self.midi_handler:
+                if song:
+                    (_, loop_start_tick, loop_end_tick, loop_enabled,
+                     send_midi_clock, receive_midi_clock) = get_song_snapshot(song)
+
+                # Schedule MIDI Start for when the first block is actually heard
+                if midi_start_pending:
+                    midi_start_pending = False
+                    if song and send_midi_clock and self.midi_clock:
+                        self.midi_clock.schedule_in(dac_delay, self.midi_handler.send_start)
+
+                if song and receive_midi_clock and self.midi_handler:
                     incoming_tick = self.midi_handler.get_spp_from_queue()
                     if incoming_tick is not None:
-                        print(f"[MIDI SPP] Jumping to tick {incoming_tick}")
+                        self._dbg(f"[MIDI SPP] Jumping to tick {incoming_tick}")
 
                         # Jump to received position
                         scheduler.current_tick = float(incoming_tick)
 
                         # Clear active voices to prevent audio bleeding
-                        active_voices = []
+                        voice_pool.clear()
+                        note_renderer.late.clear()
                         self.voice_manager.clear_all()
 
                 # Check for position jump requests from transport controls
-                try:
-                    jump_to_tick = self.playhead_jump_queue.get_nowait()
+                if self._pending_jump:
+                    jump_to_tick = self._pending_jump.pop()
                     scheduler.current_tick = jump_to_tick
                     self.current_tick = jump_to_tick
-                    print(f"[PLAYBACK] Jumped to tick {int(jump_to_tick)}")
-                except queue.Empty:
-                    pass
+                    self._dbg(f"[PLAYBACK] Jumped to tick {int(jump_to_tick)}")
 
-                # Process incoming MIDI note events
+                # Process incoming MIDI note events (popped straight off the lock-free ring)
                 if song and self.midi_handler and self.midi_handler.input_opened:
-                    note_events = self.midi_handler.get_note_events()
-                    for event in note_events:
-                        self._process_midi_event(event, int(scheduler.current_tick), song)
+                    note_events = self.midi_handler.note_events
+                    if note_events:
+                        event_tick = int(scheduler.current_tick)
+                        while note_events:
+                            self._process_midi_event(note_events.popleft(), event_tick, song)
 
                 # Advance scheduler
                 prev_tick = scheduler.current_tick
                 scheduler.advance(frames)
                 curr_tick = scheduler.current_tick
 
-                # Fetch current notes from app_state (thread-safe read of immutable data)
-                # This allows playback to reflect note edits made during playback
-                song = self.app_state.get_current_song()
                 if not song:
                     outdata[:] = 0
                     return
 
                 # === LOOP HANDLING ===
+                # (loop_end_tick is the effective loop end: song length if not set)
                 looped_this_frame = False
 
-                # Get effective loop end (default to song length if not set)
-                loop_end_tick = song.loop_end_tick if song.loop_end_tick is not None else song.length_ticks
-
-                # Debug: Print loop state every 100 frames to avoid spam
-                if hasattr(self, '_loop_debug_counter'):
-                    self._loop_debug_counter += 1
-                else:
-                    self._loop_debug_counter = 0
-
-                if self._loop_debug_counter % 100 == 0:
-                    print(f"[LOOP DEBUG] is_looping={self.is_looping}, song.loop_enabled={song.loop_enabled if song else None}, "
-                          f"loop_start={song.loop_start_tick if song else None}, loop_end={song.loop_end_tick if song else None}, "
-                          f"effective_loop_end={loop_end_tick}, curr_tick={int(curr_tick)}")
-
-                if song and self.is_looping and song.loop_enabled and loop_end_tick:
+                if self.is_looping and loop_enabled and loop_end_tick:
                     if curr_tick >= loop_end_tick:
-                        print(f"[LOOP] Looping back! curr_tick={int(curr_tick)} >= loop_end={loop_end_tick}")
+                        self._dbg(f"[LOOP] Looping back! curr_tick={int(curr_tick)} >= loop_end={loop_end_tick}")
 
                         # Calculate overshoot
                         overshoot_ticks = curr_tick - loop_end_tick
 
                         # Jump back to loop start
-                        scheduler.current_tick = song.loop_start_tick + overshoot_ticks
+                        scheduler.current_tick = loop_start_tick + overshoot_ticks
                         curr_tick = scheduler.current_tick
                         looped_this_frame = True
 
                         # Clear active voices to prevent audio bleeding
-                        active_voices = []
+                        voice_pool.clear()
+                        note_renderer.late.clear()
                         self.voice_manager.clear_all()
 
-                        # Send MIDI SPP on loop jump
-                        if song.send_midi_clock and self.midi_handler and self.midi_handler.midi_out:
-                            try:
-                                self.midi_handler.send_spp(int(scheduler.current_tick), scheduler.tpqn)
-                            except Exception as e:
-                                print(f"[MIDI] Error sending SPP: {e}")
+                        # Send MIDI SPP on loop jump, timed to when the jump is heard
+                        if send_midi_clock and self.midi_clock:
+                            self.midi_clock.schedule_in(
+                                dac_delay, self.midi_handler.send_spp,
+                                int(scheduler.current_tick), scheduler.tpqn
+                            )
 
-                # Collect ALL notes from all 16 tracks with track index
-                all_notes_with_tracks = []
-                for i, track in enumerate(song.tracks):
-                    for note in track.notes:
-                        all_notes_with_tracks.append((note, i))
+                # Notes starting inside this block's tick window (sorted index + bisect)
+                trigger_ticks, trigger_entries = self._get_trigger_index(song, scheduler.tpqn)
+                window_start = loop_start_tick if looped_this_frame else prev_tick
+                lo = bisect_left(trigger_ticks, window_start)
+                hi = bisect_left(trigger_ticks, curr_tick, lo)
 
                 # Check for new note triggers with real-time mute/solo filtering
-                # Check if any track has solo enabled (check in real-time)
-                any_solo_active = any(strip.solo for strip in self.mixer_strips[:16])
-
-                # Create process context for audio generation
-                from plugins.base import ProcessContext
-                context = ProcessContext(
-                    sample_rate=self.sample_rate,
-                    bpm=self.bpm,
-                    tpqn=scheduler.tpqn,
-                    current_tick=int(curr_tick)
-                )
-
-                triggered = []
-                for note, track_idx in all_notes_with_tracks:
-                    # Get mixer strip for this track
-                    mixer_strip = self.mixer_strips[track_idx]
-
-                    # Check mute/solo state in real-time
-                    if mixer_strip.muted:
-                        continue  # Skip muted tracks
+                # (flags mirrored by the mixer callbacks; no strip polling here)
+                any_solo_active = self._any_solo
+                track_silenced = self._track_silenced
+
+                # Hot-loop locals (LOAD_FAST instead of attribute chains per note)
+                tracks = song.tracks
+                add_voice = voice_pool.add
+                get_rendered = note_renderer.get
+
+                # Start notes whose late render finished since the last block
+                late = note_renderer.late
+                while late:
+                    track_idx, note, audio = late.popleft()
+                    if not track_silenced[track_idx]:
+                        add_voice(audio, track_idx)
+
+                for note, track_idx in trigger_entries[lo:hi]:
+                    # Skip muted tracks, and non-soloed tracks when any solo is active
+                    if track_silenced[track_idx]:
+                        continue
 
-                    if any_solo_active and not mixer_strip.solo:
-                        continue  # Skip non-soloed tracks when any solo is active
+                    # Audio was rendered ahead of the playhead by the note renderer
+                    track = tracks[track_idx]
+                    audio = get_rendered(track_idx, note, track.source_type, track.source_params)
+                    if audio is None:
+                        # Missed the lookahead (e.g. just after a jump): render on the
+                        # worker and start the note when it arrives
+                        note_renderer.request_late(track_idx, note, track.source_type, track.source_params)
+                        continue
 
-                    # Convert note.start (beats) to ticks
-                    note_tick = note.start * scheduler.tpqn
+                    add_voice(audio, track_idx)
 
-                    # Check if note triggers in this window
-                    should_trigger = False
-                    if not looped_this_frame:
-                        # Normal trigger check
-                        if prev_tick <= note_tick < curr_tick:
-                            should_trigger = True
-                    else:
-                        # If we looped, check segment from loop_start to curr_tick
-                        loop_start = song.loop_start_tick
-                        if loop_start <= note_tick < curr_tick:
-                            should_trigger = True
-
-                    if should_trigger:
-                        # Generate full audio for this note using track's synth instance
-                        track = song.tracks[track_idx]
-                        track_synth = self._get_or_create_track_synth(track_idx)
-                        if track_synth:
-                            audio = track_synth.process(None, track.source_params, note, context)
-
-                            triggered.append({
-                                'audio': audio,
-                                'position': 0,
-                                'note': note,
-                                'track_idx': track_idx,
-                                'volume': mixer_strip.volume,
-                                'pan': mixer_strip.pan
-                            })
-                        else:
-                            # Skip if synth creation failed
-                            continue
-
-                active_voices.extend(triggered)
-
-                # Initialize output buffers (stereo)
-                output_left = np.zeros(frames, dtype=np.float32)
-                output_right = np.zeros(frames, dtype=np.float32)
+                # Clear the pre-allocated output buffers (stereo)
+                if frames > mix_stereo.shape[1]:
+                    mix_stereo = np.zeros((2, frames), dtype=np.float32)
+                output_stereo = mix_stereo[:, :frames]
+                output_stereo.fill(0.0)
+                output_left = output_stereo[0]
+                output_right = output_stereo[1]
 
                 # Render active live MIDI voices (from real-time input)
-                live_left, live_right = self.voice_manager.render_frame(
-                    frames=frames,
-                    song=song,
-                    mixer_strips=self.mixer_strips,
-                    any_solo_active=any_solo_active
-                )
+                if self.voice_manager.active_voices:
+                    live_left, live_right = self.voice_manager.render_frame(
+                        frames=frames,
+                        song=song,
+                        mixer_strips=self.mixer_strips,
+                        any_solo_active=any_solo_active
+                    )
 
-                # Mix live voices into output buffers
-                output_left[:] += live_left
-                output_right[:] += live_right
+                    # Mix live voices into output buffers
+                    output_left += live_left
+                    output_right += live_right
 
                 # Mix Piano Roll voices into output buffer (stereo)
                 # (output buffers already initialized above with live notes mixed in)
 
-                voices_to_remove = []
-                for i, voice in enumerate(active_voices):
-                    # Get volume and pan for this voice
-                    volume = voice.get('volume', 0.75)
-                    pan = voice.get('pan', 0.5)
-
-                    # Check if this voice's track is now muted/not-soloed
-                    if 'track_idx' in voice:
-                        track_idx = voice['track_idx']
-                        mixer_strip = self.mixer_strips[track_idx]
-
-                        # Update volume/pan in real-time from mixer
+                if len(voice_pool):
+                    # Volume/pan follow the mixer in real time (constant power, table lookup)
+                    pan_scale = PAN_LUT_SIZE - 1
+                    for track_idx, mixer_strip in enumerate(self.mixer_strips[:16]):
                         volume = mixer_strip.volume
-                        pan = mixer_strip.pan
-
-                        # Stop voice if track is muted
-                        if mixer_strip.muted:
-                            voices_to_remove.append(i)
-                            continue
-
-                        # Stop voice if not soloed when solo is active
-                        if any_solo_active and not mixer_strip.solo:
-                            voices_to_remove.append(i)
-                            continue
-
-                    remaining = len(voice['audio']) - voice['position']
-
-                    if remaining <= 0:
-                        # Voice finished playing
-                        voices_to_remove.append(i)
-                        continue
+                        pan_index = int(min(max(mixer_strip.pan, 0.0), 1.0) * pan_scale + 0.5)
+                        track_left_gains[track_idx] = volume * _PAN_LUT_LEFT[pan_index]
+                        track_right_gains[track_idx] = volume * _PAN_LUT_RIGHT[pan_index]
 
-                    # How many samples to copy from this voice
-                    to_copy = min(remaining, frames)
+                    # Drops voices that ended or whose track is now muted/not-soloed
+                    voice_pool.mix(output_stereo, track_left_gains, track_right_gains,
+                                   self._track_silenced_mask)
 
-                    # Get audio samples and apply volume
-                    samples = voice['audio'][voice['position']:voice['position'] + to_copy] * volume
+                # Normalize to prevent clipping (peak of both channels, no abs() temporary)
+                max_val = max(output_stereo.max(), -output_stereo.min())
 
-                    # Apply pan (0.0 = left, 0.5 = center, 1.0 = right)
-                    # Use constant power panning for smooth stereo image
-                    pan_angle = pan * (math.pi / 2)  # 0 to π/2
-                    left_gain = math.cos(pan_angle)
-                    right_gain = math.sin(pan_angle)
-
-                    # Mix into stereo output
-                    output_left[:to_copy] += samples * left_gain
-                    output_right[:to_copy] += samples * right_gain
-
-                    voice['position'] += to_copy
-
-                # Remove finished/muted voices
-                for i in reversed(voices_to_remove):
-                    active_voices.pop(i)
-
-                # Normalize to prevent clipping (check both channels)
-                max_val = max(np.max(np.abs(output_left)), np.max(np.abs(output_right)))
+                # Output to audio device (stereo), folding the normalization gain into the copy
+                # (output_stereo.T is the (frames, 2) interleaved layout outdata expects)
                 if max_val > 0.8:
-                    output_left = output_left / max_val * 0.8
-                    output_right = output_right / max_val * 0.8
-
-                # Output to audio device (stereo)
-                outdata[:, 0] = output_left   # Left channel
-                outdata[:, 1] = output_right  # Right channel
+                    np.multiply(output_stereo.T, 0.8 / max_val, out=outdata)
+                else:
+                    np.copyto(outdata, output_stereo.T)
 
                 # Update playhead position (for UI, using lock for thread safety)
                 with self.playback_lock:
@@ -2626,22 +2841,31 @@ class DAWView:
             with sd.OutputStream(samplerate=self.sample_rate, channels=2,
                                blocksize=512, dtype='float32',
                                latency='low',
-                               callback=audio_callback):
-                # Keep thread alive while playing
+                               callback=audio_callback) as stream:
+                # Output latency plus one block is as far ahead as a block can be
+                max_dac_delay = stream.latency + 512 / self.sample_rate
+
+                # Keep thread alive while playing (woken by _stop_playback, no polling)
                 while self.is_playing:
-                    sd.sleep(100)  # Check every 100ms
+                    self._playback_stop_event.wait()
+                    self._playback_stop_event.clear()
 
             print("[PLAYBACK WORKER] Stopped")
 
         except Exception as e:
             print(f"[PLAYBACK WORKER ERROR] {e}")
-            import traceback
             traceback.print_exc()
             self.is_playing = False
 
+        finally:
+            if self.note_renderer:
+                self.note_renderer.stop()
+                self.note_renderer = None
+
     def _get_or_create_track_synth(self, track_idx: int):
         """Get or create synth instance for track."""
-        song = self.app_state.get_current_song()
+        # Direct attribute read: runs per triggered note on the audio thread
+        song = self.app_state._current_song
         if not song or track_idx >= len(song.tracks):
             return None
 
@@ -2726,62 +2950,94 @@ class DAWView:
 
         return params
 
-    # Update Loop
+    # Held transport buttons
 
-    def update(self):
-        """Update method called every frame to handle splitter dragging and time display."""
-        # Process MIDI control events
-        if self.midi_handler and self.midi_handler.input_opened:
-            control_events = self.midi_handler.get_control_events()
-            for event in control_events:
-                self._process_control_event(event)
+    def _schedule_held_button(self, key: tuple, state: _HeldButton):
+        """Push the next deadline at which a held button needs attention."""
+        release_deadline = state.last_message_time + HELD_BUTTON_TIMEOUT
+        if self.is_playing:
+            action_deadline = max(state.pressed_time + HELD_BUTTON_HOLD_THRESHOLD,
+                                  state.last_action_time + HELD_BUTTON_REPEAT_INTERVAL)
+        else:
+            # Re-check at the repeat rate so holds pick up playback starting
+            action_deadline = time.monotonic() + HELD_BUTTON_REPEAT_INTERVAL
+        heapq.heappush(self._held_heap,
+                       (min(release_deadline, action_deadline), next(self._held_seq), key, state))
 
-        # Handle held transport buttons for continuous actions
-        import time
-        current_time = time.time()
+    def _service_held_buttons(self, current_time: float):
+        """Auto-release or auto-repeat every held button whose deadline has passed."""
+        held_heap = self._held_heap
+        held = self.held_transport_buttons
 
-        # Timeout for auto-release if no messages received (handles controllers that don't send release)
-        BUTTON_TIMEOUT = 0.2  # 200ms without messages = button released
+        while held_heap and held_heap[0][0] <= current_time:
+            _, _, key, state = heapq.heappop(held_heap)
+            if held.get(key) is not state:
+                continue  # Released since this entry was scheduled
 
-        for key, state in list(self.held_transport_buttons.items()):
             function_name, cc_num = key
-            time_since_last_message = current_time - state.get('last_message_time', state['pressed_time'])
-            time_since_last_action = current_time - state['last_action_time']
 
             # Auto-release if no messages received for timeout period
-            if time_since_last_message > BUTTON_TIMEOUT:
-                del self.held_transport_buttons[key]
-                print(f"[MIDI CTRL] {function_name.upper()} released (timeout)")
+            if current_time - state.last_message_time > HELD_BUTTON_TIMEOUT:
+                del held[key]
+                self._dbg(f"[MIDI CTRL] {function_name.upper()} released (timeout)")
                 continue
 
-            # Only apply continuous action during playback
-            if not self.is_playing:
-                continue
+            # Only apply continuous action during playback, once held past the threshold
+            if (self.is_playing and
+                    current_time - state.pressed_time >= HELD_BUTTON_HOLD_THRESHOLD and
+                    current_time - state.last_action_time >= HELD_BUTTON_REPEAT_INTERVAL):
+                # Trigger continuous action (not first press)
+                self._trigger_transport_function(function_name, first_press=False)
+                state.last_action_time = current_time
+
+            self._schedule_held_button(key, state)
+
+    # Update Loop
 
-            # Define timing thresholds
-            HOLD_THRESHOLD = 0.25  # 250ms - button must be held this long before continuous actions start
-            CONTINUOUS_INTERVAL = 0.05  # 50ms between jumps once continuous mode starts
+    def _dbg(self, message: str):
+        """Queue a debug message without touching stdout (flushed from update())."""
+        self._debug_log.append(message)
+
+    def _flush_debug_log(self, max_messages: int = 32):
+        """Print up to max_messages queued debug messages in a single write."""
+        debug_log = self._debug_log
+        if not debug_log:
+            return
+        count = min(len(debug_log), max_messages)
+        print('\n'.join([debug_log.popleft() for _ in range(count)]))
+
+    def update(self):
+        """Update method called every frame to handle splitter dragging and time display."""
+        # Process MIDI control events
+        if self.midi_handler and self.midi_handler.input_opened:
+            control_events = self.midi_handler.get_control_events()
+            for event in control_events:
+                self._process_control_event(event)
 
-            # Calculate time since initial button press
-            time_since_press = current_time - state['pressed_time']
+        # Handle held transport buttons for continuous actions (only when a deadline is due)
+        held_heap = self._held_heap
+        if held_heap:
+            current_time = time.monotonic()
+            if held_heap[0][0] <= current_time:
+                self._service_held_buttons(current_time)
 
-            # Only start continuous actions if button held longer than threshold
-            if time_since_press >= HOLD_THRESHOLD:
-                if time_since_last_action >= CONTINUOUS_INTERVAL:
-                    # Trigger continuous action (not first press)
-                    self._trigger_transport_function(function_name, first_press=False)
-                    state['last_action_time'] = current_time
+        # Emit queued debug output (throttled, off the MIDI/transport paths)
+        self._flush_debug_log()
 
         # Update piano roll (for auto-resize)
         if self.piano_roll:
             self.piano_roll.update()
 
-        # Update time display and playhead if playing
+        # Update time display and playhead if playing (or once after Stop)
+        if self._time_display_dirty and not self.is_playing:
+            self._time_display_dirty = False
+            self._update_time_display()
+
         if self.is_playing:
             self._update_time_display()
 
             # Update BPM display to show current tempo at playhead
-            if dpg.does_item_exist("daw_bpm_input"):
+            if "daw_bpm_input" in self._widget_tags:
                 dpg.set_value("daw_bpm_input", int(self.current_bpm))
 
             # Update Piano Roll playhead (use tick position for accuracy with tempo changes)
@@ -2872,5 +3128,11 @@ class DAWView:
 
     def destroy(self):
         """Destroy the DAW window."""
+        # Send any still-scheduled MIDI (e.g. Stop) before the DAW goes away
+        if self.midi_clock:
+            self.midi_clock.stop()
+            self.midi_clock = None
+
         if dpg.does_item_exist(self._window_tag):
             dpg.delete_item(self._window_tag)
+        self._widget_tags = frozenset()
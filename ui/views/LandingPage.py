@@ -6,8 +6,32 @@ import dearpygui.dearpygui as dpg
 from typing import Optional, Callable, List, Dict
 from pathlib import Path
 import json
+import os
+import threading
 from datetime import datetime
 
+from ui.theme import create_accent_button_theme, create_success_button_theme
+
+
+# Rows in the recent projects list (created once, reused on refresh)
+MAX_RECENT_ROWS = 8
+
+# Seconds to wait after the last add_recent_project before writing the file
+RECENT_SAVE_DELAY = 0.5
+
+# Recent projects are stored as JSON lines, oldest first; opening a project appends
+# one line, and the file is rewritten with only the kept entries once it grows past this
+MAX_RECENT_PROJECTS = 10
+RECENT_COMPACT_LINES = 20
+
+
+def _stem(path: str) -> str:
+    """File name without its extension, like Path(path).stem but with plain string ops."""
+    if os.altsep:
+        path = path.replace(os.altsep, os.sep)
+    name = path.rpartition(os.sep)[2]
+    return name.rpartition('.')[0] or name
+
 
 class LandingPage:
     """
@@ -22,6 +46,11 @@ class LandingPage:
     - Return to Project button (when project is active)
     """
 
+    # Button themes, shared by every create() (recreated only for a new DearPyGui context)
+    _accent_theme = None
+    _success_theme = None
+    _recent_table_theme = None
+
     def __init__(self,
                  on_new_project: Callable,
                  on_open_project: Callable,
@@ -57,30 +86,145 @@ class LandingPage:
         self.has_active_project = False
         self.recent_projects: List[Dict] = []
         self._window_tag = "landing_page_window"
+
+        # Buttons only shown with an active project (item IDs, filled by create())
+        self._project_btn_ids: List[int] = []
+
+        # Recent projects list items: (table row, button, date text) per row,
+        # plus the "No recent projects" placeholder (filled by create())
+        self._recent_rows: List[tuple] = []
+        self._recent_empty_id: Optional[int] = None
+        self._recent_signature: Optional[tuple] = None  # (path, date) per row last shown
+
+        # File dialogs are created on first use and then kept (hidden) for reuse
+        self._dlg_built = {'open': False, 'import': False, 'export': False}
+
+        # Recent projects file (resolved once; directory created on first save).
+        # Despite the .json name it holds JSON lines (see _load_recent_projects)
+        self._config_path = Path.home() / ".blooper5" / "recent_projects.json"
+        self._config_dir = self._config_path.parent
+        self._config_dir_created = False
+        self._recent_dirty = False  # recent_projects changed since the last save
+        self._pending_appends: List[Dict] = []  # Added since the last save (not yet on disk)
+        self._file_lines = 0  # Entry lines currently in the file
+        self._compact_needed = False  # File must be rewritten (e.g. legacy JSON array format)
+        self._needs_newline = False  # File ends with a torn line (next append starts a new one)
+
+        # Debounced saving: adds schedule one delayed flush on a timer thread;
+        # the lock keeps the flush from serializing a list mid-update
+        self._recent_lock = threading.Lock()
+        self._save_pending = False
+        self._save_timer: Optional[threading.Timer] = None
+
         self._load_recent_projects()
 
     def _load_recent_projects(self):
-        """Load recent projects from config file."""
-        config_path = Path.home() / ".blooper5" / "recent_projects.json"
+        """
+        Load recent projects from config file.
 
-        if config_path.exists():
+        The file holds one JSON object per line, oldest first (the legacy format,
+        a single JSON array newest first, is still read and rewritten on the next
+        save). Malformed entries are skipped.
+        """
+        try:
+            data = self._config_path.read_bytes()
+        except FileNotFoundError:
+            data = b""
+        except OSError as e:
+            print(f"Failed to load recent projects: {e}")
+            data = b""
+
+        if data.lstrip().startswith(b"["):
+            # Legacy format: one JSON array, newest first
             try:
-                with open(config_path, 'r') as f:
-                    self.recent_projects = json.load(f)
-            except Exception as e:
+                entries = json.loads(data)
+            except ValueError as e:
                 print(f"Failed to load recent projects: {e}")
-                self.recent_projects = []
+                entries = []
+            if not isinstance(entries, list):
+                entries = []
+            self.recent_projects = [e for e in entries if self._is_valid_entry(e)][:MAX_RECENT_PROJECTS]
+            self._compact_needed = True
         else:
-            self.recent_projects = []
+            # Replay the log: a later line for the same path moves it to the front
+            lines = data.splitlines()
+            latest: Dict[str, Dict] = {}
+            for line in lines:
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # e.g. a line torn by a crash mid-append
+                if not self._is_valid_entry(entry):
+                    continue
+                latest.pop(entry['path'], None)
+                latest[entry['path']] = entry
+            self.recent_projects = list(reversed(latest.values()))[:MAX_RECENT_PROJECTS]
+            self._file_lines = len(lines)
+            self._needs_newline = bool(data) and not data.endswith(b"\n")
+
+        for project in self.recent_projects:
+            project.setdefault('name', _stem(project['path']))
+            project['display_date'] = self._format_date(project.get('last_opened'))
+
+    @staticmethod
+    def _is_valid_entry(entry) -> bool:
+        """Check that a loaded entry is a dict with a string path."""
+        return isinstance(entry, dict) and isinstance(entry.get('path'), str)
+
+    @staticmethod
+    def _format_date(last_opened: Optional[str]) -> str:
+        """Format an ISO timestamp for the recent projects list (MM/DD/YY)."""
+        try:
+            return datetime.fromisoformat(last_opened).strftime("%m/%d/%y")
+        except (TypeError, ValueError):
+            return "Unknown"
+
+    @staticmethod
+    def _to_line(project: Dict) -> bytes:
+        """Serialize one entry as a JSON line (display_date is derived on load, not stored)."""
+        on_disk = {k: v for k, v in project.items() if k != 'display_date'}
+        return json.dumps(on_disk, separators=(',', ':')).encode() + b"\n"
+
+    def _ensure_config_dir(self):
+        """Create the config directory before the first write."""
+        if not self._config_dir_created:
+            self._config_dir.mkdir(parents=True, exist_ok=True)
+            self._config_dir_created = True
 
     def _save_recent_projects(self):
-        """Save recent projects to config file."""
-        config_path = Path.home() / ".blooper5" / "recent_projects.json"
-        config_path.parent.mkdir(parents=True, exist_ok=True)
+        """Rewrite the whole file with the kept entries (only if changed; atomic replace)."""
+        if not self._recent_dirty:
+            return
 
+        self._ensure_config_dir()
         try:
-            with open(config_path, 'w') as f:
-                json.dump(self.recent_projects, f, indent=2)
+            payload = b"".join(self._to_line(p) for p in reversed(self.recent_projects))
+            tmp_path = self._config_path.with_suffix('.json.tmp')
+            tmp_path.write_bytes(payload)
+            os.replace(tmp_path, self._config_path)
+            self._file_lines = len(self.recent_projects)
+            self._pending_appends = []
+            self._compact_needed = False
+            self._needs_newline = False
+            self._recent_dirty = False
+        except Exception as e:
+            print(f"Failed to save recent projects: {e}")
+
+    def _append_recent_projects(self):
+        """Append the entries added since the last save (fast path, no rewrite)."""
+        self._ensure_config_dir()
+        try:
+            payload = b"".join(self._to_line(p) for p in self._pending_appends)
+            if self._needs_newline:
+                payload = b"\n" + payload  # Don't glue the first entry onto a torn line
+            with open(self._config_path, 'ab') as f:
+                f.write(payload)
+            self._needs_newline = False
+            self._file_lines += len(self._pending_appends)
+            self._pending_appends = []
+            self._recent_dirty = False
         except Exception as e:
             print(f"Failed to save recent projects: {e}")
 
@@ -91,40 +235,92 @@ class LandingPage:
         Args:
             file_path: Full path to project file
         """
-        # Remove if already exists
-        self.recent_projects = [p for p in self.recent_projects if p['path'] != file_path]
-
-        # Add to front
+        now = datetime.now()
         project_info = {
             'path': file_path,
-            'name': Path(file_path).stem,
-            'last_opened': datetime.now().isoformat()
+            'name': _stem(file_path),
+            'last_opened': now.isoformat(),
+            'display_date': now.strftime("%m/%d/%y")
         }
-        self.recent_projects.insert(0, project_info)
 
-        # Keep only last 10
-        self.recent_projects = self.recent_projects[:10]
+        with self._recent_lock:
+            # Remove if already exists (no new list when it doesn't)
+            if any(p['path'] == file_path for p in self.recent_projects):
+                self.recent_projects = [p for p in self.recent_projects if p['path'] != file_path]
+
+            # Add to front
+            self.recent_projects.insert(0, project_info)
+
+            # Keep only last 10
+            del self.recent_projects[MAX_RECENT_PROJECTS:]
+
+            self._pending_appends.append(project_info)
+            self._recent_dirty = True
 
-        self._save_recent_projects()
+        self._schedule_flush()
 
         # Refresh the UI to show the updated list
         self._refresh_recent_projects()
 
+    def _schedule_flush(self):
+        """Write recent projects RECENT_SAVE_DELAY after the latest change (restarts the timer)."""
+        self._save_pending = True
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+        self._save_timer = threading.Timer(RECENT_SAVE_DELAY, self._flush_recents)
+        self._save_timer.start()
+
+    def _flush_recents(self):
+        """Write recent projects if a save is pending (timer thread or destroy())."""
+        with self._recent_lock:
+            if not self._save_pending:
+                return
+            self._save_pending = False
+            if (self._compact_needed or
+                    self._file_lines + len(self._pending_appends) > RECENT_COMPACT_LINES):
+                self._save_recent_projects()
+            else:
+                self._append_recent_projects()
+
     def set_active_project(self, active: bool):
         """
         Set whether there's an active project.
-        Controls visibility of "Return to Project", "Save Project", and "Save As" buttons.
+        Controls visibility of "Export MIDI", "Save Project", "Save As" and "Return to Project" buttons.
 
         Args:
             active: True if project is active
         """
         self.has_active_project = active
-        if dpg.does_item_exist("return_to_project_btn"):
-            dpg.configure_item("return_to_project_btn", show=active)
-        if dpg.does_item_exist("save_project_btn"):
-            dpg.configure_item("save_project_btn", show=active)
-        if dpg.does_item_exist("save_as_project_btn"):
-            dpg.configure_item("save_as_project_btn", show=active)
+        try:
+            for btn_id in self._project_btn_ids:
+                dpg.configure_item(btn_id, show=active)
+        except Exception as e:
+            print(f"Failed to update project buttons: {e}")
+
+    @classmethod
+    def _get_accent_theme(cls):
+        """Get the shared accent button theme (created on first use)."""
+        if cls._accent_theme is None or not dpg.does_item_exist(cls._accent_theme):
+            cls._accent_theme = create_accent_button_theme()
+        return cls._accent_theme
+
+    @classmethod
+    def _get_success_theme(cls):
+        """Get the shared success button theme (created on first use)."""
+        if cls._success_theme is None or not dpg.does_item_exist(cls._success_theme):
+            cls._success_theme = create_success_button_theme()
+        return cls._success_theme
+
+    @classmethod
+    def _get_recent_table_theme(cls):
+        """Get the shared recent projects table theme (cell padding spaces the rows)."""
+        if cls._recent_table_theme is None or not dpg.does_item_exist(cls._recent_table_theme):
+            with dpg.theme() as theme:
+                with dpg.theme_component(dpg.mvTable):
+                    dpg.add_theme_style(dpg.mvStyleVar_CellPadding, 15, 4,
+                                        category=dpg.mvThemeCat_Core)
+            cls._recent_table_theme = theme
+        return cls._recent_table_theme
 
     def create(self) -> str:
         """
@@ -133,8 +329,6 @@ class LandingPage:
         Returns:
             Window tag
         """
-        from ui.theme import create_accent_button_theme, create_success_button_theme
-
         with dpg.window(label="Blooper5",
                        width=900, height=700,
                        pos=(50, 50),
@@ -168,10 +362,9 @@ class LandingPage:
                             label="New Project",
                             width=280,
                             height=70,
-                            callback=lambda: self.on_new_project()
+                            callback=self._cb_new
                         )
-                        accent_theme = create_accent_button_theme()
-                        dpg.bind_item_theme(new_btn, accent_theme)
+                        dpg.bind_item_theme(new_btn, self._get_accent_theme())
 
                         dpg.add_spacer(height=15)
 
@@ -196,7 +389,7 @@ class LandingPage:
                         dpg.add_spacer(height=15)
 
                         # Export MIDI button (shown only when project active)
-                        dpg.add_button(
+                        export_btn = dpg.add_button(
                             label="Export MIDI File",
                             width=280,
                             height=50,
@@ -208,11 +401,11 @@ class LandingPage:
                         dpg.add_spacer(height=15)
 
                         # Save Project button (hidden by default, shown when project active)
-                        dpg.add_button(
+                        save_btn = dpg.add_button(
                             label="Save Project",
                             width=280,
                             height=50,
-                            callback=lambda: self.on_save_project() if self.on_save_project else None,
+                            callback=self._cb_save,
                             tag="save_project_btn",
                             show=self.has_active_project
                         )
@@ -220,11 +413,11 @@ class LandingPage:
                         dpg.add_spacer(height=15)
 
                         # Save As button (hidden by default, shown when project active)
-                        dpg.add_button(
+                        save_as_btn = dpg.add_button(
                             label="Save As...",
                             width=280,
                             height=50,
-                            callback=lambda: self.on_save_as_project() if self.on_save_as_project else None,
+                            callback=self._cb_save_as,
                             tag="save_as_project_btn",
                             show=self.has_active_project
                         )
@@ -236,19 +429,20 @@ class LandingPage:
                             label="Return to Project",
                             width=280,
                             height=50,
-                            callback=lambda: self.on_return_to_project() if self.on_return_to_project else None,
+                            callback=self._cb_return,
                             tag="return_to_project_btn",
                             show=self.has_active_project
                         )
-                        success_theme = create_success_button_theme()
-                        dpg.bind_item_theme(return_btn, success_theme)
+                        dpg.bind_item_theme(return_btn, self._get_success_theme())
+
+                        self._project_btn_ids = [export_btn, save_btn, save_as_btn, return_btn]
 
                         dpg.add_spacer(height=30)
 
                         # Settings button
                         dpg.add_button(
                             label="Settings",
-                            callback=lambda: self.on_settings() if self.on_settings else None,
+                            callback=self._cb_settings,
                             width=280,
                             height=40
                         )
@@ -258,7 +452,7 @@ class LandingPage:
                         # Exit button
                         dpg.add_button(
                             label="Exit",
-                            callback=lambda: self.on_exit() if self.on_exit else None,
+                            callback=self._cb_exit,
                             width=280,
                             height=40
                         )
@@ -274,62 +468,105 @@ class LandingPage:
                     dpg.add_separator()
                     dpg.add_spacer(height=15)
 
-                    # Recent projects list container (will be dynamically updated)
+                    # Recent projects list container (rows are reused on refresh)
                     with dpg.group(tag="recent_projects_list"):
                         self._build_recent_projects_list()
+                    self._refresh_recent_projects()
 
         return self._window_tag
 
+    def _cb_new(self):
+        """Handle "New Project" click."""
+        self.on_new_project()
+
+    def _cb_save(self):
+        """Handle "Save Project" click."""
+        if self.on_save_project:
+            self.on_save_project()
+
+    def _cb_save_as(self):
+        """Handle "Save As" click."""
+        if self.on_save_as_project:
+            self.on_save_as_project()
+
+    def _cb_return(self):
+        """Handle "Return to Project" click."""
+        if self.on_return_to_project:
+            self.on_return_to_project()
+
+    def _cb_settings(self):
+        """Handle "Settings" click."""
+        if self.on_settings:
+            self.on_settings()
+
+    def _cb_exit(self):
+        """Handle "Exit" click."""
+        if self.on_exit:
+            self.on_exit()
+
+    def _cb_open_recent(self, sender, app_data, user_data):
+        """Handle a recent project row click (user_data is its path)."""
+        self._open_recent_project(user_data)
+
     def _build_recent_projects_list(self):
-        """Build the recent projects list UI."""
-        if self.recent_projects:
-            # Recent projects list
-            for i, project in enumerate(self.recent_projects[:8]):
-                with dpg.group(horizontal=True):
+        """Create the (initially hidden) recent project rows and the empty placeholder."""
+        self._recent_rows = []
+        with dpg.table(header_row=False, borders_innerH=False, borders_outerH=False,
+                       borders_innerV=False, borders_outerV=False) as table:
+            dpg.add_table_column(width_fixed=True, init_width_or_weight=380)  # Project name
+            dpg.add_table_column(width_fixed=True)                             # Last opened date
+
+            for _ in range(MAX_RECENT_ROWS):
+                with dpg.table_row(show=False) as row:
                     # Project name button (clickable)
                     proj_btn = dpg.add_button(
-                        label=f"  {project['name']}",
+                        label="",
                         width=380,
                         height=40,
-                        callback=lambda s, a, u: self._open_recent_project(u),
-                        user_data=project['path']
+                        callback=self._cb_open_recent
                     )
 
                     # Last opened date
-                    dpg.add_spacer(width=15)
-                    try:
-                        dt = datetime.fromisoformat(project['last_opened'])
-                        date_str = dt.strftime("%m/%d/%y")
-                    except:
-                        date_str = "Unknown"
-                    dpg.add_text(date_str, color=(120, 120, 120, 255))
-
-                if i < min(len(self.recent_projects[:8]) - 1, 7):
-                    dpg.add_spacer(height=8)
-        else:
+                    date_text = dpg.add_text("", color=(120, 120, 120, 255))
+                self._recent_rows.append((row, proj_btn, date_text))
+        dpg.bind_item_theme(table, self._get_recent_table_theme())
+        self._recent_signature = None
+
+        with dpg.group(show=False) as empty:
             dpg.add_spacer(height=40)
             with dpg.group(horizontal=True):
                 dpg.add_spacer(width=120)
                 dpg.add_text("No recent projects", color=(100, 100, 100, 255))
+        self._recent_empty_id = empty
 
     def _refresh_recent_projects(self):
-        """Refresh the recent projects list display."""
-        if dpg.does_item_exist("recent_projects_list"):
-            # Delete all children of the recent projects list
-            children = dpg.get_item_children("recent_projects_list", slot=1)
-            if children:
-                for child in children:
-                    dpg.delete_item(child)
-
-            # Rebuild the list inside the container
-            dpg.push_container_stack("recent_projects_list")
-            self._build_recent_projects_list()
-            dpg.pop_container_stack()
+        """Refresh the recent projects list display (relabels existing rows)."""
+        if not self._recent_rows:
+            return
+
+        projects = self.recent_projects[:MAX_RECENT_ROWS]
+
+        # Nothing to do if the rows already show this list
+        signature = tuple((p['path'], p.get('display_date')) for p in projects)
+        if signature == self._recent_signature:
+            return
+
+        for i, (row, proj_btn, date_text) in enumerate(self._recent_rows):
+            if i < len(projects):
+                project = projects[i]
+                dpg.configure_item(proj_btn, label=f"  {project['name']}", user_data=project['path'])
+                dpg.set_value(date_text, project.get('display_date', "Unknown"))
+                dpg.configure_item(row, show=True)
+            else:
+                dpg.configure_item(row, show=False)
+
+        dpg.configure_item(self._recent_empty_id, show=not projects)
+        self._recent_signature = signature
 
     def _show_file_dialog(self):
         """Show file dialog to open a project."""
         # Create file dialog if it doesn't exist
-        if not dpg.does_item_exist("open_project_dialog"):
+        if not self._dlg_built['open']:
             with dpg.file_dialog(
                 directory_selector=False,
                 show=False,
@@ -341,15 +578,16 @@ class LandingPage:
             ):
                 dpg.add_file_extension(".bloom5", color=(0, 122, 204, 255))
                 dpg.add_file_extension(".*")
+            self._dlg_built['open'] = True
 
         dpg.show_item("open_project_dialog")
 
     def _file_dialog_callback(self, sender, app_data):
         """Handle file dialog selection."""
-        selections = app_data.get('selections', {})
-        if selections:
-            file_path = list(selections.values())[0]
-            self._open_recent_project(file_path)
+        file_path = next(iter((app_data.get('selections') or {}).values()), None)
+        if not file_path:
+            return
+        self._open_recent_project(file_path)
 
     def _open_recent_project(self, file_path: str):
         """Open a recent project."""
@@ -359,7 +597,7 @@ class LandingPage:
 
     def _show_import_midi_dialog(self):
         """Show file dialog for MIDI import."""
-        if not dpg.does_item_exist("import_midi_dialog"):
+        if not self._dlg_built['import']:
             with dpg.file_dialog(
                 directory_selector=False,
                 show=False,
@@ -372,18 +610,20 @@ class LandingPage:
                 dpg.add_file_extension(".mid", color=(0, 255, 122, 255))
                 dpg.add_file_extension(".midi", color=(0, 255, 122, 255))
                 dpg.add_file_extension(".*")
+            self._dlg_built['import'] = True
         dpg.show_item("import_midi_dialog")
 
     def _handle_import_midi(self, sender, app_data):
         """Handle MIDI import file selection."""
-        if app_data['selections']:
-            file_path = list(app_data['selections'].values())[0]
-            if self.on_import_midi:
-                self.on_import_midi(file_path)
+        file_path = next(iter((app_data.get('selections') or {}).values()), None)
+        if not file_path:
+            return
+        if self.on_import_midi:
+            self.on_import_midi(file_path)
 
     def _show_export_midi_dialog(self):
         """Show file dialog for MIDI export."""
-        if not dpg.does_item_exist("export_midi_dialog"):
+        if not self._dlg_built['export']:
             with dpg.file_dialog(
                 directory_selector=False,
                 show=False,
@@ -395,14 +635,16 @@ class LandingPage:
             ):
                 dpg.add_file_extension(".mid", color=(122, 122, 255, 255))
                 dpg.add_file_extension(".*")
+            self._dlg_built['export'] = True
         dpg.show_item("export_midi_dialog")
 
     def _handle_export_midi(self, sender, app_data):
         """Handle MIDI export file selection."""
-        if app_data['selections']:
-            file_path = list(app_data['selections'].values())[0]
-            if self.on_export_midi:
-                self.on_export_midi(file_path)
+        file_path = next(iter((app_data.get('selections') or {}).values()), None)
+        if not file_path:
+            return
+        if self.on_export_midi:
+            self.on_export_midi(file_path)
 
     def show(self):
         """Show the landing page window."""
@@ -416,5 +658,9 @@ class LandingPage:
 
     def destroy(self):
         """Destroy the landing page window."""
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+        self._flush_recents()
+
         if dpg.does_item_exist(self._window_tag):
             dpg.delete_item(self._window_tag)
@@ -10,6 +10,9 @@ Similar to Piano Roll but optimized for drum patterns:
 """
 
 import dearpygui.dearpygui as dpg
+import numpy as np
+from bisect import bisect_left, bisect_right
+from numba import jit
 from typing import List, Tuple, Optional, Dict, Any
 from dataclasses import dataclass
 
@@ -31,10 +34,158 @@ DRUM_ROW_HEIGHT = 18  # Taller rows than piano roll
 DRUM_NOTE_WIDTH = 12  # Fixed width for drum hits
 SAMPLER_DEFAULT_START = 33  # Default MIDI note to center view on
 
+# Exponential zoom: zoom_x = ZOOM_BASE * ZOOM_FACTOR ** step (step range keeps zoom in ~0.1..10)
+ZOOM_BASE = 0.537
+ZOOM_FACTOR = 1.2
+ZOOM_MIN_STEP = -9
+ZOOM_MAX_STEP = 16
+
+# Grid spacing per zoom band: _GRID_SPACINGS[bisect_right(_ZOOM_THRESHOLDS, zoom_x)]
+_ZOOM_THRESHOLDS = (0.25, 0.4, 0.7, 1.2, 2.0, 3.5)
+_GRID_SPACINGS = (
+    TPQN * 4,    # Whole notes
+    TPQN * 2,    # Half notes
+    TPQN,        # Quarter notes
+    TPQN // 2,   # 8th notes
+    TPQN // 4,   # 16th notes
+    TPQN // 8,   # 32nd notes
+    TPQN // 16,  # 64th notes
+)
+
+# Level of detail: below this zoom (px per tick) triplet lines are skipped and hits are
+# drawn as per-pixel-column velocity density bars instead of individual sprites
+LOD_ZOOM = 0.3
+LOD_BAR_MARGIN = 3  # px between density bars and row edges
+LOD_BAR_COLOR = np.array([200, 200, 210], dtype=np.float32) / 255
+LOD_SELECTED_MIN_ALPHA = 0.6  # Cells holding selected hits stay visible at low velocity
+
+# Structure-of-arrays layout of the hits used for drawing
+# (tick stays float: unsnapped hits can land between ticks)
+HIT_DTYPE = np.dtype([('tick', 'f8'), ('pitch', 'u1'), ('vel', 'u1'), ('sel', '?')])
+
+# Background colors (normalized RGBA, as used by float textures)
+CANVAS_BG_COLOR = np.array([15, 15, 20, 255], dtype=np.float32) / 255
+PAD_ROW_EVEN_COLOR = np.array([20, 20, 25, 255], dtype=np.float32) / 255
+PAD_ROW_ODD_COLOR = np.array([15, 15, 18, 255], dtype=np.float32) / 255
+PAD_ROW_DIVIDER_COLOR = np.array([30, 30, 35, 255], dtype=np.float32) / 255
+HIT_SELECTED_COLOR = np.array([255, 180, 80, 255], dtype=np.float32) / 255
+HIT_RING_COLOR = np.array([255, 255, 100, 200], dtype=np.float32) / 255
+
+# Hit sprite atlas: HIT_VELOCITY_BUCKETS velocity buckets (velocity >> 3) x 2 variants
+# (0 = normal, 1 = selected), each a square RGBA sprite HIT_SPRITE_SIZE px wide
+HIT_VELOCITY_BUCKETS = 16
+HIT_SPRITE_HALF = 7  # Fits the largest high-velocity ring (radius 5.6) plus antialiasing
+HIT_SPRITE_SIZE = HIT_SPRITE_HALF * 2 + 1
+
+
+def _build_hit_atlas() -> np.ndarray:
+    """
+    Pre-render every hit appearance.
+
+    Returns:
+        (2, HIT_VELOCITY_BUCKETS, HIT_SPRITE_SIZE, HIT_SPRITE_SIZE, 4) float32 RGBA sprites
+    """
+    offsets = np.arange(-HIT_SPRITE_HALF, HIT_SPRITE_HALF + 1, dtype=np.float32)
+    dist = np.hypot(offsets[:, None], offsets[None, :])
+
+    atlas = np.zeros((2, HIT_VELOCITY_BUCKETS, HIT_SPRITE_SIZE, HIT_SPRITE_SIZE, 4), dtype=np.float32)
+    for bucket in range(HIT_VELOCITY_BUCKETS):
+        # Velocity affects size and brightness (bucket drawn at its middle velocity)
+        vel_factor = min(bucket * 8 + 4, 127) / 127.0
+        size = DRUM_NOTE_WIDTH * 0.3 * (0.5 + vel_factor * 0.5)
+        brightness = int(150 + vel_factor * 105) / 255
+        disc = np.clip(size + 0.5 - dist, 0.0, 1.0)
+        ring = np.clip(1.0 - np.abs(dist - (size + 2)), 0.0, 1.0)
+
+        for variant, color in enumerate((
+                np.array([brightness, brightness, brightness, 1.0], dtype=np.float32),
+                HIT_SELECTED_COLOR)):
+            sprite = atlas[variant, bucket]
+            _blend(sprite, disc, color)
+            # Velocity indicator (ring around circle)
+            if vel_factor > 0.8:  # High velocity
+                _blend(sprite, ring, HIT_RING_COLOR)
+
+    return atlas
+
+
+def _blend(dst: np.ndarray, alpha: np.ndarray, color: np.ndarray):
+    """Blend a single-color alpha mask over an RGBA region (straight alpha, source over)."""
+    src_a = alpha[..., None] * color[3:]
+    _blend_rgba(dst, color[:3], src_a)
+
+
+def _blend_rgba(dst: np.ndarray, src_rgb: np.ndarray, src_a: np.ndarray):
+    """Blend source color/alpha over an RGBA region in place (straight alpha, source over)."""
+    dst_a = dst[..., 3:]
+    out_a = src_a + dst_a * (1.0 - src_a)
+    dst[..., :3] = (src_rgb * src_a + dst[..., :3] * dst_a * (1.0 - src_a)) / np.maximum(out_a, 1e-6)
+    dst[..., 3:] = out_a
+
+
+@jit(nopython=True, cache=True)
+def _compute_hit_visuals(ticks, pitches, vels, sels, row_y, scroll_x, zoom_x,
+                         t_start, t_end, bot_pitch, top_pitch):
+    """
+    Cull hits to the viewport and pick each visible hit's sprite (JIT-compiled).
+
+    Args:
+        ticks, pitches, vels, sels: Hit fields (HIT_DTYPE columns)
+        row_y: Screen y of each pitch's row top
+        scroll_x, zoom_x: Horizontal view
+        t_start, t_end: Tick bounds of hits whose sprite reaches the viewport
+        bot_pitch, top_pitch: Visible pitch range
+
+    Returns:
+        (center_x, center_y, variant, bucket) arrays for the visible hits
+    """
+    n = len(ticks)
+    center_x = np.empty(n, dtype=np.int64)
+    center_y = np.empty(n, dtype=np.int64)
+    variant = np.empty(n, dtype=np.int64)
+    bucket = np.empty(n, dtype=np.int64)
+
+    count = 0
+    for i in range(n):
+        tick = ticks[i]
+        pitch = pitches[i]
+        if tick < t_start or tick > t_end:
+            continue
+        if pitch < bot_pitch or pitch > top_pitch:
+            continue
+
+        center_x[count] = int(np.floor((tick - scroll_x) * zoom_x + DRUM_NOTE_WIDTH / 2 + 0.5))
+        center_y[count] = int(np.floor(row_y[pitch] + DRUM_ROW_HEIGHT / 2 + 0.5))
+        variant[count] = 1 if sels[i] else 0
+        bucket[count] = vels[i] >> 3
+        count += 1
+
+    return center_x[:count], center_y[:count], variant[:count], bucket[:count]
+
+
+# Built once at import (32 tiny sprites)
+_HIT_ATLAS = _build_hit_atlas()
+
 
 class DrumRoll:
     """Drum Roll editor for sampler/drum pattern editing."""
 
+    # Fixed attribute set: slot access in the draw paths, no per-instance __dict__
+    __slots__ = (
+        'width', 'height',
+        'scroll_x', 'scroll_y', '_zoom_step', 'zoom_x',
+        'is_dragging', 'drag_start_pos', 'current_note', 'ghost_notes', 'selected_notes', 'tool',
+        'current_tick', 'is_playing',
+        'show_triplet_grid', 'snap_to_grid', 'quantize_value',
+        'song_length_ticks', '_measure_ticks', 'notes', '_note_index', 'pad_names',
+        'window_id', 'canvas_id', 'drawlist_id',
+        '_texture_registry_id', '_pad_row_texture_id', '_pad_row_buffer', '_pad_row_key',
+        '_hits_texture_id', '_hits_buffer', '_hits_key',
+        '_static_layer_id', '_dynamic_layer_id', '_static_key', '_row_y',
+        '_label_node_id', '_label_scroll_y', '_playhead_id',
+        '_pending_zoom_steps', '_pending_scroll_x', '_dirty', '_playhead_dirty', '_scheduled_frame',
+    )
+
     def __init__(self, width: int = 800, height: int = 600):
         self.width = width
         self.height = height
@@ -43,7 +194,8 @@ class DrumRoll:
         self.scroll_x = 0
         # Start scrolled to typical drum range (MIDI notes 33-60)
         self.scroll_y = (127 - (SAMPLER_DEFAULT_START + 15)) * DRUM_ROW_HEIGHT
-        self.zoom_x = 0.537      # Horizontal zoom (pixels per tick)
+        self._zoom_step = 0
+        self.zoom_x = ZOOM_BASE  # Horizontal zoom (pixels per tick)
 
         # Editing state
         self.is_dragging = False
@@ -64,8 +216,14 @@ class DrumRoll:
 
         # Mock song data
         self.song_length_ticks = TPQN * 4 * 8  # 8 measures
+        # (song length, tick of every bar line) - rebuilt when the song length changes
+        self._measure_ticks: Tuple[int, List[int]] = (-1, [])
         self.notes: List[MockNote] = self._create_mock_drum_pattern()
 
+        # Hit arrays for drawing: (source notes list, HIT_DTYPE array)
+        # Rebuilt lazily after _invalidate_note_index() or when self.notes is replaced
+        self._note_index: Optional[Tuple[List[MockNote], np.ndarray]] = None
+
         # Pad names (common drum kit mapping)
         self.pad_names = {
             36: "Bass Drum",
@@ -85,6 +243,42 @@ class DrumRoll:
         self.canvas_id = None
         self.drawlist_id = None
 
+        # Pad row background texture (created on first draw, refilled on size/scroll change)
+        self._texture_registry_id = None
+        self._pad_row_texture_id = None
+        self._pad_row_buffer: Optional[np.ndarray] = None
+        self._pad_row_key: Optional[Tuple[int, int, float]] = None
+
+        # Drum hit texture (all visible hits composited on the CPU, blitted as one image)
+        # _hits_key: (hit array, static key) the texture was last filled for
+        self._hits_texture_id = None
+        self._hits_buffer: Optional[np.ndarray] = None
+        self._hits_key: Optional[Tuple[np.ndarray, Tuple]] = None
+
+        # Draw layers: static (pad rows + grid) is only rebuilt when the view changes,
+        # dynamic (hits, ghosts, playhead) is rebuilt on every draw
+        self._static_layer_id = None
+        self._dynamic_layer_id = None
+        self._static_key: Optional[Tuple] = None
+
+        # Screen y of each pitch's row top, refreshed with the static layer
+        self._row_y = (127 - np.arange(128)) * DRUM_ROW_HEIGHT - self.scroll_y
+
+        # Pad name labels: one draw node built once, scrolled by a translation transform
+        self._label_node_id = None
+        self._label_scroll_y: Optional[float] = None
+
+        # Playhead line (created once, then moved with configure_item)
+        self._playhead_id = None
+
+        # Input handlers only mutate state and flag a redraw; _on_frame renders once per frame
+        # Wheel input is accumulated between frames and applied by _on_frame
+        self._pending_zoom_steps = 0
+        self._pending_scroll_x = 0.0
+        self._dirty = False            # Full draw() needed
+        self._playhead_dirty = False   # Only the playhead moved
+        self._scheduled_frame = -1     # Frame _on_frame is registered for (-1 = none)
+
     def _create_mock_drum_pattern(self) -> List[MockNote]:
         """Create a simple 4/4 drum pattern for testing."""
         pattern = []
@@ -96,15 +290,35 @@ class DrumRoll:
         pattern.append(MockNote(note=38, start=1.0, duration=0.1, velocity=100))
         pattern.append(MockNote(note=38, start=3.0, duration=0.1, velocity=95))
 
-        # Hi-hats on 8th notes
-        for beat in [0.0, 0.5, 1.0, 1.5, 2.0, 2.5, 3.0, 3.5]:
-            vel = 90 if beat % 1.0 == 0 else 70  # Accented on beats
-            pattern.append(MockNote(note=42, start=beat, duration=0.05, velocity=vel))
+        # Hi-hats on 8th notes (accented on beats)
+        pattern.extend(
+            MockNote(note=42, start=beat, duration=0.05, velocity=90 if beat % 1.0 == 0 else 70)
+            for beat in (0.0, 0.5, 1.0, 1.5, 2.0, 2.5, 3.0, 3.5)
+        )
 
         return pattern
 
+    def _invalidate_note_index(self):
+        """Mark the hit arrays stale (call after any change to notes or their selection)."""
+        self._note_index = None
+
+    def _get_note_array(self) -> np.ndarray:
+        """Get all hits as a HIT_DTYPE structured array."""
+        cached = self._note_index
+        if cached is not None and cached[0] is self.notes:
+            return cached[1]
+
+        hits = np.empty(len(self.notes), dtype=HIT_DTYPE)
+        hits['tick'] = [note.start * TPQN for note in self.notes]
+        hits['pitch'] = [note.note for note in self.notes]
+        hits['vel'] = [note.velocity for note in self.notes]
+        hits['sel'] = [note.selected for note in self.notes]
+
+        self._note_index = (self.notes, hits)
+        return hits
+
     def get_coords(self, tick: float, pitch: int) -> Tuple[float, float]:
-        """Convert tick/pitch to screen coordinates."""
+        """Convert tick/pitch to screen coordinates (drawing code inlines this)."""
         x = (tick - self.scroll_x) * self.zoom_x
         y = (127 - pitch) * DRUM_ROW_HEIGHT - self.scroll_y
         return x, y
@@ -122,21 +336,7 @@ class DrumRoll:
 
     def _get_grid_spacing(self) -> Tuple[int, int]:
         """Calculate grid spacing based on zoom level."""
-        if self.zoom_x < 0.25:
-            grid_spacing = TPQN * 4  # Whole notes
-        elif self.zoom_x < 0.4:
-            grid_spacing = TPQN * 2  # Half notes
-        elif self.zoom_x < 0.7:
-            grid_spacing = TPQN      # Quarter notes
-        elif self.zoom_x < 1.2:
-            grid_spacing = TPQN // 2  # 8th notes
-        elif self.zoom_x < 2.0:
-            grid_spacing = TPQN // 4  # 16th notes
-        elif self.zoom_x < 3.5:
-            grid_spacing = TPQN // 8  # 32nd notes
-        else:
-            grid_spacing = TPQN // 16  # 64th notes
-
+        grid_spacing = _GRID_SPACINGS[bisect_right(_ZOOM_THRESHOLDS, self.zoom_x)]
         triplet_spacing = grid_spacing // 3 if self.show_triplet_grid else grid_spacing
         return grid_spacing, triplet_spacing
 
@@ -145,150 +345,301 @@ class DrumRoll:
         if not self.drawlist_id:
             return
 
-        dpg.draw_rectangle(
-            (0, 0), (self.width, self.height),
-            color=(0, 0, 0, 0),
-            fill=(15, 15, 20, 255),
-            parent=self.drawlist_id
-        )
+        if self._static_layer_id is None:
+            self._static_layer_id = dpg.add_draw_layer(parent=self.drawlist_id)
+            self._label_node_id = dpg.add_draw_node(parent=self.drawlist_id)
+            self._build_pad_labels()
+            self._dynamic_layer_id = dpg.add_draw_layer(parent=self.drawlist_id)
+            self._playhead_id = dpg.draw_line(
+                (0, 0), (0, self.height),
+                color=(255, 80, 80, 255),
+                thickness=2,
+                parent=self.drawlist_id,
+                show=False
+            )
+
+        static_key = (self.width, self.height, self.scroll_x, self.scroll_y, self.zoom_x,
+                      self.show_triplet_grid, self.song_length_ticks)
+        if static_key != self._static_key:
+            self._row_y = (127 - np.arange(128)) * DRUM_ROW_HEIGHT - self.scroll_y
+            self._draw_static()
+            self._static_key = static_key
+
+        self._draw_dynamic()
+        self._draw_playhead()
 
+    def _draw_static(self):
+        """Rebuild the static layer (pad rows and grid lines)."""
+        dpg.delete_item(self._static_layer_id, children_only=True)
         self._draw_pad_rows()
         self._draw_grid_lines()
+        self._scroll_pad_labels()
+
+    def _build_pad_labels(self):
+        """Draw every pad name once, at its unscrolled row position."""
+        dpg.delete_item(self._label_node_id, children_only=True)
+        for pitch, name in self.pad_names.items():
+            dpg.draw_text(
+                (4, (127 - pitch) * DRUM_ROW_HEIGHT + 3), f"{pitch}: {name}",
+                color=(140, 140, 150, 255),
+                size=12,
+                parent=self._label_node_id
+            )
+        self._label_scroll_y = None
+
+    def _scroll_pad_labels(self):
+        """Follow the vertical scroll by re-translating the label node."""
+        if self.scroll_y != self._label_scroll_y:
+            dpg.apply_transform(
+                self._label_node_id,
+                dpg.create_translation_matrix([0, -self.scroll_y])
+            )
+            self._label_scroll_y = self.scroll_y
+
+    def _draw_dynamic(self):
+        """Rebuild the dynamic layer (hits and ghost notes)."""
+        dpg.delete_item(self._dynamic_layer_id, children_only=True)
         self._draw_drum_hits()
-        self._draw_ghost_notes()
-        self._draw_playhead()
+        if self.is_dragging and self.ghost_notes:
+            self._draw_ghost_notes()
+
+    def _get_visible_pitch_range(self) -> Tuple[int, int]:
+        """Get the (lowest, highest) pitch with a row in the viewport."""
+        top_pitch = 127 - int(self.scroll_y // DRUM_ROW_HEIGHT)
+        bot_pitch = top_pitch - (self.height // DRUM_ROW_HEIGHT) - 1
+        return max(0, min(127, bot_pitch)), max(0, min(127, top_pitch))
 
     def _draw_pad_rows(self):
-        """Draw alternating pad rows with labels."""
-        for pitch in range(128):
-            x, y = self.get_coords(0, pitch)
-
-            # Only draw visible rows
-            if -DRUM_ROW_HEIGHT <= y <= self.height:
-                # Alternating colors for better visibility
-                bg_color = (20, 20, 25, 255) if pitch % 2 == 0 else (15, 15, 18, 255)
-
-                dpg.draw_rectangle(
-                    (0, y), (self.width, y + DRUM_ROW_HEIGHT),
-                    fill=bg_color,
-                    parent=self.drawlist_id
-                )
+        """Draw the canvas background and alternating pad rows as one image."""
+        self._update_pad_row_texture()
+        dpg.draw_image(
+            self._pad_row_texture_id,
+            (0, 0), (self.width, self.height),
+            parent=self._static_layer_id
+        )
 
-                # Row divider line
-                dpg.draw_line(
-                    (0, y), (self.width, y),
-                    color=(30, 30, 35, 255),
-                    thickness=1,
-                    parent=self.drawlist_id
-                )
+    def _update_pad_row_texture(self):
+        """Refill the pad row texture if the view size or vertical scroll changed."""
+        key = (self.width, self.height, self.scroll_y)
+        if key == self._pad_row_key:
+            return
+
+        width, height = self.width, self.height
+        if self._pad_row_key is None or self._pad_row_key[:2] != (width, height):
+            self._pad_row_texture_id, self._pad_row_buffer = self._create_raw_texture(
+                self._pad_row_texture_id)
+
+        # One color per pixel row, then broadcast across the width
+        abs_y = np.arange(height) + int(self.scroll_y)
+        pitches = 127 - abs_y // DRUM_ROW_HEIGHT
+        row_colors = np.where((pitches % 2 == 0)[:, None], PAD_ROW_EVEN_COLOR, PAD_ROW_ODD_COLOR)
+        row_colors[abs_y % DRUM_ROW_HEIGHT == 0] = PAD_ROW_DIVIDER_COLOR
+        row_colors[(pitches < 0) | (pitches > 127)] = CANVAS_BG_COLOR
+
+        self._pad_row_buffer[:] = row_colors[:, None, :]
+        dpg.set_value(self._pad_row_texture_id, self._pad_row_buffer.reshape(-1))
+        self._pad_row_key = key
+
+    def _create_raw_texture(self, old_texture_id=None) -> Tuple[int, np.ndarray]:
+        """
+        Create a canvas-sized float RGBA raw texture, replacing old_texture_id.
+
+        Returns:
+            (texture id, (height, width, 4) float32 buffer backing the texture)
+        """
+        if self._texture_registry_id is None:
+            self._texture_registry_id = dpg.add_texture_registry()
+        if old_texture_id is not None:
+            dpg.delete_item(old_texture_id)
+
+        buffer = np.zeros((self.height, self.width, 4), dtype=np.float32)
+        texture_id = dpg.add_raw_texture(
+            self.width, self.height, buffer.reshape(-1),
+            format=dpg.mvFormat_Float_rgba,
+            parent=self._texture_registry_id
+        )
+        return texture_id, buffer
 
-                # Draw pad name label if it has one
-                if pitch in self.pad_names:
-                    label = f"{pitch}: {self.pad_names[pitch]}"
-                    # Note: DearPyGui drawlist doesn't have text rendering
-                    # This would need a separate text overlay or texture rendering
-                    # For now, we skip labels in the drawlist
+    def _get_visible_tick_range(self) -> Tuple[int, int]:
+        """Get the (first, last) tick inside the viewport, clamped to the song."""
+        t_start = max(0, int(self.scroll_x))
+        t_end = min(self.song_length_ticks, int(self.scroll_x + self.width / self.zoom_x) + 1)
+        return t_start, t_end
 
     def _draw_grid_lines(self):
-        """Draw vertical grid lines."""
+        """Draw vertical grid lines (one polyline per line style)."""
         grid_spacing, triplet_spacing = self._get_grid_spacing()
         measure_spacing = TPQN * 4
 
-        # Triplet lines (faint)
-        if self.show_triplet_grid:
-            for t in range(0, self.song_length_ticks, triplet_spacing):
-                if t % grid_spacing == 0 or t % measure_spacing == 0:
-                    continue
-
-                x, _ = self.get_coords(t, 0)
-                if 0 <= x <= self.width:
-                    dpg.draw_line(
-                        (x, 0), (x, self.height),
-                        color=(25, 25, 30, 255),
-                        thickness=1,
-                        parent=self.drawlist_id
-                    )
+        # Only walk the ticks inside the viewport
+        t_start, t_end = self._get_visible_tick_range()
+
+        # Triplet lines (faint; dropped when zoomed out past LOD_ZOOM)
+        if self.show_triplet_grid and self.zoom_x >= LOD_ZOOM:
+            first = (t_start // triplet_spacing) * triplet_spacing
+            self._draw_vertical_lines(
+                [t for t in range(first, t_end, triplet_spacing)
+                 if t % grid_spacing != 0 and t % measure_spacing != 0],
+                color=(25, 25, 30, 255), thickness=1
+            )
 
         # Binary grid lines
-        for t in range(0, self.song_length_ticks, grid_spacing):
-            if t % measure_spacing == 0:
-                continue
+        first = (t_start // grid_spacing) * grid_spacing
+        self._draw_vertical_lines(
+            [t for t in range(first, t_end, grid_spacing) if t % measure_spacing != 0],
+            color=(35, 35, 40, 255), thickness=1
+        )
 
-            x, _ = self.get_coords(t, 0)
-            if 0 <= x <= self.width:
-                dpg.draw_line(
-                    (x, 0), (x, self.height),
-                    color=(35, 35, 40, 255),
-                    thickness=1,
-                    parent=self.drawlist_id
-                )
+        # Measure lines (bright, including the closing bar line)
+        if self._measure_ticks[0] != self.song_length_ticks:
+            self._measure_ticks = (self.song_length_ticks,
+                                   list(range(0, self.song_length_ticks + 1, measure_spacing)))
+        measure_ticks = self._measure_ticks[1]
+        self._draw_vertical_lines(
+            measure_ticks[bisect_left(measure_ticks, t_start):bisect_right(measure_ticks, t_end)],
+            color=(90, 90, 100, 255), thickness=2
+        )
 
-        # Measure lines (bright)
-        for bar in range(0, self.song_length_ticks // measure_spacing + 1):
-            t = bar * measure_spacing
-            x, _ = self.get_coords(t, 0)
-            if 0 <= x <= self.width:
-                dpg.draw_line(
-                    (x, 0), (x, self.height),
-                    color=(90, 90, 100, 255),
-                    thickness=2,
-                    parent=self.drawlist_id
-                )
+    def _draw_vertical_lines(self, ticks, color: Tuple[int, int, int, int], thickness: int):
+        """
+        Draw full-height lines at the given ticks as a single polyline item.
+
+        The polyline zig-zags between points just above and just below the
+        canvas, so the connecting segments fall outside the drawlist's clip
+        rect and only the vertical lines are visible.
+        """
+        top = -(thickness + 1)
+        bottom = self.height + thickness + 1
+        scroll_x, zoom_x = self.scroll_x, self.zoom_x
+
+        points = []
+        for i, t in enumerate(ticks):
+            x = (t - scroll_x) * zoom_x
+            if i % 2 == 0:
+                points.append((x, top))
+                points.append((x, bottom))
+            else:
+                points.append((x, bottom))
+                points.append((x, top))
+
+        if points:
+            dpg.draw_polyline(points, color=color, thickness=thickness, parent=self._static_layer_id)
 
     def _draw_drum_hits(self):
-        """Draw drum hits as fixed-width markers."""
-        for note in self.notes:
-            if note.start * TPQN >= self.song_length_ticks:
-                continue
+        """Draw drum hits as fixed-width markers (one image of all visible hits)."""
+        hits = self._get_note_array()
+        cached = self._hits_key
+        if cached is None or cached[0] is not hits or cached[1] != self._static_key:
+            self._update_hits_texture(hits)
+            self._hits_key = (hits, self._static_key)
+
+        dpg.draw_image(
+            self._hits_texture_id,
+            (0, 0), (self.width, self.height),
+            parent=self._dynamic_layer_id
+        )
 
-            nx, ny = self.get_coords(note.start * TPQN, note.note)
+    def _update_hits_texture(self, hits: np.ndarray):
+        """Composite every visible hit into the hits texture."""
+        if self._hits_buffer is None or self._hits_buffer.shape[:2] != (self.height, self.width):
+            self._hits_texture_id, self._hits_buffer = self._create_raw_texture(self._hits_texture_id)
 
-            # Only draw if visible
-            if 0 <= nx <= self.width and -DRUM_ROW_HEIGHT <= ny <= self.height:
-                # Drum hits are circles/diamonds instead of rectangles
-                center_x = nx + DRUM_NOTE_WIDTH / 2
-                center_y = ny + DRUM_ROW_HEIGHT / 2
+        buffer = self._hits_buffer
+        buffer.fill(0.0)
+        bot_pitch, top_pitch = self._get_visible_pitch_range()
 
-                # Velocity affects size and brightness
-                vel_factor = note.velocity / 127.0
-                size = DRUM_NOTE_WIDTH * 0.3 * (0.5 + vel_factor * 0.5)
-                brightness = int(150 + vel_factor * 105)
+        if self.zoom_x < LOD_ZOOM:
+            self._composite_hit_density(buffer, hits, bot_pitch, top_pitch)
+            dpg.set_value(self._hits_texture_id, buffer.reshape(-1))
+            return
 
-                # Color based on selection
-                if note.selected:
-                    color = (255, 180, 80, 255)  # Orange for selected
-                else:
-                    color = (brightness, brightness, brightness, 255)
+        # Tick window of hits whose sprite overlaps the canvas (computed once, not per hit);
+        # hits at or past the song end are never drawn
+        zoom_x = float(self.zoom_x)
+        reach = DRUM_NOTE_WIDTH / 2 + HIT_SPRITE_HALF
+        t_start = self.scroll_x - reach / zoom_x
+        t_end = min(self.scroll_x + (self.width - DRUM_NOTE_WIDTH / 2 + HIT_SPRITE_HALF) / zoom_x,
+                    np.nextafter(self.song_length_ticks, 0))
+
+        visuals = _compute_hit_visuals(
+            hits['tick'], hits['pitch'], hits['vel'], hits['sel'], self._row_y,
+            float(self.scroll_x), zoom_x, float(t_start), float(t_end), bot_pitch, top_pitch
+        )
 
-                # Draw as a circle
-                dpg.draw_circle(
-                    (center_x, center_y),
-                    size,
-                    fill=color,
-                    color=color,
-                    parent=self.drawlist_id
-                )
+        for center_x, center_y, variant, bucket in zip(*(v.tolist() for v in visuals)):
+            self._splat(buffer, _HIT_ATLAS[variant, bucket], center_x, center_y)
+
+        dpg.set_value(self._hits_texture_id, buffer.reshape(-1))
+
+    def _composite_hit_density(self, buffer: np.ndarray, hits: np.ndarray,
+                               bot_pitch: int, top_pitch: int):
+        """
+        Fill the buffer with one velocity-density bar per (pitch row, pixel column).
+
+        Zoomed far out, many hits share a pixel column and their sprites would
+        just overlap; summing velocities per column keeps the cost independent
+        of the hit count. Cells holding a selected hit are tinted with the
+        selection color, since Delete and Ctrl+A still act on them.
+        """
+        height, width = buffer.shape[:2]
+        ticks = hits['tick']
+        pitches = hits['pitch']
+        t_end = min(self.scroll_x + width / self.zoom_x, np.nextafter(self.song_length_ticks, 0))
+        mask = ((ticks >= self.scroll_x) & (ticks <= t_end) &
+                (pitches >= bot_pitch) & (pitches <= top_pitch))
+        if not mask.any():
+            return
 
-                # Velocity indicator (ring around circle)
-                if vel_factor > 0.8:  # High velocity
-                    dpg.draw_circle(
-                        (center_x, center_y),
-                        size + 2,
-                        color=(255, 255, 100, 200),
-                        thickness=1,
-                        parent=self.drawlist_id
-                    )
+        # Sum velocities per cell (row 0 = top_pitch)
+        num_rows = top_pitch - bot_pitch + 1
+        cols = np.minimum(((ticks[mask] - self.scroll_x) * self.zoom_x).astype(np.int64), width - 1)
+        rows = top_pitch - pitches[mask].astype(np.int64)
+        cells = rows * width + cols
+        density = np.bincount(cells, weights=hits['vel'][mask],
+                              minlength=num_rows * width).reshape(num_rows, width)
+        intensity = np.minimum(density / 127.0, 1.0).astype(np.float32)
+
+        # Cells containing at least one selected hit
+        selected = np.bincount(cells, weights=hits['sel'][mask].astype(np.float64),
+                               minlength=num_rows * width).reshape(num_rows, width) > 0
+
+        # Expand cells to pixel rows, leaving a margin at the top and bottom of each pad row
+        abs_y = np.arange(height) + int(self.scroll_y)
+        row_of_y = top_pitch - (127 - abs_y // DRUM_ROW_HEIGHT)
+        y_in_row = abs_y % DRUM_ROW_HEIGHT
+        in_bar = ((row_of_y >= 0) & (row_of_y < num_rows) &
+                  (y_in_row >= LOD_BAR_MARGIN) & (y_in_row < DRUM_ROW_HEIGHT - LOD_BAR_MARGIN))
+
+        cell_row = np.clip(row_of_y, 0, num_rows - 1)
+        if selected.any():
+            intensity = np.where(selected, np.maximum(intensity, LOD_SELECTED_MIN_ALPHA), intensity)
+            buffer[..., :3] = np.where(selected[cell_row][..., None], HIT_SELECTED_COLOR[:3], LOD_BAR_COLOR)
+        else:
+            buffer[..., :3] = LOD_BAR_COLOR
+        buffer[..., 3] = intensity[cell_row] * in_bar[:, None]
+
+    @staticmethod
+    def _splat(buffer: np.ndarray, sprite: np.ndarray, cx: int, cy: int):
+        """Blend an RGBA sprite centered at (cx, cy) into the buffer, clipped to its edges."""
+        half = sprite.shape[0] // 2
+        height, width = buffer.shape[:2]
+        x0, y0 = max(cx - half, 0), max(cy - half, 0)
+        x1, y1 = min(cx + half + 1, width), min(cy + half + 1, height)
+        if x0 >= x1 or y0 >= y1:
+            return
+
+        src = sprite[y0 - cy + half:y1 - cy + half, x0 - cx + half:x1 - cx + half]
+        _blend_rgba(buffer[y0:y1, x0:x1], src[..., :3], src[..., 3:])
 
     def _draw_ghost_notes(self):
         """Draw preview hits during drag operations."""
-        if not self.ghost_notes:
-            return
-
+        scroll_x, zoom_x, row_y = self.scroll_x, self.zoom_x, self._row_y
         for ghost in self.ghost_notes:
             if ghost['tick'] >= self.song_length_ticks:
                 continue
 
-            gx, gy = self.get_coords(ghost['tick'], ghost['pitch'])
+            gx = (ghost['tick'] - scroll_x) * zoom_x
+            gy = row_y[ghost['pitch']]
 
             if 0 <= gx <= self.width:
                 center_x = gx + DRUM_NOTE_WIDTH / 2
@@ -299,28 +650,34 @@ class DrumRoll:
                     DRUM_NOTE_WIDTH * 0.3,
                     fill=(100, 100, 100, 128),
                     color=(150, 150, 150, 128),
-                    parent=self.drawlist_id
+                    parent=self._dynamic_layer_id
                 )
 
     def _draw_playhead(self):
-        """Draw playback position."""
-        if self.current_tick > 0:
-            px, _ = self.get_coords(self.current_tick, 0)
-            if 0 <= px <= self.width:
-                dpg.draw_line(
-                    (px, 0), (px, self.height),
-                    color=(255, 80, 80, 255),
-                    thickness=2,
-                    parent=self.drawlist_id
-                )
+        """Move the playhead line to the playback position (hidden when off-screen)."""
+        if self._playhead_id is None:
+            return
+
+        px = (self.current_tick - self.scroll_x) * self.zoom_x
+        if self.current_tick > 0 and 0 <= px <= self.width:
+            dpg.configure_item(self._playhead_id, p1=(px, 0), p2=(px, self.height), show=True)
+        else:
+            dpg.hide_item(self._playhead_id)
+
+    def _set_zoom_step(self, step: int):
+        """Set the zoom step (clamped) and derive zoom_x from it."""
+        self._zoom_step = max(ZOOM_MIN_STEP, min(ZOOM_MAX_STEP, step))
+        self.zoom_x = ZOOM_BASE * ZOOM_FACTOR ** self._zoom_step
 
     def zoom_in(self):
         """Zoom in horizontally."""
-        self.zoom_x = min(self.zoom_x * 1.2, 10.0)
+        self._set_zoom_step(self._zoom_step + 1)
+        self._request_redraw()
 
     def zoom_out(self):
         """Zoom out horizontally."""
-        self.zoom_x = max(self.zoom_x / 1.2, 0.1)
+        self._set_zoom_step(self._zoom_step - 1)
+        self._request_redraw()
 
     def snap_tick_to_grid(self, tick: float) -> float:
         """Snap tick value to current grid quantization."""
@@ -354,7 +711,8 @@ class DrumRoll:
             selected=False
         )
         self.notes.append(new_note)
-        self.draw()
+        self._invalidate_note_index()
+        self._request_redraw()
 
     def _handle_canvas_right_click(self, sender, app_data):
         """Handle right-click on canvas (select/deselect drum hit)."""
@@ -375,7 +733,8 @@ class DrumRoll:
             if (note.note == pitch and
                 abs(tick - note_tick) < DRUM_NOTE_WIDTH / self.zoom_x):
                 note.selected = not note.selected
-                self.draw()
+                self._invalidate_note_index()
+                self._request_redraw()
                 return
 
     def _handle_drag_start(self, sender, app_data):
@@ -398,6 +757,7 @@ class DrumRoll:
                 self.drag_start_pos = (tick, pitch)
                 self.current_note = note
                 note.selected = True
+                self._invalidate_note_index()
                 break
 
     def _handle_drag(self, sender, app_data):
@@ -416,9 +776,10 @@ class DrumRoll:
 
         # Update note position
         self.current_note.start = snapped_tick / TPQN
+        self._invalidate_note_index()
 
         # Redraw
-        self.draw()
+        self._request_redraw()
 
     def _handle_drag_end(self, sender, app_data):
         """Called when drag ends."""
@@ -426,18 +787,19 @@ class DrumRoll:
             self.is_dragging = False
             self.drag_start_pos = None
             self.current_note = None
-            self.draw()
+            self._request_redraw()
 
     def _delete_selected_notes(self, sender=None, app_data=None):
         """Delete all selected drum hits (Delete key)."""
         self.notes = [n for n in self.notes if not n.selected]
-        self.draw()
+        self._request_redraw()
 
     def _deselect_all_notes(self, sender=None, app_data=None):
         """Deselect all drum hits (Escape key)."""
         for note in self.notes:
             note.selected = False
-        self.draw()
+        self._invalidate_note_index()
+        self._request_redraw()
 
     def _toggle_playback(self, sender=None, app_data=None):
         """Toggle playback (Spacebar)."""
@@ -449,7 +811,8 @@ class DrumRoll:
         if dpg.is_key_down(dpg.mvKey_Control):
             for note in self.notes:
                 note.selected = True
-            self.draw()
+            self._invalidate_note_index()
+            self._request_redraw()
 
     def create_window(self, tag: str = "drum_roll_window"):
         """Create the DearPyGui window."""
@@ -496,28 +859,57 @@ class DrumRoll:
         self.draw()
 
     def _handle_scroll(self, sender, app_data):
-        """Handle mouse wheel for horizontal scroll or zoom."""
+        """Handle mouse wheel for horizontal scroll or zoom (applied on the next frame)."""
         scroll_delta = app_data  # Positive = scroll up, negative = scroll down
 
         # Horizontal scroll (or zoom if Ctrl held)
         if dpg.is_key_down(dpg.mvKey_Control):
-            # Zoom
-            if scroll_delta > 0:
-                self.zoom_in()
-            else:
-                self.zoom_out()
+            self._pending_zoom_steps += 1 if scroll_delta > 0 else -1
         else:
-            # Horizontal scroll
-            self.scroll_x -= scroll_delta * 50
-            self.scroll_x = max(0, self.scroll_x)
-        self.draw()
+            self._pending_scroll_x -= scroll_delta * 50
+
+        # Coalesce a burst of wheel events into one redraw
+        self._request_redraw()
+
+    def _request_redraw(self, playhead_only: bool = False):
+        """Flag a redraw and make sure _on_frame runs on the next frame."""
+        if playhead_only:
+            self._playhead_dirty = True
+        else:
+            self._dirty = True
+
+        # Re-arm once the scheduled frame has passed: a callback registered too late,
+        # or replaced by another one for the same frame, never fires
+        frame = dpg.get_frame_count()
+        if frame > self._scheduled_frame:
+            self._scheduled_frame = frame + 1
+            dpg.set_frame_callback(self._scheduled_frame, self._on_frame)
+
+    def _on_frame(self, sender=None, app_data=None):
+        """Apply accumulated input and render once for this frame."""
+        self._scheduled_frame = -1
+
+        if self._dirty:
+            if self._pending_zoom_steps:
+                self._set_zoom_step(self._zoom_step + self._pending_zoom_steps)
+            if self._pending_scroll_x:
+                self.scroll_x = max(0, self.scroll_x + self._pending_scroll_x)
+            self._pending_zoom_steps = 0
+            self._pending_scroll_x = 0.0
+            self._dirty = False
+            self._playhead_dirty = False
+            self.draw()  # Also places the playhead
+        elif self._playhead_dirty:
+            self._playhead_dirty = False
+            self._draw_playhead()
 
     def update(self, current_tick: int):
-        """Update playhead and redraw."""
-        self.current_tick = current_tick
-        if self.drawlist_id:
-            dpg.delete_item(self.drawlist_id, children_only=True)
-            self.draw()
+        """Update playhead (moved on the next frame)."""
+        if current_tick != self.current_tick:
+            self.current_tick = current_tick
+            self._request_redraw(playhead_only=True)
+        elif (self._dirty or self._playhead_dirty) and dpg.get_frame_count() > self._scheduled_frame:
+            self._on_frame()  # Scheduled callback was missed
 
 
 def create_drum_roll_demo():
@@ -10,8 +10,13 @@ Improvements based on user feedback:
 - Blooper4-inspired appearance
 """
 
+import colorsys
+from bisect import bisect_left, bisect_right
 import dearpygui.dearpygui as dpg
-from typing import List, Tuple, Optional, Dict, Any, Callable
+import numpy as np
+from functools import lru_cache
+from numba import jit
+from typing import List, Tuple, Optional, Dict, Any, Callable, Sequence
 from dataclasses import dataclass, field, replace
 from core.models import Note, Song
 
@@ -39,10 +44,195 @@ class PianoRollTheme:
     playhead_color: List[int] = field(default_factory=lambda: [255, 80, 80])
     grid_line_thickness: int = 1  # Thin lines
 
+    def __post_init__(self):
+        self.update_rgba()
+
+    def update_rgba(self):
+        """Rebuild the RGBA tuples passed to draw calls (call after changing a color)."""
+        self.bg_rgba = tuple(self.bg_color) + (255,)
+        self.bg_black_key_rgba = tuple(self.bg_color_black_key) + (255,)
+        self.grid_line_rgba = tuple(self.grid_line_color) + (255,)
+        self.triplet_line_rgba = tuple(self.triplet_line_color) + (255,)
+        self.measure_line_rgba = tuple(self.measure_line_color) + (255,)
+        self.row_divider_rgba = tuple(self.row_divider_color) + (255,)
+        self.playhead_rgba = tuple(self.playhead_color) + (255,)
+
+        # Octave-colored note draw colors, indexed by octave * 2 + selected
+        self.note_palette = _build_note_palette(self.note_colors, self.selected_note_brightness, 255)
+
+        # Row fill per pitch: None for white keys (the background fill shows through)
+        self.row_fill_rgba = tuple(
+            self.bg_black_key_rgba if (pitch % 12) in (1, 3, 6, 8, 10) else None
+            for pitch in range(128)
+        )
+
 
 # Constants
 TPQN = 480  # Ticks per quarter note
 GRID_HEIGHT = 12  # Pixel height per MIDI note row
+CHANNEL_OCTAVES = 11  # Octaves 0-10 get their own lightness for channel-colored notes
+
+
+def _build_note_palette(octave_colors: Sequence[Sequence[int]], selected_boost: int,
+                        alpha: int) -> Tuple[Tuple[Tuple[int, ...], ...], ...]:
+    """
+    Build note draw colors for every octave, unselected and selected.
+
+    Args:
+        octave_colors: RGB color per octave
+        selected_boost: Amount added to each channel of selected notes
+        alpha: Note fill transparency (0-255)
+
+    Returns:
+        (fill_rgba, outline_rgba, velocity_bar_rgba) tuples indexed by octave * 2 + selected
+    """
+    palette = []
+    for rgb in octave_colors:
+        for selected in (False, True):
+            c = [min(v + selected_boost, 255) for v in rgb] if selected else list(rgb)
+            palette.append((
+                tuple(c) + (alpha,),
+                tuple(min(v + 40, 255) for v in c) + (255,),
+                tuple(min(v + 60, 255) for v in c) + (220,),
+            ))
+    return tuple(palette)
+
+
+@lru_cache(maxsize=64)
+def _channel_note_palette(rgb: Tuple[int, int, int], alpha: int) -> Tuple[Tuple[Tuple[int, ...], ...], ...]:
+    """
+    Note palette for a channel color with octave-based lightness (memoized per color).
+
+    Octave 0 (lowest) = almost black, octave 10 (highest) = almost white.
+    """
+    # Convert channel color to HSV
+    h, s, _ = colorsys.rgb_to_hsv(rgb[0] / 255.0, rgb[1] / 255.0, rgb[2] / 255.0)
+
+    octave_colors = []
+    for octave in range(CHANNEL_OCTAVES):
+        # Map octave to value (brightness): 0 -> 0.15, 10 -> 0.95
+        v = 0.15 + (octave / 10.0) * 0.80
+
+        # Keep saturation but slightly reduce for very dark/light notes
+        if v < 0.3:
+            octave_s = s * 0.7  # Desaturate dark notes
+        elif v > 0.85:
+            octave_s = s * 0.6  # Desaturate bright notes
+        else:
+            octave_s = s
+
+        # Convert back to RGB
+        r, g, b = colorsys.hsv_to_rgb(h, octave_s, v)
+        octave_colors.append((int(r * 255), int(g * 255), int(b * 255)))
+
+    return _build_note_palette(octave_colors, 50, alpha)
+
+
+@jit(nopython=True, cache=True)
+def _compute_grid_xs(ticks, min_zoom, scroll_x, zoom_x, width):
+    """
+    Screen x of the grid lines visible at this scroll/zoom (JIT-compiled).
+
+    Args:
+        ticks: Line positions in ticks
+        min_zoom: Per-line zoom_x below which the line is hidden
+        scroll_x, zoom_x: Horizontal view
+        width: Canvas width
+
+    Returns:
+        x positions of the visible lines
+    """
+    n = len(ticks)
+    xs = np.empty(n, dtype=np.float64)
+
+    count = 0
+    for i in range(n):
+        if min_zoom[i] > zoom_x:
+            continue
+        x = (ticks[i] - scroll_x) * zoom_x
+        if 0 <= x <= width:
+            xs[count] = x
+            count += 1
+
+    return xs[:count]
+
+
+@jit(nopython=True, cache=True)
+def _compute_note_rects(starts, durations, pitches, song_length_ticks,
+                        scroll_x, scroll_y, zoom_x, row_h, width, height):
+    """
+    Cull notes to the viewport and clip them at the left edge (JIT-compiled).
+
+    Args:
+        starts, durations, pitches: Note fields (NoteArray columns, in beats)
+        song_length_ticks: Notes starting at or past the song end are hidden
+        scroll_x, scroll_y, zoom_x, row_h: View
+        width, height: Canvas size
+
+    Returns:
+        (indices, x, width, y) arrays for the visible notes
+    """
+    n = len(starts)
+    indices = np.empty(n, dtype=np.int64)
+    xs = np.empty(n, dtype=np.float64)
+    widths = np.empty(n, dtype=np.float64)
+    ys = np.empty(n, dtype=np.float64)
+
+    count = 0
+    for i in range(n):
+        start_tick = starts[i] * TPQN
+        if start_tick >= song_length_ticks:
+            continue
+
+        nx = (start_tick - scroll_x) * zoom_x
+        nw = durations[i] * TPQN * zoom_x
+        ny = (127 - pitches[i]) * row_h - scroll_y
+        if nx + nw < 0 or nx > width:
+            continue
+        if ny + row_h < 0 or ny > height:
+            continue
+
+        # Visible portion of the note
+        if nx < 0:
+            xs[count] = 0.0
+            widths[count] = min(nw + nx, width)  # nw + nx because nx is negative
+        else:
+            xs[count] = nx
+            widths[count] = min(nw, width - nx)
+        indices[count] = i
+        ys[count] = ny
+        count += 1
+
+    return indices[:count], xs[:count], widths[:count], ys[:count]
+
+
+# Compile (or load the cached kernels) at import rather than on the first redraw
+_compute_grid_xs(np.zeros(1, dtype=np.int64), np.zeros(1), 0.0, 1.0, 1.0)
+_compute_note_rects(np.zeros(1), np.zeros(1), np.zeros(1, dtype=np.int16), 1.0,
+                    0.0, 0.0, 1.0, 1.0, 1.0, 1.0)
+
+
+class NoteArray:
+    """
+    Structure-of-arrays snapshot of a note sequence, for vectorized culling.
+
+    The Note list stays the editing model; a snapshot is rebuilt when it changes.
+    """
+
+    __slots__ = ('pitch', 'start', 'duration', 'velocity', 'release_velocity', 'selected')
+
+    def __init__(self, notes: Sequence[Note]):
+        count = len(notes)
+        self.pitch = np.fromiter((n.note for n in notes), dtype=np.int16, count=count)
+        self.start = np.fromiter((n.start for n in notes), dtype=np.float64, count=count)
+        self.duration = np.fromiter((n.duration for n in notes), dtype=np.float64, count=count)
+        self.velocity = np.fromiter((n.velocity for n in notes), dtype=np.float64, count=count)
+        self.release_velocity = np.fromiter((n.release_velocity for n in notes), dtype=np.float64, count=count)
+        self.selected = np.fromiter((n.selected for n in notes), dtype=bool, count=count)
+
+    def __len__(self) -> int:
+        """Number of notes."""
+        return len(self.pitch)
 
 
 class PianoRoll:
@@ -115,6 +305,7 @@ class PianoRoll:
         # Mock song data
         self.song_length_ticks = TPQN * 4 * 1  # 1 bar (4 beats)
         self.notes: List[Note] = []  # Empty by default (populated when track loads)
+        self._edit_epoch = 0  # Bumped on every real note mutation (not on loads)
 
         # Track-aware display
         self.current_track_index = 0  # 0-15 for single track, 16 for master
@@ -128,6 +319,32 @@ class PianoRoll:
         self.toolbar_window_id = None
         self.color_sidebar_id = None
 
+        # Persistent draw layers (rebuilt only when their dirty flag is set)
+        self._layers_parent = None
+        self._grid_layer = None
+        self._notes_layer = None
+        self._overlay_layer = None
+        self._playhead_layer = None
+        self._markers_layer = None
+        self._playhead_item = None
+        self._dirty = {"grid": True, "notes": True}
+        self._view_key = None
+        self._drawn_epoch = -1
+
+        # Coalesced redraws: input and color-picker events only flag a redraw,
+        # which update() runs at most once per frame
+        self._redraw_pending = False
+
+        # Grid line ticks per (grid_spacing, triplet_spacing), for one song layout
+        self._grid_cache: Dict[Tuple[int, int], Tuple[np.ndarray, ...]] = {}
+        self._grid_cache_source = None
+
+        # id(notes) -> (notes, edit epoch, NoteArray)
+        self._note_arrays: Dict[int, Tuple[Sequence[Note], int, NoteArray]] = {}
+
+        # (notes, edit epoch, per-pitch bins) for hit tests
+        self._pitch_index: Optional[Tuple[List[Note], int, list]] = None
+
     def update_toolbar_state(self, toolbar_state: dict):
         """
         Update Piano Roll state from external NoteDrawToolbar.
@@ -264,6 +481,8 @@ class PianoRoll:
             notes: List of Note objects to load
         """
         self.notes = list(notes)  # Make a copy
+        self._note_arrays = {}
+        self._dirty["notes"] = True
         if self.drawlist_id:
             self.draw()
 
@@ -280,6 +499,8 @@ class PianoRoll:
     def clear_notes(self):
         """Clear all notes (used for new project)."""
         self.notes = []
+        self._note_arrays = {}
+        self._dirty["notes"] = True
         if self.drawlist_id:
             self.draw()
 
@@ -296,7 +517,8 @@ class PianoRoll:
             track_index: 0-15 for single track, 16 for master/arrangement
             notes: Notes for single track mode
             track_color: RGBA color for single track
-            all_tracks_data: List of {notes, color} for arrangement view
+            all_tracks_data: List of {notes, color} for arrangement view (read-only;
+                notes may be the track's own tuple)
             song: Song reference for accessing time signature and measure metadata
         """
         self.current_track_index = track_index
@@ -317,6 +539,11 @@ class PianoRoll:
             self.all_tracks_data = []
             self._current_track_color = track_color  # Store for drawing
 
+        # Song (measures, length) and notes may both have changed
+        self._note_arrays = {}
+        self._dirty["grid"] = True
+        self._dirty["notes"] = True
+
         if self.drawlist_id:
             self.draw()
 
@@ -338,7 +565,7 @@ class PianoRoll:
             self.current_tick = new_tick
             self._last_playhead_tick = new_tick
             if self.drawlist_id:
-                self.draw()
+                self._update_playhead()
 
     def set_playhead_time(self, time_seconds: float, bpm: float):
         """
@@ -361,7 +588,7 @@ class PianoRoll:
             self.current_tick = new_tick
             self._last_playhead_tick = new_tick
             if self.drawlist_id:
-                self._draw_playhead_only()
+                self._update_playhead()
 
     def get_coords(self, tick: float, pitch: int) -> Tuple[float, float]:
         """Convert tick/pitch to screen coordinates."""
@@ -376,6 +603,8 @@ class PianoRoll:
         if current_size != self._last_container_size:
             self._last_container_size = current_size
             self.draw()
+        elif self._redraw_pending:
+            self.draw()
 
     def get_pitch_at(self, y: float) -> int:
         """Convert screen Y coordinate to MIDI pitch."""
@@ -449,8 +678,13 @@ class PianoRoll:
                 return int(rect[0]), int(rect[1])
         return self.width, self.height
 
+    def _request_redraw(self):
+        """Flag a redraw for the next update() (at most one draw per frame)."""
+        self._redraw_pending = True
+
     def draw(self):
         """Main draw function."""
+        self._redraw_pending = False  # A pending frame redraw would repeat this one
         if not self.drawlist_id:
             return
 
@@ -464,40 +698,92 @@ class PianoRoll:
             if dpg.does_item_exist(self.canvas_id):
                 dpg.configure_item(self.canvas_id, width=self.width, height=self.height)
 
-        dpg.delete_item(self.drawlist_id, children_only=True)
+        if self._layers_parent != self.drawlist_id:
+            self._create_layers()
+
+        # Scrolling, zooming or resizing moves every grid line and note
+        view_key = (self.scroll_x, self.scroll_y, self.zoom_x, self.zoom_y,
+                    self.width, self.height, self.song_length_ticks)
+        if view_key != self._view_key:
+            self._view_key = view_key
+            self._dirty["grid"] = True
+            self._dirty["notes"] = True
+        if self._edit_epoch != self._drawn_epoch:
+            self._drawn_epoch = self._edit_epoch
+            self._dirty["notes"] = True
+
+        if self._dirty["grid"]:
+            self._dirty["grid"] = False
+            dpg.delete_item(self._grid_layer, children_only=True)
+
+            # Background
+            dpg.draw_rectangle(
+                (0, 0), (self.width, self.height),
+                fill=self.theme.bg_rgba,
+                parent=self._grid_layer
+            )
 
-        # Background
-        dpg.draw_rectangle(
-            (0, 0), (self.width, self.height),
-            fill=tuple(self.theme.bg_color + [255]),
-            parent=self.drawlist_id
-        )
+            self._draw_background_grid()
+            self._draw_grid_lines()
+            self._draw_row_dividers()
 
-        self._draw_background_grid()
-        self._draw_grid_lines()
-        self._draw_row_dividers()
-        self._draw_notes()
+        if self._dirty["notes"]:
+            self._dirty["notes"] = False
+            dpg.delete_item(self._notes_layer, children_only=True)
+            self._draw_notes()
+
+        # Selection, ghost and loop markers are a handful of items: always rebuilt
+        dpg.delete_item(self._overlay_layer, children_only=True)
         self._draw_bar_selection_highlight()  # Draw bar selection highlight
         self._draw_ghost_note()
-        self._draw_playhead()
+        self._update_playhead()
+        dpg.delete_item(self._markers_layer, children_only=True)
         self._draw_loop_markers()  # Draw loop markers after playhead
 
+    def _create_layers(self):
+        """Create the persistent draw layers (bottom to top) and the playhead line."""
+        dpg.delete_item(self.drawlist_id, children_only=True)
+        self._grid_layer = dpg.add_draw_layer(parent=self.drawlist_id)
+        self._notes_layer = dpg.add_draw_layer(parent=self.drawlist_id)
+        self._overlay_layer = dpg.add_draw_layer(parent=self.drawlist_id)
+        self._playhead_layer = dpg.add_draw_layer(parent=self.drawlist_id)
+        self._markers_layer = dpg.add_draw_layer(parent=self.drawlist_id)
+        self._playhead_item = dpg.draw_line(
+            (0, 0), (0, self.height),
+            color=self.theme.playhead_rgba,
+            thickness=2,
+            show=False,
+            parent=self._playhead_layer
+        )
+        self._layers_parent = self.drawlist_id
+        self._dirty["grid"] = True
+        self._dirty["notes"] = True
+
+    def _get_visible_pitch_range(self) -> Tuple[int, int]:
+        """Get the (lowest, highest) pitch with a row in the viewport."""
+        row_h = GRID_HEIGHT * self.zoom_y
+        top_pitch = 127 - int(self.scroll_y // row_h)
+        bot_pitch = 127 - int((self.scroll_y + self.height) // row_h)
+        return max(0, min(127, bot_pitch)), max(0, min(127, top_pitch))
+
     def _draw_background_grid(self):
         """Draw alternating row backgrounds."""
+        # White-key rows are already covered by the full background fill in draw(),
+        # so only visible black-key rows need a rectangle (they are never adjacent,
+        # so each run of same-colored rows is a single rectangle)
         row_h = GRID_HEIGHT * self.zoom_y
+        row_fill = self.theme.row_fill_rgba
+        bot_pitch, top_pitch = self._get_visible_pitch_range()
 
-        for pitch in range(128):
-            x, y = self.get_coords(0, pitch)
-
-            if -row_h <= y <= self.height:
-                is_black_key = (pitch % 12) in [1, 3, 6, 8, 10]
-                bg = self.theme.bg_color_black_key if is_black_key else self.theme.bg_color
-
+        for pitch in range(bot_pitch, top_pitch + 1):
+            fill = row_fill[pitch]
+            if fill is not None:
+                y = (127 - pitch) * row_h - self.scroll_y
                 dpg.draw_rectangle(
                     (0, y), (self.width, y + row_h),
-                    fill=tuple(bg + [255]),
-                    color=tuple(bg + [255]),  # Match border to fill (invisible border)
-                    parent=self.drawlist_id
+                    fill=fill,
+                    color=fill,  # Match border to fill (invisible border)
+                    parent=self._grid_layer
                 )
 
     def _get_measure_spacing(self, time_signature: Tuple[int, int]) -> int:
@@ -530,15 +816,74 @@ class PianoRoll:
     def _draw_grid_lines(self):
         """Draw vertical grid lines with per-measure time-signature-aware progressive simplification."""
         grid_spacing, triplet_spacing = self._get_grid_spacing()
+        (triplet_ticks, triplet_zoom, grid_ticks, grid_zoom,
+         measure_ticks, measure_zoom) = self._get_grid_ticks(grid_spacing, triplet_spacing)
+
+        # Triplet lines (very faint), then grid lines (muted), then measure lines (brighter)
+        self._draw_vertical_lines(triplet_ticks, triplet_zoom, self.theme.triplet_line_rgba,
+                                  self.theme.grid_line_thickness)
+        self._draw_vertical_lines(grid_ticks, grid_zoom, self.theme.grid_line_rgba,
+                                  self.theme.grid_line_thickness)
+        self._draw_vertical_lines(measure_ticks, measure_zoom, self.theme.measure_line_rgba, 2)
+
+    def _draw_vertical_lines(self, ticks: np.ndarray, min_zoom: np.ndarray,
+                             color: Tuple[int, int, int, int], thickness: int):
+        """
+        Draw full-height lines at the visible ticks.
+
+        Args:
+            ticks: Line positions in ticks (sorted)
+            min_zoom: Per-line zoom_x below which the line is hidden
+            color: RGBA line color
+            thickness: Line thickness in pixels
+        """
+        # Ticks are sorted: slice to the visible tick range before transforming
+        lo = np.searchsorted(ticks, self.scroll_x, side='left')
+        hi = np.searchsorted(ticks, self.scroll_x + self.width / self.zoom_x, side='right')
+
+        xs = _compute_grid_xs(ticks[lo:hi], min_zoom[lo:hi], float(self.scroll_x),
+                              float(self.zoom_x), float(self.width))
+        for x in xs.tolist():
+            dpg.draw_line(
+                (x, 0), (x, self.height),
+                color=color,
+                thickness=thickness,
+                parent=self._grid_layer
+            )
+
+    def _get_grid_ticks(self, grid_spacing: int, triplet_spacing: int) -> Tuple[np.ndarray, ...]:
+        """
+        Get cached grid line ticks for the current song layout.
 
+        The ticks only depend on the spacing (itself a discrete zoom level) and
+        the song's measures, so scrolling and zooming within a level reuse them.
+
+        Returns:
+            (triplet_ticks, triplet_min_zoom, grid_ticks, grid_min_zoom,
+             measure_ticks, measure_min_zoom); measure lines are always shown
+        """
         # Use per-measure metadata if available, otherwise fall back to global
         if self.song and self.song.measure_metadata:
-            self._draw_grid_lines_per_measure(grid_spacing, triplet_spacing)
+            source = self.song.measure_metadata
         else:
-            self._draw_grid_lines_global(grid_spacing, triplet_spacing)
+            source = (self.song.time_signature if self.song else (4, 4), self.song_length_ticks)
+
+        if source != self._grid_cache_source:
+            self._grid_cache = {}
+            self._grid_cache_source = source
+
+        key = (grid_spacing, triplet_spacing)
+        entry = self._grid_cache.get(key)
+        if entry is None:
+            if self.song and self.song.measure_metadata:
+                entry = self._build_grid_ticks_per_measure(grid_spacing, triplet_spacing)
+            else:
+                entry = self._build_grid_ticks_global(grid_spacing, triplet_spacing)
+            self._grid_cache[key] = entry
+        return entry
 
-    def _draw_grid_lines_global(self, grid_spacing: int, triplet_spacing: int):
-        """Draw grid lines using global time signature (legacy/fallback mode)."""
+    def _build_grid_ticks_global(self, grid_spacing: int, triplet_spacing: int) -> Tuple[np.ndarray, ...]:
+        """Build grid line ticks using global time signature (legacy/fallback mode)."""
         time_signature = self.song.time_signature if self.song else (4, 4)
         measure_spacing = self._get_measure_spacing(time_signature)
 
@@ -549,63 +894,32 @@ class PianoRoll:
         SHOW_TRIPLETS_THRESHOLD = 0.25 * denominator_scale
         SHOW_GRID_THRESHOLD = 0.15 * denominator_scale
 
-        # Triplet lines (very faint)
-        if self.zoom_x >= SHOW_TRIPLETS_THRESHOLD:
-            for t in range(0, self.song_length_ticks, triplet_spacing):
-                if t % grid_spacing == 0 or t % measure_spacing == 0:
-                    continue
-                x, _ = self.get_coords(t, 0)
-                if 0 <= x <= self.width:
-                    dpg.draw_line(
-                        (x, 0), (x, self.height),
-                        color=tuple(self.theme.triplet_line_color + [255]),
-                        thickness=self.theme.grid_line_thickness,
-                        parent=self.drawlist_id
-                    )
-
-        # Grid lines (muted)
-        if self.zoom_x >= SHOW_GRID_THRESHOLD:
-            for t in range(0, self.song_length_ticks, grid_spacing):
-                if t % measure_spacing == 0:
-                    continue
-                x, _ = self.get_coords(t, 0)
-                if 0 <= x <= self.width:
-                    dpg.draw_line(
-                        (x, 0), (x, self.height),
-                        color=tuple(self.theme.grid_line_color + [255]),
-                        thickness=self.theme.grid_line_thickness,
-                        parent=self.drawlist_id
-                    )
-
-        # Measure lines (brighter)
-        for bar in range(0, self.song_length_ticks // measure_spacing + 1):
-            t = bar * measure_spacing
-            x, _ = self.get_coords(t, 0)
-            if 0 <= x <= self.width:
-                dpg.draw_line(
-                    (x, 0), (x, self.height),
-                    color=tuple(self.theme.measure_line_color + [255]),
-                    thickness=2,
-                    parent=self.drawlist_id
-                )
+        triplet_ticks = np.arange(0, self.song_length_ticks, triplet_spacing, dtype=np.int64)
+        triplet_ticks = triplet_ticks[(triplet_ticks % grid_spacing != 0) &
+                                      (triplet_ticks % measure_spacing != 0)]
+
+        grid_ticks = np.arange(0, self.song_length_ticks, grid_spacing, dtype=np.int64)
+        grid_ticks = grid_ticks[grid_ticks % measure_spacing != 0]
 
-    def _draw_grid_lines_per_measure(self, grid_spacing: int, triplet_spacing: int):
-        """Draw grid lines with per-measure time signature awareness."""
+        measure_ticks = np.arange(0, self.song_length_ticks // measure_spacing + 1,
+                                  dtype=np.int64) * measure_spacing
+
+        return (triplet_ticks, np.full(len(triplet_ticks), SHOW_TRIPLETS_THRESHOLD),
+                grid_ticks, np.full(len(grid_ticks), SHOW_GRID_THRESHOLD),
+                measure_ticks, np.zeros(len(measure_ticks)))
+
+    def _build_grid_ticks_per_measure(self, grid_spacing: int, triplet_spacing: int) -> Tuple[np.ndarray, ...]:
+        """Build grid line ticks with per-measure time signature awareness."""
+        triplet_parts, triplet_zoom_parts = [], []
+        grid_parts, grid_zoom_parts = [], []
+        measure_ticks = []
 
-        # Draw measure lines and grid/triplet lines for each measure
         for measure in self.song.measure_metadata:
             measure_start = measure.start_tick
             measure_end = measure.start_tick + measure.length_ticks
 
-            # Draw measure line at start
-            x, _ = self.get_coords(measure_start, 0)
-            if 0 <= x <= self.width:
-                dpg.draw_line(
-                    (x, 0), (x, self.height),
-                    color=tuple(self.theme.measure_line_color + [255]),
-                    thickness=2,
-                    parent=self.drawlist_id
-                )
+            # Measure line at start
+            measure_ticks.append(measure_start)
 
             # Calculate thresholds for this measure's denominator
             denominator = measure.time_signature[1]
@@ -614,51 +928,47 @@ class PianoRoll:
             SHOW_TRIPLETS_THRESHOLD = 0.25 * denominator_scale
             SHOW_GRID_THRESHOLD = 0.15 * denominator_scale
 
-            # Draw triplet lines within this measure
-            if self.zoom_x >= SHOW_TRIPLETS_THRESHOLD:
-                t = measure_start
-                while t < measure_end:
-                    if t % grid_spacing != 0 and t != measure_start:
-                        x, _ = self.get_coords(t, 0)
-                        if 0 <= x <= self.width:
-                            dpg.draw_line(
-                                (x, 0), (x, self.height),
-                                color=tuple(self.theme.triplet_line_color + [255]),
-                                thickness=self.theme.grid_line_thickness,
-                                parent=self.drawlist_id
-                            )
-                    t += triplet_spacing
-
-            # Draw grid lines within this measure
-            if self.zoom_x >= SHOW_GRID_THRESHOLD:
-                t = measure_start
-                while t < measure_end:
-                    if t != measure_start:  # Don't overlap measure line
-                        x, _ = self.get_coords(t, 0)
-                        if 0 <= x <= self.width:
-                            dpg.draw_line(
-                                (x, 0), (x, self.height),
-                                color=tuple(self.theme.grid_line_color + [255]),
-                                thickness=self.theme.grid_line_thickness,
-                                parent=self.drawlist_id
-                            )
-                    t += grid_spacing
+            # Triplet lines within this measure (skipping grid lines and the measure line)
+            ticks = np.arange(measure_start + triplet_spacing, measure_end, triplet_spacing, dtype=np.int64)
+            ticks = ticks[ticks % grid_spacing != 0]
+            triplet_parts.append(ticks)
+            triplet_zoom_parts.append(np.full(len(ticks), SHOW_TRIPLETS_THRESHOLD))
+
+            # Grid lines within this measure (don't overlap measure line)
+            ticks = np.arange(measure_start + grid_spacing, measure_end, grid_spacing, dtype=np.int64)
+            grid_parts.append(ticks)
+            grid_zoom_parts.append(np.full(len(ticks), SHOW_GRID_THRESHOLD))
+
+        return (np.concatenate(triplet_parts), np.concatenate(triplet_zoom_parts),
+                np.concatenate(grid_parts), np.concatenate(grid_zoom_parts),
+                np.array(measure_ticks, dtype=np.int64), np.zeros(len(measure_ticks)))
 
     def _draw_row_dividers(self):
         """Draw horizontal row dividers (drawn AFTER vertical lines to appear on top)."""
         row_h = GRID_HEIGHT * self.zoom_y
+        bot_pitch, top_pitch = self._get_visible_pitch_range()
+
+        # One polyline zig-zagging between points just left and right of the canvas:
+        # the connecting segments fall outside the drawlist's clip rect, so only
+        # the divider at the top of each row is visible
+        left, right = -2, self.width + 2
+        points = []
+        for i, pitch in enumerate(range(top_pitch, bot_pitch - 1, -1)):
+            y = (127 - pitch) * row_h - self.scroll_y
+            if i % 2 == 0:
+                points.append((left, y))
+                points.append((right, y))
+            else:
+                points.append((right, y))
+                points.append((left, y))
 
-        for pitch in range(128):
-            x, y = self.get_coords(0, pitch)
-
-            if -row_h <= y <= self.height:
-                # Draw horizontal line at the top of each row
-                dpg.draw_line(
-                    (0, y), (self.width, y),
-                    color=tuple(self.theme.row_divider_color + [255]),
-                    thickness=1,
-                    parent=self.drawlist_id
-                )
+        if points:
+            dpg.draw_polyline(
+                points,
+                color=self.theme.row_divider_rgba,
+                thickness=1,
+                parent=self._grid_layer
+            )
 
     def _draw_notes(self):
         """Draw all notes (single track or arrangement view)."""
@@ -680,7 +990,16 @@ class PianoRoll:
                 # Fallback to octave colors if no track color set
                 self._draw_track_notes(self.notes, use_octave_colors=True)
 
-    def _draw_track_notes(self, notes: List[Note],
+    def _get_note_array(self, notes: Sequence[Note]) -> NoteArray:
+        """Get the SoA snapshot of a note sequence, rebuilding it after edits."""
+        entry = self._note_arrays.get(id(notes))
+        if entry is not None and entry[0] is notes and entry[1] == self._edit_epoch:
+            return entry[2]
+        array = NoteArray(notes)
+        self._note_arrays[id(notes)] = (notes, self._edit_epoch, array)
+        return array
+
+    def _draw_track_notes(self, notes: Sequence[Note],
                           color: Tuple[int, int, int, int] = None,
                           use_octave_colors: bool = False,
                           alpha: int = 255):
@@ -694,133 +1013,85 @@ class PianoRoll:
             alpha: Transparency (0-255)
         """
         row_h = GRID_HEIGHT * self.zoom_y
+        array = self._get_note_array(notes)
+        if not len(array):
+            return
 
-        notes_drawn = 0
-        for note in notes:
-            if note.start * TPQN >= self.song_length_ticks:
-                continue
-
-            nx, ny = self.get_coords(note.start * TPQN, note.note)
-            nw = note.duration * TPQN * self.zoom_x
-
-            # Viewport culling
-            if nx + nw < 0 or nx > self.width:
-                continue
-            if ny + row_h < 0 or ny > self.height:
-                continue
-
-            # Calculate visible portion of note
-            visible_x = max(0, nx)
-            if nx < 0:
-                # Note extends past left edge - adjust width to show only visible portion
-                visible_width = min(nw + nx, self.width)  # nw + nx because nx is negative
-            else:
-                visible_width = min(nw, self.width - visible_x)
-
-            # Determine color
-            if use_octave_colors:
-                octave = min(note.note // 12, len(self.theme.note_colors) - 1)
-                note_color = self.theme.note_colors[octave]
-                if note.selected:
-                    note_color = [min(c + self.theme.selected_note_brightness, 255)
-                                for c in note_color]
-            else:
-                # Use channel color with octave-based lightness
-                # Octave 0 (lowest) = almost black, Octave 10 (highest) = almost white
-                import colorsys
-                octave = min(note.note // 12, 10)
-
-                # Convert channel color to HSV
-                r, g, b = color[0] / 255.0, color[1] / 255.0, color[2] / 255.0
-                h, s, v = colorsys.rgb_to_hsv(r, g, b)
-
-                # Map octave to value (brightness): 0 -> 0.15, 10 -> 0.95
-                v = 0.15 + (octave / 10.0) * 0.80
-
-                # Keep saturation but slightly reduce for very dark/light notes
-                if v < 0.3:
-                    s = s * 0.7  # Desaturate dark notes
-                elif v > 0.85:
-                    s = s * 0.6  # Desaturate bright notes
-
-                # Convert back to RGB
-                r, g, b = colorsys.hsv_to_rgb(h, s, v)
-                note_color = [int(r * 255), int(g * 255), int(b * 255)]
-
-                if note.selected:
-                    note_color = [min(c + 50, 255) for c in note_color]
+        # Viewport culling and visible portion of every note in one compiled pass
+        visible, visible_x, visible_width, ny = _compute_note_rects(
+            array.start, array.duration, array.pitch, float(self.song_length_ticks),
+            float(self.scroll_x), float(self.scroll_y), float(self.zoom_x), float(row_h),
+            float(self.width), float(self.height)
+        )
+        if not len(visible):
+            return
 
-            # Apply alpha
-            note_color_with_alpha = tuple(note_color + [alpha])
+        # Determine colors: palette entry per (octave, selected)
+        if use_octave_colors:
+            palette = self.theme.note_palette
+            max_octave = len(self.theme.note_colors) - 1
+        else:
+            # Use channel color with octave-based lightness
+            palette = _channel_note_palette(tuple(color[:3]), alpha)
+            max_octave = CHANNEL_OCTAVES - 1
+        octaves = np.minimum(array.pitch[visible] // 12, max_octave)
+        color_keys = octaves * 2 + array.selected[visible]
+
+        # Velocity indicator heights (left = initial, right = release)
+        vel_heights = row_h * (array.velocity[visible] / 127.0)
+        rel_vel_heights = row_h * (array.release_velocity[visible] / 127.0)
+
+        vel_bar_width = 4  # Pixels wide
+        draw_outline = not use_octave_colors
+        parent = self._notes_layer
+
+        for x, w, y, vel_h, rel_h, key in zip(visible_x.tolist(), visible_width.tolist(),
+                                              ny.tolist(), vel_heights.tolist(),
+                                              rel_vel_heights.tolist(), color_keys.tolist()):
+            fill, outline, vel_color = palette[key]
+            bottom = y + row_h - 2  # Bottom of note
 
             # Draw note rectangle
             dpg.draw_rectangle(
-                (visible_x, ny + 1),
-                (visible_x + visible_width - 1, ny + row_h - 2),
-                fill=note_color_with_alpha,
-                color=note_color_with_alpha,
+                (x, y + 1),
+                (x + w - 1, bottom),
+                fill=fill,
+                color=fill,
                 thickness=1,
-                parent=self.drawlist_id
+                parent=parent
             )
 
             # Draw outline for clarity (especially in arrangement view)
-            if not use_octave_colors:
-                outline_color = tuple([min(c + 40, 255) for c in note_color] + [255])
+            if draw_outline:
                 dpg.draw_rectangle(
-                    (visible_x, ny + 1),
-                    (visible_x + visible_width - 1, ny + row_h - 2),
-                    color=outline_color,
+                    (x, y + 1),
+                    (x + w - 1, bottom),
+                    color=outline,
                     thickness=1,
-                    parent=self.drawlist_id
+                    parent=parent
                 )
 
-            # Initial velocity indicator (vertical bar on LEFT side)
-            vel_bar_width = 4  # Pixels wide
-            vel_ratio = note.velocity / 127.0  # 0.0 to 1.0
-            vel_bar_height = row_h * vel_ratio  # Height based on velocity
-
-            # Position on LEFT side of note
-            vel_x_left = visible_x + 1
-            vel_y_bottom = ny + row_h - 2  # Bottom of note
-            vel_y_top = vel_y_bottom - vel_bar_height  # Top of velocity bar
-
-            # Color: brighter version of note color
-            vel_color = tuple([min(c + 60, 255) for c in note_color] + [220])
-
             # Draw left (initial) velocity bar
-            if vel_bar_width > 0 and vel_bar_height > 1:
+            if vel_h > 1:
                 dpg.draw_rectangle(
-                    (vel_x_left, vel_y_top),
-                    (vel_x_left + vel_bar_width, vel_y_bottom),
+                    (x + 1, bottom - vel_h),
+                    (x + 1 + vel_bar_width, bottom),
                     fill=vel_color,
                     color=vel_color,
-                    parent=self.drawlist_id
+                    parent=parent
                 )
 
-            # Release velocity indicator (vertical bar on RIGHT side)
-            rel_vel_ratio = note.release_velocity / 127.0
-            rel_vel_bar_height = row_h * rel_vel_ratio
-
-            # Position on RIGHT side of note
-            rel_vel_x_right = visible_x + visible_width - vel_bar_width - 1
-            rel_vel_y_bottom = ny + row_h - 2
-            rel_vel_y_top = rel_vel_y_bottom - rel_vel_bar_height
-
-            # Use same color scheme for consistency
-            rel_vel_color = tuple([min(c + 60, 255) for c in note_color] + [220])
-
             # Draw right (release) velocity bar
-            if vel_bar_width > 0 and rel_vel_bar_height > 1:
+            if rel_h > 1:
+                rel_x = x + w - vel_bar_width - 1
                 dpg.draw_rectangle(
-                    (rel_vel_x_right, rel_vel_y_top),
-                    (rel_vel_x_right + vel_bar_width, rel_vel_y_bottom),
-                    fill=rel_vel_color,
-                    color=rel_vel_color,
-                    parent=self.drawlist_id
+                    (rel_x, bottom - rel_h),
+                    (rel_x + vel_bar_width, bottom),
+                    fill=vel_color,
+                    color=vel_color,
+                    parent=parent
                 )
 
-            notes_drawn += 1
-
     def _draw_bar_selection_highlight(self):
         """Draw semi-transparent highlight over selected bars."""
         if self.selected_bar_start is None:
@@ -848,7 +1119,7 @@ class PianoRoll:
                     fill=(100, 150, 255, 50),  # Light blue, semi-transparent
                     color=(100, 150, 255, 150),  # Border
                     thickness=2,
-                    parent=self.drawlist_id
+                    parent=self._overlay_layer
                 )
 
     def _draw_ghost_note(self):
@@ -867,45 +1138,25 @@ class PianoRoll:
                 fill=(100, 100, 100, 100),
                 color=(150, 150, 150, 150),
                 thickness=1,
-                parent=self.drawlist_id
+                parent=self._overlay_layer
             )
 
-    def _draw_playhead(self):
-        """Draw playback position on main canvas."""
-        if self.current_tick > 0:
-            px, _ = self.get_coords(self.current_tick, 0)
-            if 0 <= px <= self.width:
-                # Store playhead item tag for efficient updates
-                playhead_tag = f"playhead_line_{id(self)}"
-                dpg.draw_line(
-                    (px, 0), (px, self.height),
-                    color=tuple(self.theme.playhead_color + [255]),
-                    thickness=2,
-                    parent=self.drawlist_id,
-                    tag=playhead_tag
-                )
-
-    def _draw_playhead_only(self):
-        """Redraw just the playhead (optimized for playback)."""
-        if not self.drawlist_id:
+    def _update_playhead(self):
+        """Move the persistent playhead line (no items created or deleted)."""
+        if self._playhead_item is None:
             return
 
-        # Delete previous playhead if it exists
-        playhead_tag = f"playhead_line_{id(self)}"
-        if dpg.does_item_exist(playhead_tag):
-            dpg.delete_item(playhead_tag)
-
-        # Draw new playhead
-        if self.current_tick > 0:
-            px, _ = self.get_coords(self.current_tick, 0)
-            if 0 <= px <= self.width:
-                dpg.draw_line(
-                    (px, 0), (px, self.height),
-                    color=tuple(self.theme.playhead_color + [255]),
-                    thickness=2,
-                    parent=self.drawlist_id,
-                    tag=playhead_tag
-                )
+        px, _ = self.get_coords(self.current_tick, 0)
+        visible = self.current_tick > 0 and 0 <= px <= self.width
+        if visible:
+            dpg.configure_item(
+                self._playhead_item,
+                p1=(px, 0), p2=(px, self.height),
+                color=self.theme.playhead_rgba,
+                show=True
+            )
+        else:
+            dpg.configure_item(self._playhead_item, show=False)
 
     def _draw_loop_markers(self):
         """Draw loop start/end markers with draggable dots at top."""
@@ -921,7 +1172,7 @@ class PianoRoll:
                     (px, 0), (px, self.height),
                     color=(80, 255, 80, 255),  # Green
                     thickness=2,
-                    parent=self.drawlist_id
+                    parent=self._markers_layer
                 )
                 # Draggable dot
                 dpg.draw_circle(
@@ -929,14 +1180,14 @@ class PianoRoll:
                     fill=(80, 255, 80, 255),
                     color=(60, 200, 60, 255),  # Darker border
                     thickness=1,
-                    parent=self.drawlist_id
+                    parent=self._markers_layer
                 )
                 # Label
                 dpg.draw_text(
                     (px - 15, DOT_Y + 12), "START",
                     color=(255, 255, 255, 255),
                     size=10,
-                    parent=self.drawlist_id
+                    parent=self._markers_layer
                 )
 
         # Loop End (blue)
@@ -948,7 +1199,7 @@ class PianoRoll:
                     (px, 0), (px, self.height),
                     color=(80, 180, 255, 255),  # Blue
                     thickness=2,
-                    parent=self.drawlist_id
+                    parent=self._markers_layer
                 )
                 # Draggable dot
                 dpg.draw_circle(
@@ -956,14 +1207,14 @@ class PianoRoll:
                     fill=(80, 180, 255, 255),
                     color=(60, 140, 200, 255),  # Darker border
                     thickness=1,
-                    parent=self.drawlist_id
+                    parent=self._markers_layer
                 )
                 # Label
                 dpg.draw_text(
                     (px - 10, DOT_Y + 12), "END",
                     color=(255, 255, 255, 255),
                     size=10,
-                    parent=self.drawlist_id
+                    parent=self._markers_layer
                 )
 
     def _check_loop_marker_hit(self, mouse_x: float, mouse_y: float) -> Optional[str]:
@@ -992,6 +1243,48 @@ class PianoRoll:
 
         return None
 
+    def _get_pitch_index(self) -> list:
+        """
+        Get the per-pitch note index, rebuilding it after edits.
+
+        Returns:
+            128 bins of (start_ticks, end_ticks, note_indices, max_length_ticks),
+            sorted by start tick
+        """
+        cached = self._pitch_index
+        if cached is not None and cached[0] is self.notes and cached[1] == self._edit_epoch:
+            return cached[2]
+
+        entries = [[] for _ in range(128)]
+        for i, note in enumerate(self.notes):
+            note_start_tick = note.start * TPQN
+            entries[note.note].append((note_start_tick, note_start_tick + (note.duration * TPQN), i))
+
+        bins = []
+        for pitch_entries in entries:
+            pitch_entries.sort()
+            starts = [e[0] for e in pitch_entries]
+            ends = [e[1] for e in pitch_entries]
+            max_length = max((end - start for start, end in zip(starts, ends)), default=0.0)
+            bins.append((starts, ends, [e[2] for e in pitch_entries], max_length))
+
+        self._pitch_index = (self.notes, self._edit_epoch, bins)
+        return bins
+
+    def _get_note_indices_at(self, pitch: int, tick: float) -> List[int]:
+        """
+        Find the notes covering a pitch/tick position.
+
+        Returns:
+            Indices into self.notes, in list order
+        """
+        starts, ends, indices, max_length = self._get_pitch_index()[pitch]
+
+        # Only notes starting within max_length before tick can still cover it
+        lo = bisect_left(starts, tick - max_length)
+        hi = bisect_right(starts, tick)
+        return sorted(indices[j] for j in range(lo, hi) if tick <= ends[j])
+
     def _handle_canvas_click(self, sender, app_data):
         """Route left-click to appropriate handler based on current tool."""
         # Get mouse position
@@ -1037,19 +1330,14 @@ class PianoRoll:
         snapped_tick = self.snap_to_grid(tick) if self.snap_enabled else tick
 
         # Check if a note already exists at this position (Blooper4-style toggle)
-        for i, note in enumerate(self.notes):
-            note_start_tick = note.start * TPQN
-            note_end_tick = note_start_tick + (note.duration * TPQN)
+        if self._get_note_indices_at(pitch, tick):
+            # Note exists - START ERASE DRAG (allows dragging to delete multiple notes)
+            self.is_erasing_drag = True
+            self.erased_notes = set()
 
-            if (note.note == pitch and
-                note_start_tick <= tick <= note_end_tick):
-                # Note exists - START ERASE DRAG (allows dragging to delete multiple notes)
-                self.is_erasing_drag = True
-                self.erased_notes = set()
-
-                # Delete the clicked note
-                self._erase_note_at_position(mouse_x, mouse_y)
-                return
+            # Delete the clicked note
+            self._erase_note_at_position(mouse_x, mouse_y)
+            return
 
         # No note at this position - START DRAWING DRAG
         # Start drawing drag
@@ -1072,6 +1360,7 @@ class PianoRoll:
 
         self.draw_drag_notes.append(new_note)
         self.notes.append(new_note)
+        self._edit_epoch += 1
         self.draw()
 
     def _handle_erase_click(self, sender, app_data):
@@ -1114,16 +1403,13 @@ class PianoRoll:
         tick = self.get_tick_at(mouse_x)
 
         # Check if we clicked on a note
-        for i, note in enumerate(self.notes):
-            note_start_tick = note.start * TPQN
-            note_end_tick = note_start_tick + (note.duration * TPQN)
-
-            if (note.note == pitch and
-                note_start_tick <= tick <= note_end_tick):
-                # Replace note with toggled selection (Note is immutable)
-                self.notes[i] = replace(note, selected=not note.selected)
-                self.draw()
-                return
+        for i in self._get_note_indices_at(pitch, tick):
+            # Replace note with toggled selection (Note is immutable)
+            note = self.notes[i]
+            self.notes[i] = replace(note, selected=not note.selected)
+            self._edit_epoch += 1
+            self.draw()
+            return
 
     def _handle_mouse_move(self, sender, app_data):
         """Handle mouse move - update drawing or erasing drag if active."""
@@ -1153,7 +1439,7 @@ class PianoRoll:
                 snapped_tick = max(snapped_tick, self.loop_start_tick + self.grid_snap)
                 self.loop_end_tick = int(snapped_tick)
 
-            self.draw()
+            self._request_redraw()
             return
 
         if self.is_drawing_drag:
@@ -1186,7 +1472,7 @@ class PianoRoll:
                 # REPEAT NOTE MODE: Create multiple notes
                 self._update_repeat_note_drag(int(snapped_tick), current_pitch)
 
-            self.draw()
+            self._request_redraw()
 
         elif self.is_erasing_drag:
             # Check if left mouse button is still held
@@ -1202,7 +1488,7 @@ class PianoRoll:
 
             # Erase note at current position
             self._erase_note_at_position(mouse_x, mouse_y)
-            self.draw()
+            self._request_redraw()
 
     def _update_held_note_drag(self, current_tick: int, current_pitch: int):
         """Update held note during drag (single note stretches)."""
@@ -1244,6 +1530,7 @@ class PianoRoll:
                 if note is first_note:
                     self.notes[i] = updated_note
                     break
+            self._edit_epoch += 1
 
     def _update_repeat_note_drag(self, current_tick: int, current_pitch: int):
         """Update repeat notes during drag (multiple notes created)."""
@@ -1287,6 +1574,8 @@ class PianoRoll:
                 self.draw_drag_notes.append(new_note)
                 self.notes.append(new_note)
 
+        self._edit_epoch += 1
+
     def _finish_drawing_drag(self):
         """Finalize drawing drag operation."""
         self.is_drawing_drag = False
@@ -1318,25 +1607,22 @@ class PianoRoll:
         tick = self.get_tick_at(mouse_x)
 
         # Find note at this position
-        for i, note in enumerate(self.notes):
-            note_start_tick = note.start * TPQN
-            note_end_tick = note_start_tick + (note.duration * TPQN)
-
-            if (note.note == pitch and
-                note_start_tick <= tick <= note_end_tick):
-                # Create unique identifier for this note
-                note_id = (note.note, note.start)
+        for i in self._get_note_indices_at(pitch, tick):
+            note = self.notes[i]
+            # Create unique identifier for this note
+            note_id = (note.note, note.start)
 
-                # Skip if already erased in this drag
-                if note_id in self.erased_notes:
-                    continue
+            # Skip if already erased in this drag
+            if note_id in self.erased_notes:
+                continue
 
-                # Mark as erased (using pitch and start time as identifier)
-                self.erased_notes.add(note_id)
-                # Remove from list
-                self.notes.pop(i)
-                # Only delete one per position, then break
-                break
+            # Mark as erased (using pitch and start time as identifier)
+            self.erased_notes.add(note_id)
+            # Remove from list
+            self.notes.pop(i)
+            self._edit_epoch += 1
+            # Only delete one per position, then break
+            break
 
     def _finish_erasing_drag(self):
         """Finalize erasing drag operation."""
@@ -1370,22 +1656,21 @@ class PianoRoll:
         pitch = self.get_pitch_at(mouse_y)
         tick = self.get_tick_at(mouse_x)
 
-        for i, note in enumerate(self.notes):
-            note_start_tick = note.start * TPQN
-            note_end_tick = note_start_tick + (note.duration * TPQN)
+        for i in self._get_note_indices_at(pitch, tick):
+            note = self.notes[i]
 
-            if (note.note == pitch and note_start_tick <= tick <= note_end_tick):
-                # Take snapshot before modifying (for undo)
-                if self.on_notes_changed:
-                    self.on_notes_changed()
+            # Take snapshot before modifying (for undo)
+            if self.on_notes_changed:
+                self.on_notes_changed()
 
-                self.is_dragging = True
-                self.drag_start_pos = (tick, pitch)
-                # Store index instead of note object (Note is immutable)
-                self.ghost_note = {"index": i, "orig_start": note.start, "orig_pitch": note.note}
-                # Select the note being dragged
-                self.notes[i] = replace(note, selected=True)
-                break
+            self.is_dragging = True
+            self.drag_start_pos = (tick, pitch)
+            # Store index instead of note object (Note is immutable)
+            self.ghost_note = {"index": i, "orig_start": note.start, "orig_pitch": note.note}
+            # Select the note being dragged
+            self.notes[i] = replace(note, selected=True)
+            self._edit_epoch += 1
+            break
 
     def _handle_drag(self, sender, app_data):
         """Called while dragging."""
@@ -1407,16 +1692,25 @@ class PianoRoll:
         note_index = self.ghost_note["index"]
         old_note = self.notes[note_index]
         self.notes[note_index] = replace(old_note, note=new_pitch, start=snapped_tick / TPQN)
+        self._edit_epoch += 1
 
         # Redraw
-        self.draw()
+        self._request_redraw()
 
     def _handle_drag_end(self, sender, app_data):
         """Called when drag ends."""
         if self.is_dragging:
+            ghost = self.ghost_note
             self.is_dragging = False
             self.drag_start_pos = None
             self.ghost_note = None
+
+            # Notify only if the note actually moved (saves to song and takes undo snapshot)
+            note = self.notes[ghost["index"]] if ghost is not None else None
+            if note is not None and (note.start, note.note) != (ghost["orig_start"], ghost["orig_pitch"]):
+                if self.on_notes_changed:
+                    self.on_notes_changed()
+
             self.draw()
 
     def zoom_in(self, mouse_x: Optional[float] = None):
@@ -1430,7 +1724,7 @@ class PianoRoll:
             self.scroll_x = tick_under_mouse - (mouse_x / self.zoom_x)
             self.scroll_x = max(0, self.scroll_x)
 
-        self.draw()
+        self._request_redraw()
 
     def zoom_out(self, mouse_x: Optional[float] = None):
         """Zoom out horizontally (optionally mouse-centered)."""
@@ -1443,7 +1737,7 @@ class PianoRoll:
             self.scroll_x = tick_under_mouse - (mouse_x / self.zoom_x)
             self.scroll_x = max(0, self.scroll_x)
 
-        self.draw()
+        self._request_redraw()
 
     def zoom_in_vertical(self, mouse_y: Optional[float] = None):
         """Zoom in vertically (taller notes)."""
@@ -1461,7 +1755,7 @@ class PianoRoll:
             max_scroll = max(0, (128 * GRID_HEIGHT * self.zoom_y) - self.height)
             self.scroll_y = max(0, min(self.scroll_y, max_scroll))
 
-        self.draw()
+        self._request_redraw()
 
     def zoom_out_vertical(self, mouse_y: Optional[float] = None):
         """Zoom out vertically (shorter notes)."""
@@ -1479,7 +1773,7 @@ class PianoRoll:
             max_scroll = max(0, (128 * GRID_HEIGHT * self.zoom_y) - self.height)
             self.scroll_y = max(0, min(self.scroll_y, max_scroll))
 
-        self.draw()
+        self._request_redraw()
 
     def _check_modifier(self, required: str, shift: bool, ctrl: bool, alt: bool) -> bool:
         """Check if the required modifier matches current key states."""
@@ -1562,7 +1856,7 @@ class PianoRoll:
                                  shift_held, ctrl_held, alt_held):
             self.scroll_x -= scroll_delta * 50
             self.scroll_x = max(0, self.scroll_x)
-            self.draw()
+            self._request_redraw()
 
         elif self._check_modifier(settings["vertical_scroll_modifier"],
                                  shift_held, ctrl_held, alt_held):
@@ -1572,7 +1866,7 @@ class PianoRoll:
             # Max scroll should stop when note 0 is at the bottom of the viewport
             max_scroll = max(0, (128 * GRID_HEIGHT * self.zoom_y) - self.height)
             self.scroll_y = max(0, min(self.scroll_y, max_scroll))
-            self.draw()
+            self._request_redraw()
 
     def _create_color_sidebar_inline(self):
         """Create inline color customization sidebar."""
@@ -1650,16 +1944,21 @@ class PianoRoll:
         # Convert to integers in 0-255 range
         rgb_color = [int(c * 255) for c in color[:3]]
         setattr(self.theme, attr, rgb_color)
+        self.theme.update_rgba()
 
         # Update debug display
         if hasattr(self, 'debug_text') and dpg.does_item_exist(self.debug_text):
             dpg.set_value(self.debug_text, f"Last update: {attr} = {rgb_color}")
 
-        self.draw()
+        self._dirty["grid"] = True
+        self._dirty["notes"] = True
+        self._request_redraw()
 
     def _reset_theme(self):
         """Reset to default Blooper4-inspired theme."""
         self.theme = PianoRollTheme()
+        self._dirty["grid"] = True
+        self._dirty["notes"] = True
         self.draw()
 
     # Toolbar methods removed - use external NoteDrawToolbar widget instead
@@ -1692,7 +1991,7 @@ class PianoRoll:
 
         # Item resize handler for auto-resize
         with dpg.item_handler_registry() as resize_handler:
-            dpg.add_item_resize_handler(callback=lambda: self.draw())
+            dpg.add_item_resize_handler(callback=lambda: self._request_redraw())
         if hasattr(self, '_canvas_container'):
             dpg.bind_item_handler_registry(self._canvas_container, resize_handler)
 
@@ -1743,7 +2042,7 @@ class PianoRoll:
 
             # Item resize handler for auto-resize
             with dpg.item_handler_registry() as resize_handler:
-                dpg.add_item_resize_handler(callback=lambda: self.draw())
+                dpg.add_item_resize_handler(callback=lambda: self._request_redraw())
             if hasattr(self, '_canvas_container'):
                 dpg.bind_item_handler_registry(self._canvas_container, resize_handler)
 